@@ -79,24 +79,12 @@ def seed_sample_data(session: Session) -> Dict[str, List[Dict[str, Any]]]:
 def fetch_recent_posts(session: Session, limit: int = 5) -> List[Dict[str, Any]]:
     """
     Retrieve a feed of published posts with author and category metadata.
-    """
 
-    sql = """
-    SELECT
-        p.id,
-        p.title,
-        p.published,
-        a.name AS author_name,
-        c.name AS category_name
-    FROM "post" AS p
-    JOIN "author" AS a ON p.author_id = a.id
-    JOIN "category" AS c ON p.category_id = c.id
-    WHERE p.published = 1
-    ORDER BY p.id DESC
-    LIMIT ?
+    Authors and categories are loaded through ``select_related`` so the feed
+    costs one JOINed query regardless of how many posts it contains.
     """
-    rows = session.execute(sql, (limit,)).fetchall()
-    return [dict(row) for row in rows]
+
+    return queryset_feed(session, limit)
 
 
 def queryset_feed(session: Session, limit: int = 5) -> List[Dict[str, Any]]:
@@ -161,9 +149,19 @@ def performance_demo(session: Session, threshold: int = 2) -> Dict[str, Any]:
         _ = post.author
     optimized_stats = session.query_stats()
 
+    session.performance.reset()
+    # Batched primary-key loading: one IN query for every referenced author
+    posts = list(session.query(Post).order_by("id"))
+    author_ids = [getattr(post.author, "pk", post.author) for post in posts]
+    authors = session.get_many(Author, author_ids)
+    for author_id in author_ids:
+        _ = authors.get(author_id)
+    batched_stats = session.query_stats()
+
     return {
         "n_plus_one": n_plus_one_stats,
         "optimized": optimized_stats,
+        "batched": batched_stats,
         "threshold": threshold,
     }
 
@@ -201,6 +199,10 @@ def _initial_operations(dialect: Dialect | None = None) -> List[MigrationOperati
                 description=f"create {model.__name__.lower()} table",
             )
         )
+        operations.extend(
+            MigrationOperation(sql=stmt, description=f"index {model.__name__.lower()} columns")
+            for stmt in builder.create_index_sql(model)
+        )
     return operations
 
 
@@ -35,6 +35,7 @@ def _ensure_schema(session: Session) -> None:
     ops: List[MigrationOperation] = []
     for model in (Writer, Genre, Book):
         ops.append(MigrationOperation(sql=builder.create_table_sql(model)))
+        ops += [MigrationOperation(sql=stmt) for stmt in builder.create_index_sql(model)]
     ops += [MigrationOperation(sql=stmt) for stmt in builder.create_many_to_many_sql(Book)]
     engine.apply(APP_LABEL, MIGRATION_NAME, ops)
 
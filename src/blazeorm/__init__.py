@@ -17,7 +17,7 @@ from .core.fields import (  # noqa: F401
 from .core.model import Model, ModelConfigurationError  # noqa: F401
 from .core.relations import ForeignKey, ManyToManyField, OneToOneField  # noqa: F401
 from .hooks import hooks  # noqa: F401
-from .persistence import Session  # noqa: F401
+from .persistence import Session, enable_thread_local_sessions  # noqa: F401
 from .query import Q, QuerySet  # noqa: F401
 from .schema import MigrationEngine, MigrationOperation, SchemaBuilder  # noqa: F401
 from .utils import configure_logging, get_logger  # noqa: F401
@@ -39,6 +39,7 @@ __all__ = [
     "NoOpCache",
     "ModelConfigurationError",
     "Session",
+    "enable_thread_local_sessions",
     "QuerySet",
     "Q",
     "SchemaBuilder",
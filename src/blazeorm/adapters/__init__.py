@@ -13,8 +13,10 @@ from .base import (
     SSLConfig,
 )
 from .mysql import MySQLAdapter
+from .pool import AdapterPool, PooledAdapter
 from .postgres import PostgresAdapter
 from .sqlite import SQLiteAdapter
+from .statement_cache import StatementCache
 
 __all__ = [
     "ConnectionConfig",
@@ -28,4 +30,7 @@ __all__ = [
     "SQLiteAdapter",
     "PostgresAdapter",
     "MySQLAdapter",
+    "StatementCache",
+    "AdapterPool",
+    "PooledAdapter",
 ]
@@ -5,12 +5,26 @@ Adapter protocol definitions for BlazeORM.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Any, Protocol, Sequence
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Literal, Mapping, Protocol, Sequence
 
 from ..dialects.base import Dialect
 from ..security.dsns import DSNConfig, parse_dsn
 
+# "%%" is an escaped percent sign; matching it as a token keeps "%%s" from counting.
+_FORMAT_TOKEN_RE = re.compile(r"%[%s]")
+
+
+def count_format_placeholders(sql: str) -> int:
+    """
+    Count DB-API ``format`` placeholders (``%s``) in ``sql``, ignoring ``%%`` escapes.
+    """
+
+    if "%%" not in sql:
+        return sql.count("%s")
+    return _FORMAT_TOKEN_RE.findall(sql).count("%s")
+
 
 class AdapterError(RuntimeError):
     """Base error for adapter-related failures."""
@@ -163,6 +177,9 @@ class ConnectionConfig:
     ssl: SSLConfig | None = None
     dsn: DSNConfig | None = None
     source: str | None = None
+    _driver_options: dict[str, dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dsn(cls, dsn: str, **kwargs: Any) -> "ConnectionConfig":
@@ -212,6 +229,28 @@ class ConnectionConfig:
             raise AdapterConfigurationError(f"Environment variable {env_var} is not set")
         return cls.from_dsn(value, source=env_var, **kwargs)
 
+    def driver_options(self, driver: Literal["mysql", "postgres"]) -> Mapping[str, Any]:
+        """
+        Return driver ``connect`` keyword options: SSL settings, then user options (which
+        win), then ``connect_timeout`` from ``timeout`` unless already set.
+
+        The merged mapping is built on first use and cached per driver, so reconnects
+        reuse it; treat the config as read-only once it has been handed to an adapter.
+        """
+
+        cached = self._driver_options.get(driver)
+        if cached is None:
+            ssl_options: dict[str, Any] = {}
+            if self.ssl:
+                ssl_options = (
+                    self.ssl.mysql_options() if driver == "mysql" else self.ssl.postgres_options()
+                )
+            cached = {**ssl_options, **(self.options or {})}
+            if self.timeout and "connect_timeout" not in cached:
+                cached["connect_timeout"] = int(self.timeout)
+            self._driver_options[driver] = cached
+        return cached
+
     def redacted_dsn(self) -> str:
         """
         Return a DSN safe for logging (credentials removed).
@@ -239,12 +278,15 @@ class Cursor(Protocol):
 
     def execute(self, sql: str, params: Sequence[Any] | None = None) -> Any: ...
 
-    def executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> Any: ...
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> Any: ...
 
     def fetchone(self) -> Any: ...
 
     def fetchall(self) -> Sequence[Any]: ...
 
+    @property
+    def description(self) -> Any: ...
+
     @property
     def lastrowid(self) -> int | None: ...
 
@@ -272,7 +314,7 @@ class DatabaseAdapter(Protocol):
         Execute a single SQL statement returning a cursor-like object.
         """
 
-    def executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> Cursor:
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> Cursor:
         """
         Execute a prepared statement against multiple parameter sets.
         """
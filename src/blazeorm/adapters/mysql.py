@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import importlib
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from types import ModuleType
 from typing import Any, Iterable, Sequence, cast
 
@@ -20,10 +21,14 @@ from .base import (
     ConnectionConfig,
     Cursor,
     DatabaseAdapter,
+    count_format_placeholders,
 )
+from .statement_cache import DEFAULT_STATEMENT_CACHE_SIZE, StatementCache
 
 
+@lru_cache(maxsize=1)
 def _load_driver() -> ModuleType | None:
+    # Resolved once per process (including a miss); reconnects skip the import machinery.
     for module_name in ("pymysql", "MySQLdb"):
         try:
             return importlib.import_module(module_name)
@@ -34,6 +39,8 @@ def _load_driver() -> ModuleType | None:
 
 @dataclass
 class MySQLConnectionState:
+    __slots__ = ("connection", "config", "driver")
+
     connection: Any
     config: ConnectionConfig
     driver: ModuleType
@@ -44,11 +51,17 @@ class MySQLAdapter(DatabaseAdapter):
     Adapter wrapping a MySQL DB-API driver (PyMySQL or mysqlclient).
     """
 
-    def __init__(self, slow_query_ms: int | None = None) -> None:
+    def __init__(
+        self,
+        slow_query_ms: int | None = None,
+        *,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ) -> None:
         self.dialect = MySQLDialect()
         self._state: MySQLConnectionState | None = None
         self.logger = get_logger("adapters.mysql")
         self.slow_query_ms = resolve_slow_query_ms(default=100, override=slow_query_ms)
+        self._statements = StatementCache(statement_cache_size)
 
     def connect(self, config: ConnectionConfig) -> Any:
         driver = _load_driver()
@@ -57,12 +70,7 @@ class MySQLAdapter(DatabaseAdapter):
                 "PyMySQL or mysqlclient is required to use MySQLAdapter."
             )
 
-        options = dict(config.options or {})
-        if config.ssl:
-            for key, value in config.ssl.mysql_options().items():
-                options.setdefault(key, value)
-        if config.timeout and "connect_timeout" not in options:
-            options["connect_timeout"] = int(config.timeout)
+        options = config.driver_options("mysql")
 
         self.logger.info(
             "Connecting to MySQL %s (autocommit=%s)",
@@ -106,12 +114,13 @@ class MySQLAdapter(DatabaseAdapter):
                 self._state = None
 
     def _ensure_connection(self):
-        if not self._state:
+        state = self._state
+        if state is None:
             raise AdapterConnectionError("MySQLAdapter is not connected.")
-        conn = self._state.connection
+        conn = state.connection
         if getattr(conn, "closed", False):
             self.logger.warning("MySQL connection closed; reconnecting.")
-            conn = self.connect(self._state.config)
+            conn = self.connect(state.config)
         return conn
 
     def execute(self, sql: str, params: Sequence[Any] | None = None) -> Cursor:
@@ -123,7 +132,7 @@ class MySQLAdapter(DatabaseAdapter):
             "mysql.execute",
             self.logger,
             sql=sql,
-            params=self._redact(params),
+            params=partial(self._redact, params),
             threshold_ms=self.slow_query_ms,
         ):
             cursor.execute(sql, params)
@@ -136,9 +145,7 @@ class MySQLAdapter(DatabaseAdapter):
     ) -> Cursor:
         connection = self._ensure_connection()
         cursor = cast(Cursor, connection.cursor())
-        seq = list(seq_of_params)
-        for params in seq:
-            self._validate_params(sql, params)
+        rows = self._validated_rows(sql, seq_of_params)
         with time_call(
             "mysql.executemany",
             self.logger,
@@ -146,7 +153,7 @@ class MySQLAdapter(DatabaseAdapter):
             params="bulk",
             threshold_ms=self.slow_query_ms,
         ):
-            cursor.executemany(sql, seq)
+            cursor.executemany(sql, rows)
         return cursor
 
     def begin(self) -> None:
@@ -174,21 +181,29 @@ class MySQLAdapter(DatabaseAdapter):
 
     @staticmethod
     def _count_placeholders(sql: str) -> int:
-        count = 0
-        idx = 0
-        while idx < len(sql) - 1:
-            if sql[idx] == "%" and sql[idx + 1] == "s":
-                count += 1
-                idx += 2
-                continue
-            if sql[idx] == "%" and sql[idx + 1] == "%":
-                idx += 2
-                continue
-            idx += 1
-        return count
+        return count_format_placeholders(sql)
 
     def _validate_params(self, sql: str, params: Sequence[Any]) -> None:
-        placeholder_count = self._count_placeholders(sql)
+        placeholder_count = self._statements.placeholder_count(sql, self._count_placeholders)
+        self._check_params(placeholder_count, params)
+
+    def _validated_rows(
+        self, sql: str, seq_of_params: Iterable[Sequence[Any]]
+    ) -> Sequence[Sequence[Any]]:
+        # Check every row before the driver writes any, so a bad row cannot leave part of
+        # the batch applied; lists and tuples are checked in place rather than copied.
+        if isinstance(seq_of_params, (list, tuple)):
+            rows: Sequence[Sequence[Any]] = seq_of_params
+        else:
+            rows = list(seq_of_params)
+        placeholder_count = self._statements.placeholder_count(sql, self._count_placeholders)
+        check = self._check_params
+        for params in rows:
+            check(placeholder_count, params)
+        return rows
+
+    @staticmethod
+    def _check_params(placeholder_count: int, params: Sequence[Any]) -> None:
         if placeholder_count == 0:
             if params:
                 raise AdapterExecutionError(
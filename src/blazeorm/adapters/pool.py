@@ -0,0 +1,239 @@
+"""
+Connection pooling for database adapters.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Sequence
+
+from ..utils import get_logger
+from .base import AdapterConnectionError, ConnectionConfig, Cursor, DatabaseAdapter
+
+
+@dataclass
+class _PoolEntry:
+    adapter: DatabaseAdapter
+    queries: int = 0
+    released_at: float = 0.0
+
+
+class AdapterPool:
+    """
+    Thread-safe pool of connected adapters built by ``factory``.
+
+    ``acquire()`` returns a :class:`PooledAdapter` that can be handed to a ``Session``;
+    closing it (for example when the session closes) returns the connection to the pool.
+    Connections are opened lazily up to ``max_size`` (``min_size`` are opened up front),
+    recycled after ``max_queries`` statements, and discarded when they sat idle longer
+    than ``max_inactive_lifetime`` seconds. ``timeout`` bounds how long ``acquire`` waits
+    when every connection is checked out.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], DatabaseAdapter],
+        config: ConnectionConfig,
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        max_queries: int | None = None,
+        max_inactive_lifetime: float | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1.")
+        if not 0 <= min_size <= max_size:
+            raise ValueError("min_size must be between 0 and max_size.")
+        if max_queries is not None and max_queries < 1:
+            raise ValueError("max_queries must be >= 1 or None.")
+        self.factory = factory
+        self.config = config
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_queries = max_queries
+        self.max_inactive_lifetime = max_inactive_lifetime
+        self.timeout = timeout
+        self.logger = get_logger("adapters.pool")
+        # An unconnected adapter supplies the dialect and is reused for the first connection.
+        self._spare: DatabaseAdapter | None = factory()
+        self.dialect = self._spare.dialect
+        self.slow_query_ms = self._spare.slow_query_ms
+        self._idle: list[_PoolEntry] = []
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        for _ in range(min_size):
+            self._size += 1
+            self._checkin(self._open_entry())
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, idle or checked out."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def acquire(self) -> "PooledAdapter":
+        pooled = PooledAdapter(self)
+        pooled.connect(self.config)
+        return pooled
+
+    def close(self) -> None:
+        """
+        Close idle connections and refuse new checkouts. Checked-out connections are
+        closed when they are returned.
+        """
+
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for entry in idle:
+            self._close_entry(entry)
+
+    def __enter__(self) -> "AdapterPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------ #
+    # Checkout / checkin
+    # ------------------------------------------------------------------ #
+    def _checkout(self) -> _PoolEntry:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        stale: list[_PoolEntry] = []
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise AdapterConnectionError("AdapterPool is closed.")
+                    while self._idle:
+                        entry = self._idle.pop()
+                        if self._expired(entry):
+                            self._size -= 1
+                            stale.append(entry)
+                            continue
+                        return entry
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise AdapterConnectionError(
+                            f"Timed out waiting for a pooled connection (max_size={self.max_size})."
+                        )
+                    self._condition.wait(remaining)
+        finally:
+            for entry in stale:
+                self._close_entry(entry)
+        try:
+            return self._open_entry()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def _checkin(self, entry: _PoolEntry) -> None:
+        recycle = self.max_queries is not None and entry.queries >= self.max_queries
+        if not recycle:
+            try:
+                # Never hand the next borrower a connection with an open transaction.
+                entry.adapter.rollback()
+            except Exception as exc:
+                self.logger.warning("Discarding pooled connection after failed reset: %s", exc)
+                recycle = True
+        with self._condition:
+            discard = recycle or self._closed
+            if discard:
+                self._size -= 1
+            else:
+                entry.released_at = time.monotonic()
+                self._idle.append(entry)
+            self._condition.notify()
+        if discard:
+            self._close_entry(entry)
+
+    def _open_entry(self) -> _PoolEntry:
+        with self._condition:
+            adapter, self._spare = self._spare, None
+        if adapter is None:
+            adapter = self.factory()
+        adapter.connect(self.config)
+        return _PoolEntry(adapter)
+
+    def _expired(self, entry: _PoolEntry) -> bool:
+        lifetime = self.max_inactive_lifetime
+        return lifetime is not None and time.monotonic() - entry.released_at > lifetime
+
+    def _close_entry(self, entry: _PoolEntry) -> None:
+        try:
+            entry.adapter.close()
+        except Exception as exc:
+            self.logger.warning("Failed to close pooled connection: %s", exc)
+
+
+class PooledAdapter(DatabaseAdapter):
+    """
+    Adapter facade over a connection borrowed from an :class:`AdapterPool`.
+
+    ``connect`` checks a connection out (the supplied config is ignored; the pool's
+    config applies) and ``close`` returns it, so a ``Session`` built on a pooled adapter
+    borrows a connection for its lifetime and can be reopened afterwards.
+    """
+
+    def __init__(self, pool: AdapterPool) -> None:
+        self.pool = pool
+        self.dialect = pool.dialect
+        self.slow_query_ms = pool.slow_query_ms
+        self._entry: _PoolEntry | None = None
+
+    @property
+    def _state(self) -> _PoolEntry | None:
+        # Session._ensure_adapter_connected reconnects when this is falsy.
+        return self._entry
+
+    def connect(self, config: ConnectionConfig | None = None) -> Any:
+        if self._entry is None:
+            self._entry = self.pool._checkout()
+        return self._entry.adapter
+
+    def close(self) -> None:
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self.pool._checkin(entry)
+
+    def _require(self) -> _PoolEntry:
+        entry = self._entry
+        if entry is None:
+            raise AdapterConnectionError("PooledAdapter has no connection checked out.")
+        return entry
+
+    def execute(self, sql: str, params: Sequence[Any] | None = None) -> Cursor:
+        entry = self._require()
+        entry.queries += 1
+        return entry.adapter.execute(sql, params)
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> Cursor:
+        entry = self._require()
+        entry.queries += 1
+        return entry.adapter.executemany(sql, seq_of_params)
+
+    def begin(self) -> None:
+        self._require().adapter.begin()
+
+    def commit(self) -> None:
+        self._require().adapter.commit()
+
+    def rollback(self) -> None:
+        self._require().adapter.rollback()
+
+    def last_insert_id(self, cursor: Cursor, table: str, pk_column: str) -> Any:
+        return self._require().adapter.last_insert_id(cursor, table, pk_column)
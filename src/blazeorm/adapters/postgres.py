@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import importlib
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from types import ModuleType
 from typing import Any, Iterable, Sequence, cast
 
@@ -20,10 +21,17 @@ from .base import (
     ConnectionConfig,
     Cursor,
     DatabaseAdapter,
+    count_format_placeholders,
 )
+from .statement_cache import DEFAULT_STATEMENT_CACHE_SIZE, StatementCache
 
+# psycopg prepares a statement server-side after this many executions of the same SQL.
+DEFAULT_PREPARE_THRESHOLD = 5
 
+
+@lru_cache(maxsize=1)
 def _load_driver() -> ModuleType | None:
+    # Resolved once per process (including a miss); reconnects skip the import machinery.
     try:
         return importlib.import_module("psycopg")
     except ImportError:
@@ -32,6 +40,8 @@ def _load_driver() -> ModuleType | None:
 
 @dataclass
 class PostgresConnectionState:
+    __slots__ = ("connection", "config", "driver")
+
     connection: Any
     config: ConnectionConfig
     driver: ModuleType
@@ -42,23 +52,28 @@ class PostgresAdapter(DatabaseAdapter):
     Adapter wrapping the psycopg PostgreSQL driver.
     """
 
-    def __init__(self, slow_query_ms: int | None = None) -> None:
+    def __init__(
+        self,
+        slow_query_ms: int | None = None,
+        *,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        prepare_threshold: int | None = DEFAULT_PREPARE_THRESHOLD,
+    ) -> None:
+        if prepare_threshold is not None and prepare_threshold < 0:
+            raise AdapterConfigurationError("prepare_threshold must be >= 0 or None.")
         self.dialect = PostgresDialect()
         self._state: PostgresConnectionState | None = None
         self.logger = get_logger("adapters.postgres")
         self.slow_query_ms = resolve_slow_query_ms(default=100, override=slow_query_ms)
+        self._statements = StatementCache(statement_cache_size)
+        self.prepare_threshold = prepare_threshold
 
     def connect(self, config: ConnectionConfig) -> Any:
         driver = _load_driver()
         if driver is None:
             raise AdapterConfigurationError("psycopg is required to use PostgresAdapter.")
 
-        options = dict(config.options or {})
-        if config.ssl:
-            for key, value in config.ssl.postgres_options().items():
-                options.setdefault(key, value)
-        if config.timeout and "connect_timeout" not in options:
-            options["connect_timeout"] = int(config.timeout)
+        options = config.driver_options("postgres")
 
         self.logger.info(
             "Connecting to PostgreSQL %s (autocommit=%s)",
@@ -71,6 +86,10 @@ class PostgresAdapter(DatabaseAdapter):
         except Exception as exc:
             raise AdapterConnectionError("Failed to connect to PostgreSQL.") from exc
         connection.autocommit = bool(config.autocommit)
+        if hasattr(connection, "prepare_threshold"):
+            # ORM statements are cached, byte-identical SQL, so psycopg's automatic
+            # server-side prepare kicks in for repeated ones; None disables it.
+            connection.prepare_threshold = self.prepare_threshold
         if config.isolation_level:
             setattr(connection, "isolation_level", config.isolation_level)
 
@@ -85,12 +104,13 @@ class PostgresAdapter(DatabaseAdapter):
                 self._state = None
 
     def _ensure_connection(self):
-        if not self._state:
+        state = self._state
+        if state is None:
             raise AdapterConnectionError("PostgresAdapter is not connected.")
-        conn = self._state.connection
+        conn = state.connection
         if getattr(conn, "closed", False):
             self.logger.warning("PostgreSQL connection closed; reconnecting.")
-            conn = self.connect(self._state.config)
+            conn = self.connect(state.config)
         return conn
 
     def execute(self, sql: str, params: Sequence[Any] | None = None) -> Cursor:
@@ -102,7 +122,7 @@ class PostgresAdapter(DatabaseAdapter):
             "postgres.execute",
             self.logger,
             sql=sql,
-            params=self._redact(params),
+            params=partial(self._redact, params),
             threshold_ms=self.slow_query_ms,
         ):
             cursor.execute(sql, params)
@@ -115,9 +135,7 @@ class PostgresAdapter(DatabaseAdapter):
     ) -> Cursor:
         connection = self._ensure_connection()
         cursor = cast(Cursor, connection.cursor())
-        seq = list(seq_of_params)
-        for params in seq:
-            self._validate_params(sql, params)
+        rows = self._validated_rows(sql, seq_of_params)
         with time_call(
             "postgres.executemany",
             self.logger,
@@ -125,7 +143,7 @@ class PostgresAdapter(DatabaseAdapter):
             params="bulk",
             threshold_ms=self.slow_query_ms,
         ):
-            cursor.executemany(sql, seq)
+            cursor.executemany(sql, rows)
         return cursor
 
     def begin(self) -> None:
@@ -155,21 +173,29 @@ class PostgresAdapter(DatabaseAdapter):
 
     @staticmethod
     def _count_placeholders(sql: str) -> int:
-        count = 0
-        idx = 0
-        while idx < len(sql) - 1:
-            if sql[idx] == "%" and sql[idx + 1] == "s":
-                count += 1
-                idx += 2
-                continue
-            if sql[idx] == "%" and sql[idx + 1] == "%":
-                idx += 2
-                continue
-            idx += 1
-        return count
+        return count_format_placeholders(sql)
 
     def _validate_params(self, sql: str, params: Sequence[Any]) -> None:
-        placeholder_count = self._count_placeholders(sql)
+        placeholder_count = self._statements.placeholder_count(sql, self._count_placeholders)
+        self._check_params(placeholder_count, params)
+
+    def _validated_rows(
+        self, sql: str, seq_of_params: Iterable[Sequence[Any]]
+    ) -> Sequence[Sequence[Any]]:
+        # Check every row before the driver writes any, so a bad row cannot leave part of
+        # the batch applied; lists and tuples are checked in place rather than copied.
+        if isinstance(seq_of_params, (list, tuple)):
+            rows: Sequence[Sequence[Any]] = seq_of_params
+        else:
+            rows = list(seq_of_params)
+        placeholder_count = self._statements.placeholder_count(sql, self._count_placeholders)
+        check = self._check_params
+        for params in rows:
+            check(placeholder_count, params)
+        return rows
+
+    @staticmethod
+    def _check_params(placeholder_count: int, params: Sequence[Any]) -> None:
         if placeholder_count == 0:
             if params:
                 raise AdapterExecutionError(
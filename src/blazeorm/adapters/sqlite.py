@@ -4,27 +4,96 @@ SQLite database adapter implementation.
 
 from __future__ import annotations
 
+import os
+import queue
 import sqlite3
-from dataclasses import dataclass
-from typing import Any, Iterable, Sequence, cast
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Iterable, Mapping, Sequence, cast
+from urllib.request import pathname2url
 
 from ..dialects.sqlite import SQLiteDialect
 from ..security.redaction import redact_params
 from ..utils import get_logger, time_call
 from ..utils.performance import resolve_slow_query_ms
 from .base import (
+    AdapterConfigurationError,
     AdapterConnectionError,
     AdapterExecutionError,
     ConnectionConfig,
     Cursor,
     DatabaseAdapter,
 )
+from .statement_cache import DEFAULT_STATEMENT_CACHE_SIZE, StatementCache
+
+# Applied to file-backed databases only; in-memory databases keep SQLite defaults.
+DEFAULT_PRAGMAS: Mapping[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,
+    "cache_size": -65536,
+}
+
+# sqlite3 keeps this many prepared statements per connection (stdlib default is 128).
+DEFAULT_CACHED_STATEMENTS = 256
+
+# Commits between PASSIVE WAL checkpoints on file databases.
+DEFAULT_CHECKPOINT_INTERVAL = 1000
 
 
 @dataclass
 class SQLiteConnectionState:
     connection: sqlite3.Connection
     config: ConnectionConfig
+    readers: list[sqlite3.Connection] = field(default_factory=list)
+    idle_readers: "queue.SimpleQueue[sqlite3.Connection]" = field(default_factory=queue.SimpleQueue)
+    in_memory: bool = False
+    commits_since_checkpoint: int = 0
+
+
+class BufferedCursor:
+    """
+    Cursor facade over rows fetched eagerly from a pooled reader connection.
+    """
+
+    lastrowid = None
+
+    def __init__(self, description: Any, rows: list[Any]) -> None:
+        self.description = description
+        self.rowcount = -1
+        self._rows = rows
+        self._position = 0
+
+    def execute(self, sql: str, params: Sequence[Any] | None = None) -> Any:
+        raise AdapterExecutionError("Buffered reader cursors cannot execute statements.")
+
+    def executemany(self, sql: str, seq_of_params: Sequence[Sequence[Any]]) -> Any:
+        raise AdapterExecutionError("Buffered reader cursors cannot execute statements.")
+
+    def fetchone(self) -> Any:
+        if self._position >= len(self._rows):
+            return None
+        row = self._rows[self._position]
+        self._position += 1
+        return row
+
+    def fetchmany(self, size: int = 1) -> list[Any]:
+        rows = self._rows[self._position : self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        rows = self._rows[self._position :]
+        self._position = len(self._rows)
+        return rows
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
 
 
 class SQLiteAdapter(DatabaseAdapter):
@@ -32,11 +101,35 @@ class SQLiteAdapter(DatabaseAdapter):
     Adapter wrapping the Python stdlib sqlite3 module.
     """
 
-    def __init__(self, slow_query_ms: int | None = None) -> None:
+    def __init__(
+        self,
+        slow_query_ms: int | None = None,
+        *,
+        pragmas: Mapping[str, Any] | None = None,
+        read_pool_size: int = 0,
+        row_factory: Callable[[sqlite3.Cursor, tuple[Any, ...]], Any] | None = sqlite3.Row,
+        cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+        checkpoint_interval: int | None = DEFAULT_CHECKPOINT_INTERVAL,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ) -> None:
+        if read_pool_size < 0:
+            raise AdapterConfigurationError("read_pool_size must be >= 0.")
+        if cached_statements < 0:
+            raise AdapterConfigurationError("cached_statements must be >= 0.")
+        if checkpoint_interval is not None and checkpoint_interval <= 0:
+            raise AdapterConfigurationError("checkpoint_interval must be > 0 or None.")
         self.dialect = SQLiteDialect()
         self._state: SQLiteConnectionState | None = None
+        # Mirrors ``_state.connection`` so hot paths resolve the writer in one lookup.
+        self._connection: sqlite3.Connection | None = None
         self.logger = get_logger("adapters.sqlite")
         self.slow_query_ms = resolve_slow_query_ms(default=100, override=slow_query_ms)
+        self.pragmas: dict[str, Any] = dict(pragmas or {})
+        self.read_pool_size = read_pool_size
+        self.row_factory = row_factory
+        self.cached_statements = cached_statements
+        self.checkpoint_interval = checkpoint_interval
+        self._statements = StatementCache(statement_cache_size)
 
     # ------------------------------------------------------------------ #
     # Connection management
@@ -57,58 +150,150 @@ class SQLiteAdapter(DatabaseAdapter):
                 timeout=timeout,
                 detect_types=sqlite3.PARSE_DECLTYPES,
                 check_same_thread=False,
+                cached_statements=self.cached_statements,
             )
         except Exception as exc:
             raise AdapterConnectionError("Failed to connect to SQLite.") from exc
-        connection.row_factory = sqlite3.Row
+        connection.row_factory = self.row_factory
         connection.execute("PRAGMA foreign_keys = ON")
+        self._apply_pragmas(connection, in_memory=path == ":memory:")
 
         if config.isolation_level:
             # Allow explicit override values from configuration even though sqlite stubs are narrow.
             sqlite_connection = cast(Any, connection)
             sqlite_connection.isolation_level = config.isolation_level
 
-        self._state = SQLiteConnectionState(connection, config)
+        self._state = SQLiteConnectionState(connection, config, in_memory=path == ":memory:")
+        self._connection = connection
+        if self.read_pool_size and path != ":memory:":
+            self._open_readers(self._state, path, timeout)
         return connection
 
+    def _open_readers(self, state: SQLiteConnectionState, path: str, timeout: float) -> None:
+        uri = f"file:{pathname2url(os.path.abspath(path))}?mode=ro"
+        for _ in range(self.read_pool_size):
+            try:
+                reader = sqlite3.connect(
+                    uri,
+                    uri=True,
+                    timeout=timeout,
+                    detect_types=sqlite3.PARSE_DECLTYPES,
+                    check_same_thread=False,
+                    cached_statements=self.cached_statements,
+                )
+            except Exception as exc:
+                self._close_readers(state)
+                raise AdapterConnectionError("Failed to open SQLite reader connection.") from exc
+            reader.row_factory = self.row_factory
+            state.readers.append(reader)
+            state.idle_readers.put(reader)
+
+    @staticmethod
+    def _close_readers(state: SQLiteConnectionState) -> None:
+        for reader in state.readers:
+            reader.close()
+        state.readers.clear()
+
+    def _apply_pragmas(self, connection: sqlite3.Connection, *, in_memory: bool) -> None:
+        pragmas: dict[str, Any] = {} if in_memory else dict(DEFAULT_PRAGMAS)
+        pragmas.update(self.pragmas)
+        for name, value in pragmas.items():
+            if value is None:
+                continue
+            if not name.replace("_", "").isalnum():
+                raise AdapterConfigurationError(f"Invalid SQLite pragma name: {name!r}")
+            try:
+                connection.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.Error as exc:
+                raise AdapterConfigurationError(
+                    f"Failed to apply SQLite pragma {name}={value!r}."
+                ) from exc
+
     def close(self) -> None:
         if self._state:
             try:
+                self._close_readers(self._state)
+                self._run_maintenance(self._state, close=True)
                 self._state.connection.close()
             finally:
                 self._state = None
+                self._connection = None
+
+    def _run_maintenance(self, state: SQLiteConnectionState, *, close: bool) -> None:
+        """
+        Refresh planner statistics and fold the WAL back into the database file.
+
+        On close this runs ``PRAGMA optimize`` and a TRUNCATE checkpoint; periodic calls
+        use a PASSIVE checkpoint, which never waits on readers. Failures are logged only.
+        """
+
+        connection = state.connection
+        if state.in_memory or connection.in_transaction:
+            return
+        statements = (
+            ("PRAGMA optimize", "PRAGMA wal_checkpoint(TRUNCATE)")
+            if close
+            else ("PRAGMA wal_checkpoint(PASSIVE)",)
+        )
+        try:
+            for statement in statements:
+                connection.execute(statement).fetchall()
+        except sqlite3.Error as exc:
+            self.logger.warning("SQLite maintenance failed: %s", exc)
+        state.commits_since_checkpoint = 0
 
     def _ensure_connection(self) -> sqlite3.Connection:
-        if not self._state:
+        connection = self._connection
+        if connection is None:
             raise AdapterConnectionError("SQLiteAdapter is not connected.")
-        return self._state.connection
+        return connection
 
     # ------------------------------------------------------------------ #
     # Execution helpers
     # ------------------------------------------------------------------ #
     def execute(self, sql: str, params: Sequence[Any] | None = None) -> Cursor:
         connection = self._ensure_connection()
-        cursor = cast(Cursor, connection.cursor())
         params = params or ()
         self._validate_params(sql, params)
+        state = self._state
+        if state and state.readers and not connection.in_transaction and _is_select(sql):
+            return self._execute_on_reader(state, sql, params)
         with time_call(
             "sqlite.execute",
             self.logger,
             sql=sql,
-            params=self._redact(params),
+            params=partial(self._redact, params),
             threshold_ms=self.slow_query_ms,
         ):
-            cursor.execute(sql, params)
-        return cursor
+            # Connection.execute creates the cursor in C, saving a Python-level call.
+            cursor = connection.execute(sql, params)
+        return cast(Cursor, cursor)
+
+    def _execute_on_reader(
+        self, state: SQLiteConnectionState, sql: str, params: Sequence[Any]
+    ) -> Cursor:
+        reader = state.idle_readers.get()
+        try:
+            with time_call(
+                "sqlite.execute",
+                self.logger,
+                sql=sql,
+                params=partial(self._redact, params),
+                threshold_ms=self.slow_query_ms,
+            ):
+                cursor = reader.execute(sql, params)
+                rows = cursor.fetchall()
+        finally:
+            state.idle_readers.put(reader)
+        return cast(Cursor, BufferedCursor(cursor.description, rows))
 
     def executemany(
         self, sql: str, seq_of_params: Sequence[Sequence[Any]] | Iterable[Sequence[Any]]
     ) -> Cursor:
         connection = self._ensure_connection()
-        cursor = cast(Cursor, connection.cursor())
-        seq = list(seq_of_params)
-        for params in seq:
-            self._validate_params(sql, params)
+        rows = self._validated_rows(sql, seq_of_params)
+        # In autocommit mode each row would otherwise commit (and fsync) separately.
+        wrap = connection.isolation_level is None and not connection.in_transaction
         with time_call(
             "sqlite.executemany",
             self.logger,
@@ -116,8 +301,17 @@ class SQLiteAdapter(DatabaseAdapter):
             params="bulk",
             threshold_ms=self.slow_query_ms,
         ):
-            cursor.executemany(sql, seq)
-        return cursor
+            if not wrap:
+                cursor = connection.executemany(sql, rows)
+            else:
+                connection.execute("BEGIN")
+                try:
+                    cursor = connection.executemany(sql, rows)
+                except BaseException:
+                    connection.rollback()
+                    raise
+                connection.commit()
+        return cast(Cursor, cursor)
 
     # ------------------------------------------------------------------ #
     # Transactions
@@ -131,6 +325,11 @@ class SQLiteAdapter(DatabaseAdapter):
     def commit(self) -> None:
         connection = self._ensure_connection()
         connection.commit()
+        state = self._state
+        if state is not None and self.checkpoint_interval is not None:
+            state.commits_since_checkpoint += 1
+            if state.commits_since_checkpoint >= self.checkpoint_interval:
+                self._run_maintenance(state, close=False)
 
     def rollback(self) -> None:
         connection = self._ensure_connection()
@@ -158,7 +357,26 @@ class SQLiteAdapter(DatabaseAdapter):
         return sql.count("?")
 
     def _validate_params(self, sql: str, params: Sequence[Any]) -> None:
-        placeholder_count = self._count_placeholders(sql)
+        placeholder_count = self._statements.placeholder_count(sql, self._count_placeholders)
+        self._check_params(placeholder_count, params)
+
+    def _validated_rows(
+        self, sql: str, seq_of_params: Iterable[Sequence[Any]]
+    ) -> Sequence[Sequence[Any]]:
+        # Check every row before the driver writes any, so a bad row cannot leave part of
+        # the batch applied; lists and tuples are checked in place rather than copied.
+        if isinstance(seq_of_params, (list, tuple)):
+            rows: Sequence[Sequence[Any]] = seq_of_params
+        else:
+            rows = list(seq_of_params)
+        placeholder_count = self._statements.placeholder_count(sql, self._count_placeholders)
+        check = self._check_params
+        for params in rows:
+            check(placeholder_count, params)
+        return rows
+
+    @staticmethod
+    def _check_params(placeholder_count: int, params: Sequence[Any]) -> None:
         if not params:
             return
         if placeholder_count == 0:
@@ -169,3 +387,7 @@ class SQLiteAdapter(DatabaseAdapter):
             raise AdapterExecutionError(
                 f"Parameter count mismatch: expected {placeholder_count}, received {len(params)}."
             )
+
+
+def _is_select(sql: str) -> bool:
+    return sql.lstrip()[:6].upper() == "SELECT"
@@ -0,0 +1,56 @@
+"""
+Per-adapter LRU cache of parsed SQL metadata.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+DEFAULT_STATEMENT_CACHE_SIZE = 1024
+
+
+class StatementCache:
+    """
+    Bounded LRU mapping of SQL text to its placeholder count.
+
+    Adapters validate parameter counts on every execute; caching the count keeps the
+    placeholder scan to once per distinct statement. ``max_size=0`` disables caching.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_STATEMENT_CACHE_SIZE) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must be >= 0.")
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def placeholder_count(self, sql: str, count: Callable[[str], int]) -> int:
+        """
+        Return the placeholder count for ``sql``, computing it with ``count`` on a miss.
+        """
+
+        if not self.max_size:
+            return count(sql)
+        with self._lock:
+            cached = self._entries.get(sql)
+            if cached is not None:
+                self._entries.move_to_end(sql)
+                return cached
+        value = count(sql)
+        with self._lock:
+            self._entries[sql] = value
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, sql: object) -> bool:
+        return sql in self._entries
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-from threading import RLock
-from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol, Tuple, Type
+import time
+from collections import OrderedDict
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Protocol, Tuple, Type
 
 if TYPE_CHECKING:
     from ..core.model import Model
 
+DEFAULT_SHARDS = 16
+DEFAULT_MAX_SIZE = 10_000
+
+_CacheKey = Tuple[Type["Model"], Any]
+# (monotonic expiry or None, read-only view of the cached payload)
+_CacheEntry = Tuple[Optional[float], Mapping[str, Any]]
+
 
 class CacheBackend(Protocol):
-    def get(self, model: Type["Model"], pk: Any) -> Optional[Dict[str, Any]]: ...
+    def get(self, model: Type["Model"], pk: Any) -> Optional[Mapping[str, Any]]: ...
 
     def set(self, model: Type["Model"], pk: Any, data: Dict[str, Any]) -> None: ...
 
@@ -20,43 +30,97 @@ class CacheBackend(Protocol):
 
 
 class NoOpCache:
-    def __init__(self) -> None:
-        self._lock = RLock()
+    """
+    Cache backend that stores nothing; every lookup misses.
+    """
 
-    def get(self, model: Type["Model"], pk: Any) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            return None
+    def get(self, model: Type["Model"], pk: Any) -> Optional[Mapping[str, Any]]:
+        return None
 
     def set(self, model: Type["Model"], pk: Any, data: Dict[str, Any]) -> None:
-        with self._lock:
-            return None
+        return None
 
     def delete(self, model: Type["Model"], pk: Any) -> None:
-        with self._lock:
-            return None
+        return None
 
     def clear(self) -> None:
-        with self._lock:
-            return None
+        return None
 
 
 class InMemoryCache:
-    def __init__(self) -> None:
-        self._store: Dict[Tuple[Type["Model"], Any], Dict[str, Any]] = {}
-        self._lock = RLock()
-
-    def get(self, model: Type["Model"], pk: Any) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            return self._store.get((model, pk))
+    """
+    Process-local LRU cache striped across independently locked shards.
+
+    ``max_size`` bounds the number of entries (split evenly across shards, so the
+    effective cap rounds up to a multiple of the shard count); ``None`` disables
+    eviction. ``ttl`` expires entries that many seconds after they are set. Misses
+    are lock-free; hits on a bounded cache briefly lock their shard to refresh the
+    entry's recency.
+
+    ``set`` takes ownership of ``data`` instead of copying it, so callers must not
+    mutate the dict afterwards; ``get`` returns a read-only view of it.
+    """
+
+    def __init__(
+        self,
+        shards: int = DEFAULT_SHARDS,
+        *,
+        max_size: Optional[int] = DEFAULT_MAX_SIZE,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a positive power of two.")
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be >= 1 or None.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0 or None.")
+        self._mask = shards - 1
+        self._shard_capacity = None if max_size is None else -(-max_size // shards)
+        self._ttl = ttl
+        self._shards: List["OrderedDict[_CacheKey, _CacheEntry]"] = [
+            OrderedDict() for _ in range(shards)
+        ]
+        self._locks = [Lock() for _ in range(shards)]
+
+    def get(self, model: Type["Model"], pk: Any) -> Optional[Mapping[str, Any]]:
+        key = (model, pk)
+        index = hash(key) & self._mask
+        shard = self._shards[index]
+        entry = shard.get(key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            with self._locks[index]:
+                if shard.get(key) is entry:
+                    del shard[key]
+            return None
+        if self._shard_capacity is not None:
+            with self._locks[index]:
+                if key in shard:
+                    shard.move_to_end(key)
+        return data
 
     def set(self, model: Type["Model"], pk: Any, data: Dict[str, Any]) -> None:
-        with self._lock:
-            self._store[(model, pk)] = dict(data)
+        key = (model, pk)
+        index = hash(key) & self._mask
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+        capacity = self._shard_capacity
+        with self._locks[index]:
+            shard = self._shards[index]
+            shard[key] = (expires_at, MappingProxyType(data))
+            shard.move_to_end(key)
+            if capacity is not None:
+                while len(shard) > capacity:
+                    shard.popitem(last=False)
 
     def delete(self, model: Type["Model"], pk: Any) -> None:
-        with self._lock:
-            self._store.pop((model, pk), None)
+        key = (model, pk)
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            self._shards[index].pop(key, None)
 
     def clear(self) -> None:
-        with self._lock:
-            self._store.clear()
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
@@ -0,0 +1,28 @@
+"""
+Helpers for compiling specialized model methods at class-creation time.
+"""
+
+from __future__ import annotations
+
+import linecache
+from typing import Any, Callable, Sequence
+
+
+def compile_method(
+    owner: type, name: str, lines: Sequence[str], namespace: dict[str, Any]
+) -> Callable[..., Any]:
+    """
+    Compile ``lines`` (a single ``def name(...)`` block) and return the function.
+
+    The source is registered with :mod:`linecache` so tracebacks through generated
+    code show the rendered lines.
+    """
+
+    source = "\n".join(lines) + "\n"
+    filename = f"<blazeorm generated {owner.__module__}.{owner.__qualname__}.{name}>"
+    exec(compile(source, filename, "exec"), namespace)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    function = namespace[name]
+    function.__qualname__ = f"{owner.__qualname__}.{name}"
+    function.__module__ = owner.__module__
+    return function  # type: ignore[no-any-return]
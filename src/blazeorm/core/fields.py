@@ -4,12 +4,59 @@ Field definitions and descriptors for BlazeORM models.
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Sequence, cast
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Optional, Sequence, cast
 
 if TYPE_CHECKING:
     from .model import Model
 
+# Constructor arguments mirrored by ``clone``/``deconstruct``; spelled out once instead of
+# rebuilding the same literal dict in every method and subclass.
+_DECONSTRUCT_ATTRS = (
+    "primary_key",
+    "unique",
+    "nullable",
+    "default",
+    "db_type",
+    "db_column",
+    "db_default",
+    "index",
+    "choices",
+)
+_CLONE_ATTRS = _DECONSTRUCT_ATTRS + ("validators", "help_text")
+
+# Placeholder ``Model._initial_state`` while ``__init__`` runs: setters skip dirty tracking.
+CONSTRUCTING: dict[str, Any] = {}
+
+# Bound once for auto_now defaults, which are resolved for every new instance.
+_UTC = timezone.utc
+_now = datetime.now
+
+# Distinguishes "no stored value" from a stored ``None`` with a single lookup.
+_MISSING: Any = object()
+
+
+def _coerce_column(
+    field: "Field", convert: Callable[[Any], Any], values: Sequence[Any]
+) -> list[Any]:
+    # ``map`` over a C-level constructor handles the usual all-non-NULL column in one
+    # pass; NULLs or bad input fall back to the per-value path and its error messages.
+    try:
+        return list(map(convert, values))
+    except (TypeError, ValueError):
+        return Field.to_python_many(field, values)
+
+
+def _notify_dirty(instance: "Model") -> None:
+    # Push a clean -> dirty transition to the unit of work of the session that loaded or
+    # saved the instance, so flush only scans instances that actually changed.
+    uow_ref = instance._uow_ref
+    if uow_ref is not None:
+        uow = uow_ref()
+        if uow is not None:
+            uow.touch(instance)
+
 
 class FieldError(Exception):
     """Internal exception for field configuration issues."""
@@ -23,7 +70,30 @@ class Field:
     required for schema generation and validation.
     """
 
+    # Every model class holds one field object per column; slots keep them compact and
+    # attribute reads off the instance dict. Subclasses declare their own extras.
+    __slots__ = (
+        "primary_key",
+        "unique",
+        "nullable",
+        "default",
+        "db_type",
+        "db_column",
+        "db_default",
+        "index",
+        "choices",
+        "validators",
+        "help_text",
+        "model",
+        "name",
+        "_name",
+        "_default_factory",
+        "_has_default",
+        "creation_counter",
+    )
+
     _creation_counter = 0
+    clone_attrs: ClassVar[tuple[str, ...]] = _CLONE_ATTRS
 
     def __init__(
         self,
@@ -49,50 +119,91 @@ class Field:
         self.db_default = db_default
         self.index = index
         self.choices = tuple(choices) if choices is not None else None
-        self.validators = list(validators or [])
+        # Immutable, so fields without validators (the common case) share one empty tuple.
+        self.validators: tuple[Callable[[Any], None], ...] = tuple(validators) if validators else ()
         self.help_text = help_text
 
         self.model: type["Model"] | None = None  # Will be set during contribute_to_class
         self.name: str | None = None
+        self._name = ""
+        self._default_factory = callable(default)
+        self._has_default = default is not None
         self.creation_counter = Field._creation_counter
         Field._creation_counter += 1
 
     # Descriptor protocol -------------------------------------------------
+    # ``_name`` mirrors ``name`` as a plain ``str`` once ``bind`` runs (always before a
+    # field is reachable from an instance), so the hot paths skip ``require_name``.
     def __get__(self, instance: object | None, owner: type | None = None) -> Any:
         if instance is None:
             return self
 
-        model_instance = cast("Model", instance)
-        name = self.require_name()
-        value = model_instance._field_values.get(name)
-        if value is None and name not in model_instance._field_values:
-            default = self.get_default()
-            if default is not None or self.default is not None:
-                model_instance._field_values[name] = default
-                return default
+        values = cast("Model", instance)._field_values
+        value = values.get(self._name, _MISSING)
+        if value is not _MISSING:
+            return value
+        if not self._default_factory:
+            # Constant defaults are read-only: reading never writes into the instance.
+            return self.default
+        # Computed defaults are stored so repeated reads (and the INSERT) agree.
+        value = self.get_default()
+        if value is not None:
+            values[self._name] = value
         return value
 
     def __set__(self, instance: object, value: Any) -> None:
         model_instance = cast("Model", instance)
-        name = self.require_name()
-        if value is None:
-            if not self.nullable and not self.primary_key:
-                raise ValueError(f"Field '{name}' cannot be None")
-            model_instance._field_values[name] = None
+        name = self._name
+        if value is not None:
+            if self.choices and value not in self.choices:
+                raise ValueError(
+                    f"Value '{value}' for field '{name}' not in choices {self.choices}"
+                )
+            value = self.to_python(value)
+        elif not self.nullable and not self.primary_key:
+            raise ValueError(f"Field '{name}' cannot be None")
+        values = model_instance._field_values
+        initial = model_instance._initial_state
+        if initial is None:
+            # Clean instance: the snapshot is taken lazily, on the first assignment that
+            # actually changes a value, from the values as they were before it.
+            previous = values.get(name, _MISSING)
+            if previous is _MISSING or previous != value:
+                model_instance._initial_state = dict(values)
+                model_instance._dirty = {name}
+                _notify_dirty(model_instance)
+            values[name] = value
             return
-
-        if self.choices and value not in self.choices:
-            raise ValueError(f"Value '{value}' for field '{name}' not in choices {self.choices}")
-
-        python_value = self.to_python(value)
-        model_instance._field_values[name] = python_value
+        values[name] = value
+        if initial is CONSTRUCTING:
+            return
+        dirty = model_instance._dirty
+        if initial.get(name, _MISSING) != value:
+            if dirty:
+                dirty.add(name)
+                return
+            if dirty is None:
+                model_instance._dirty = {name}
+            else:
+                dirty.add(name)
+            _notify_dirty(model_instance)
+        elif dirty:
+            dirty.discard(name)
 
     # Metadata helpers ----------------------------------------------------
     def bind(self, model: type["Model"], name: str) -> None:
+        # Names and columns key every per-row dict and quoting cache; interning them lets
+        # those lookups match by identity.
+        name = sys.intern(name)
         self.model = model
         self.name = name
-        if self.db_column is None:
-            self.db_column = name
+        self._name = name
+        # Subclasses may compute defaults in ``get_default`` (e.g. auto_now); only a plain
+        # constant default can be returned on read without being stored.
+        self._default_factory = (
+            callable(self.default) or type(self).get_default is not Field.get_default
+        )
+        self.db_column = name if self.db_column is None else sys.intern(self.db_column)
 
     def contribute_to_class(self, model: type["Model"], name: str) -> None:
         """
@@ -125,6 +236,39 @@ class Field:
     def to_python(self, value: Any) -> Any:
         return value
 
+    def from_db_value(self, value: Any) -> Any:
+        """
+        Convert a non-NULL value loaded from the database.
+
+        Stored values were validated on the way in, so subclasses pass through values
+        the driver already returned as the target type and only coerce the rest.
+        """
+        return self.to_python(value)
+
+    def to_db_value(self, value: Any) -> Any:
+        """
+        Convert a Python value into a statement parameter.
+
+        The base implementation passes values through; persistence skips the call
+        entirely for fields that do not override it (see ``ModelOptions.db_converters``).
+        """
+        return value
+
+    def to_python_many(self, values: Sequence[Any]) -> list[Any]:
+        """
+        Coerce a column of values at once, keeping ``None`` as-is.
+
+        Bulk read paths call this once per column instead of ``to_python`` per cell.
+        """
+
+        to_python = self.to_python
+        return [None if value is None else to_python(value) for value in values]
+
+    def add_validator(self, validator: Callable[[Any], None]) -> None:
+        self.validators = (*self.validators, validator)
+        if self.model is not None:
+            self.model._meta._required_only = _MISSING
+
     def run_validators(self, value: Any) -> None:
         for validator in self.validators:
             validator(value)
@@ -132,47 +276,27 @@ class Field:
     # Utilities -----------------------------------------------------------
     def clone(self) -> "Field":
         """
-        Create a shallow copy of this field. Subclasses should override if
-        they accept additional initialization arguments.
+        Create a shallow copy of this field. Subclasses accepting extra initialization
+        arguments list them in ``clone_attrs``.
         """
-        params = {
-            "primary_key": self.primary_key,
-            "unique": self.unique,
-            "nullable": self.nullable,
-            "default": self.default,
-            "db_type": self.db_type,
-            "db_column": self.db_column,
-            "db_default": self.db_default,
-            "index": self.index,
-            "choices": self.choices,
-            "validators": list(self.validators),
-            "help_text": self.help_text,
-        }
-        cloned = self.__class__(**params)
-        return cloned
+        params = {name: getattr(self, name) for name in self.clone_attrs}
+        return self.__class__(**params)
 
     @property
     def has_default(self) -> bool:
-        return self.default is not None or callable(self.default)
+        # Fixed at construction (a callable default is never None); read per field on
+        # every instantiation that does not use the generated ``__init__``.
+        return self._has_default
 
     def deconstruct(self) -> dict[str, Any]:
         """
         Provide a serializable representation used by migrations. For now,
         returns a minimal mapping.
         """
-        name = self.require_name()
-        return {
-            "name": name,
-            "primary_key": self.primary_key,
-            "unique": self.unique,
-            "nullable": self.nullable,
-            "default": self.default,
-            "db_type": self.db_type,
-            "db_column": self.db_column,
-            "db_default": self.db_default,
-            "index": self.index,
-            "choices": self.choices,
-        }
+        deconstructed = {"name": self.require_name()}
+        for attr in _DECONSTRUCT_ATTRS:
+            deconstructed[attr] = getattr(self, attr)
+        return deconstructed
 
 
 class AutoField(Field):
@@ -180,6 +304,8 @@ class AutoField(Field):
     Auto-incrementing integer field used as default primary key.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(primary_key=True, nullable=False, db_type="INTEGER")
 
@@ -191,8 +317,16 @@ class AutoField(Field):
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Invalid value '{value}' for AutoField") from exc
 
+    def from_db_value(self, value: Any) -> int | None:
+        return value if type(value) is int else self.to_python(value)
+
+    def to_python_many(self, values: Sequence[Any]) -> list[Any]:
+        return _coerce_column(self, int, values)
+
 
 class IntegerField(Field):
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("db_type", "INTEGER")
         super().__init__(**kwargs)
@@ -205,8 +339,16 @@ class IntegerField(Field):
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Invalid integer value '{value}'") from exc
 
+    def from_db_value(self, value: Any) -> int | None:
+        return value if type(value) is int else self.to_python(value)
+
+    def to_python_many(self, values: Sequence[Any]) -> list[Any]:
+        return _coerce_column(self, int, values)
+
 
 class FloatField(Field):
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("db_type", "REAL")
         super().__init__(**kwargs)
@@ -219,30 +361,65 @@ class FloatField(Field):
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Invalid float value '{value}'") from exc
 
+    def from_db_value(self, value: Any) -> float | None:
+        return value if type(value) is float else self.to_python(value)
+
+    def to_python_many(self, values: Sequence[Any]) -> list[Any]:
+        return _coerce_column(self, float, values)
+
+
+# Common spellings resolve without allocating a lowercased copy; others fall back to .lower().
+_BOOL_STRINGS = {
+    "true": True,
+    "t": True,
+    "1": True,
+    "false": False,
+    "f": False,
+    "0": False,
+    "True": True,
+    "False": False,
+    "TRUE": True,
+    "FALSE": False,
+    "T": True,
+    "F": False,
+}
+
+_NUMERIC_TYPES = frozenset({int, float})
+
 
 class BooleanField(Field):
+    __slots__ = ()
+
     def __init__(self, *, default: Any = False, **kwargs: Any) -> None:
         kwargs.setdefault("db_type", "BOOLEAN")
         kwargs.setdefault("nullable", False)
         super().__init__(default=default, **kwargs)
 
     def to_python(self, value: Any) -> bool | None:
-        if value is None:
-            return value
-        if isinstance(value, bool):
-            return value
+        value_type = type(value)
+        if value_type is bool or value is None:
+            return cast(Optional[bool], value)
+        # Exact-type checks are single hash lookups; subclasses take the isinstance path.
+        if value_type in _NUMERIC_TYPES:
+            return bool(value)
         if isinstance(value, str):
-            lowered = value.lower()
-            if lowered in {"true", "t", "1"}:
-                return True
-            if lowered in {"false", "f", "0"}:
-                return False
-        if isinstance(value, (int, float)):
+            parsed = _BOOL_STRINGS.get(value)
+            if parsed is None:
+                parsed = _BOOL_STRINGS.get(value.lower())
+            if parsed is not None:
+                return parsed
+        elif isinstance(value, (int, float)):
             return bool(value)
         raise ValueError(f"Invalid boolean value '{value}'")
 
+    def from_db_value(self, value: Any) -> bool | None:
+        return value if type(value) is bool else self.to_python(value)
+
 
 class StringField(Field):
+    __slots__ = ("max_length",)
+    clone_attrs = _CLONE_ATTRS + ("max_length",)
+
     def __init__(self, *, max_length: int = 255, **kwargs: Any) -> None:
         kwargs.setdefault("db_type", "TEXT")
         super().__init__(**kwargs)
@@ -251,31 +428,21 @@ class StringField(Field):
     def to_python(self, value: Any) -> str | None:
         if value is None:
             return value
-        result = str(value)
+        result = value if type(value) is str else str(value)
         if self.max_length and len(result) > self.max_length:
             field_name = self.require_name()
             raise ValueError(f"Value for field '{field_name}' exceeds max_length {self.max_length}")
         return result
 
-    def clone(self) -> "StringField":
-        cloned = self.__class__(
-            max_length=self.max_length,
-            primary_key=self.primary_key,
-            unique=self.unique,
-            nullable=self.nullable,
-            default=self.default,
-            db_type=self.db_type,
-            db_column=self.db_column,
-            db_default=self.db_default,
-            index=self.index,
-            choices=self.choices,
-            validators=list(self.validators),
-            help_text=self.help_text,
-        )
-        return cloned
+    def from_db_value(self, value: Any) -> str:
+        # Stored text already passed the max_length check when it was written.
+        return value if type(value) is str else str(value)
 
 
 class DateTimeField(Field):
+    __slots__ = ("auto_now", "auto_now_add")
+    clone_attrs = _CLONE_ATTRS + ("auto_now", "auto_now_add")
+
     def __init__(
         self, *, auto_now: bool = False, auto_now_add: bool = False, **kwargs: Any
     ) -> None:
@@ -286,7 +453,7 @@ class DateTimeField(Field):
 
     def get_default(self) -> Any:
         if self.auto_now or self.auto_now_add:
-            return datetime.now(timezone.utc)
+            return _now(_UTC)
         return super().get_default()
 
     def to_python(self, value: Any) -> datetime | None:
@@ -295,21 +462,3 @@ class DateTimeField(Field):
         if isinstance(value, datetime):
             return value
         raise ValueError(f"Expected datetime for field '{self.name}', received {value!r}")
-
-    def clone(self) -> "DateTimeField":
-        cloned = self.__class__(
-            auto_now=self.auto_now,
-            auto_now_add=self.auto_now_add,
-            primary_key=self.primary_key,
-            unique=self.unique,
-            nullable=self.nullable,
-            default=self.default,
-            db_type=self.db_type,
-            db_column=self.db_column,
-            db_default=self.db_default,
-            index=self.index,
-            choices=self.choices,
-            validators=list(self.validators),
-            help_text=self.help_text,
-        )
-        return cloned
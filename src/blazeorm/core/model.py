@@ -4,13 +4,26 @@ Model base classes and metadata orchestration for BlazeORM.
 
 from __future__ import annotations
 
-from collections import OrderedDict
+import keyword
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Dict, Iterable, Optional, Type, TypeVar, cast
+from operator import attrgetter
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from ..query.queryset import QueryManager
 from ..utils import camel_to_snake
-from .fields import AutoField, Field
+from .codegen import compile_method
+from .fields import _MISSING, CONSTRUCTING, AutoField, Field
 from .relations import ManyToManyField, RelatedField, relation_registry
 
 
@@ -28,10 +41,30 @@ class ModelOptions:
     table_name: str = ""
     schema: Optional[str] = None
     abstract: bool = False
-    fields: "OrderedDict[str, Field]" = field(default_factory=OrderedDict)
+    fields: dict[str, Field] = field(default_factory=dict)
     primary_key: Optional[Field] = None
     many_to_many: list[ManyToManyField] = field(default_factory=list)
     m2m_through_tables: dict[str, str] = field(default_factory=dict)
+    sql_cache: dict[tuple[Any, ...], str] = field(default_factory=dict, repr=False, compare=False)
+    field_list: tuple[Field, ...] = field(default=(), init=False, repr=False, compare=False)
+    field_names: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    column_names: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    columns: Mapping[str, str] = field(
+        default_factory=lambda: MappingProxyType({}), init=False, repr=False, compare=False
+    )
+    column_to_field: Mapping[str, str] = field(
+        default_factory=lambda: MappingProxyType({}), init=False, repr=False, compare=False
+    )
+    _values_getter: Optional[Callable[[Any], tuple[Any, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _load_plan: Optional[tuple[tuple[str, str, Callable[[Any], Any]], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _required_only: Any = field(default=_MISSING, init=False, repr=False, compare=False)
+    _db_converters: Optional[tuple[Optional[Callable[[Any], Any]], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_field(self, field_obj: Field) -> None:
         name = field_obj.require_name()
@@ -40,6 +73,7 @@ class ModelOptions:
                 f"Duplicate field name '{name}' on model '{self.model.__name__}'"
             )
         self.fields[name] = field_obj
+        self.refresh_fields()
         if field_obj.primary_key:
             if self.primary_key and self.primary_key is not field_obj:
                 raise ModelConfigurationError(
@@ -47,6 +81,23 @@ class ModelOptions:
                 )
             self.primary_key = field_obj
 
+    def refresh_fields(self) -> None:
+        """
+        Re-freeze the field order after ``fields`` changes and drop state derived from it.
+        """
+
+        self.field_list = tuple(self.fields.values())
+        self.field_names = tuple(self.fields)
+        columns = {f.require_name(): f.column_name() for f in self.field_list}
+        self.column_names = tuple(columns.values())
+        self.columns = MappingProxyType(columns)
+        self.column_to_field = MappingProxyType({c: n for n, c in columns.items()})
+        self._values_getter = None
+        self._load_plan = None
+        self._required_only = _MISSING
+        self._db_converters = None
+        self.sql_cache.clear()
+
     @property
     def table(self) -> str:
         if self.schema:
@@ -59,13 +110,103 @@ class ModelOptions:
         except KeyError as exc:
             raise KeyError(f"Unknown field '{name}' on model '{self.model.__name__}'") from exc
 
-    def get_fields(self) -> Iterable[Field]:
-        return self.fields.values()
+    def get_fields(self) -> tuple[Field, ...]:
+        return self.field_list
+
+    @property
+    def values_getter(self) -> Callable[[Any], tuple[Any, ...]]:
+        """
+        Callable returning every field value of an instance, in field order, as a tuple.
+        """
+
+        getter = self._values_getter
+        if getter is not None:
+            return getter
+        built = _build_values_getter(self.field_names)
+        self._values_getter = built
+        return built
+
+    @property
+    def load_plan(self) -> tuple[tuple[str, str, Callable[[Any], Any]], ...]:
+        """
+        ``(field name, column name, from_db_value)`` per field, used to hydrate rows.
+        """
+
+        plan = self._load_plan
+        if plan is None:
+            plan = self._load_plan = tuple(
+                (name, self.columns[name], f.from_db_value)
+                for name, f in zip(self.field_names, self.field_list)
+            )
+        return plan
+
+    @property
+    def db_converters(self) -> tuple[Optional[Callable[[Any], Any]], ...]:
+        """
+        Bound ``to_db_value`` per field in field order, or ``None`` where the field
+        keeps the pass-through default so writers can skip the call.
+        """
+
+        converters = self._db_converters
+        if converters is None:
+            converters = self._db_converters = tuple(
+                None if type(f).to_db_value is Field.to_db_value else f.to_db_value
+                for f in self.field_list
+            )
+        return converters
+
+    @property
+    def required_only(self) -> Optional[tuple[str, ...]]:
+        """
+        Names of the non-nullable fields when a null check on them is all ``full_clean``
+        would do: no field validators and no ``clean``/``full_clean`` override. ``None``
+        when the full validation pipeline is needed.
+        """
+
+        plan = self._required_only
+        if plan is _MISSING:
+            model = self.model
+            if (
+                any(f.validators for f in self.field_list)
+                or model.clean is not Model.clean
+                or model.full_clean is not Model.full_clean
+            ):
+                plan = None
+            else:
+                plan = tuple(
+                    f._name
+                    for f in self.field_list
+                    if not f.nullable and not (f.primary_key and isinstance(f, AutoField))
+                )
+            self._required_only = plan
+        return cast(Optional[tuple[str, ...]], plan)
+
+    def cached_sql(self, key: tuple[Any, ...], build: Callable[[], str]) -> str:
+        """
+        Return the SQL template stored under ``key``, rendering it once via ``build``.
+        """
+
+        sql = self.sql_cache.get(key)
+        if sql is None:
+            sql = self.sql_cache[key] = build()
+        return sql
 
 
 TModel = TypeVar("TModel", bound="Model")
 
 
+def _build_values_getter(names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    if len(names) == 1:
+        single = attrgetter(names[0])
+        return lambda instance: (single(instance),)
+    if not names:
+        return lambda instance: ()
+    return cast(Callable[[Any], tuple[Any, ...]], attrgetter(*names))
+
+
+_creation_counter = attrgetter("creation_counter")
+
+
 class ModelMeta(type):
     """
     Metaclass responsible for collecting fields and establishing metadata.
@@ -76,12 +217,16 @@ class ModelMeta(type):
         if name == "Model" and bases == (object,):
             return super().__new__(mcls, name, bases, attrs)
 
+        # Split fields from plain attributes in one pass rather than popping from ``attrs``.
         declared_fields: Dict[str, Field] = {}
-        for attr_name, value in list(attrs.items()):
+        class_attrs: Dict[str, Any] = {}
+        for attr_name, value in attrs.items():
             if isinstance(value, Field):
-                declared_fields[attr_name] = attrs.pop(attr_name)
+                declared_fields[attr_name] = value
+            else:
+                class_attrs[attr_name] = value
 
-        cls = cast(type["Model"], super().__new__(mcls, name, bases, attrs))
+        cls = cast(type["Model"], super().__new__(mcls, name, bases, class_attrs))
 
         meta = getattr(cls, "Meta", None)
         table_name = camel_to_snake(name)
@@ -96,8 +241,16 @@ class ModelMeta(type):
         cls._meta = ModelOptions(model=cls, table_name=table_name, schema=schema, abstract=abstract)
 
         # TODO: Support inheriting fields from abstract base models.
-        sorted_fields = sorted(declared_fields.items(), key=lambda item: item[1].creation_counter)
-        for attr_name, field_obj in sorted_fields:
+        # Decorate with the (unique) creation counter so the sort compares ints in C
+        # instead of calling a key lambda per field.
+        sorted_fields = sorted(
+            zip(
+                map(_creation_counter, declared_fields.values()),
+                declared_fields,
+                declared_fields.values(),
+            )
+        )
+        for _, attr_name, field_obj in sorted_fields:
             field_obj.contribute_to_class(cls, attr_name)
             if isinstance(field_obj, ManyToManyField):
                 field_obj.model = cls
@@ -116,12 +269,21 @@ class ModelMeta(type):
             auto_field = AutoField()
             auto_field.contribute_to_class(cls, "id")
             cls._meta.add_field(auto_field)
-            cls._meta.fields = OrderedDict(
-                sorted(
-                    cls._meta.fields.items(),
-                    key=lambda item: (0 if item[0] == "id" else 1, item[1].creation_counter),
-                )
-            )
+            # Declared fields are already in creation order; only "id" has to move first.
+            fields: dict[str, Field] = {"id": auto_field}
+            fields.update(cls._meta.fields)
+            cls._meta.fields = fields
+            cls._meta.refresh_fields()
+
+        if "__init__" not in attrs and all(
+            name.isidentifier() and not keyword.iskeyword(name) for name in cls._meta.field_names
+        ):
+            setattr(cls, "__init__", _build_init(cls))
+
+        if "to_dict" not in attrs:
+            setattr(cls, "to_dict", _build_to_dict(cls))
+        if "__repr__" not in attrs:
+            setattr(cls, "__repr__", _build_repr(cls))
 
         if "objects" not in cls.__dict__:
             cls.objects = QueryManager(cls)
@@ -131,39 +293,189 @@ class ModelMeta(type):
         return cls
 
 
+def _build_init(cls: type["Model"]) -> Callable[..., None]:
+    """
+    Render a straight-line ``__init__`` for ``cls`` equivalent to :meth:`Model.__init__`.
+
+    Field order and which fields carry defaults are resolved once here instead of on
+    every instantiation. Keyword values go straight to each field's ``__set__``;
+    constant defaults are coerced once and stored without a per-instance conversion.
+    """
+
+    namespace: Dict[str, Any] = {"CONSTRUCTING": CONSTRUCTING}
+    lines = [
+        "def __init__(self, **kwargs):",
+        "    values = self._field_values = {}",
+        "    self._initial_state = CONSTRUCTING",
+        "    self._dirty = None",
+        "    self._related_cache = {}",
+        "    self._uow_ref = None",
+    ]
+    for index, field_obj in enumerate(cls._meta.get_fields()):
+        name = field_obj.require_name()
+        setter = f"_set_{index}"
+        namespace[setter] = field_obj.__set__
+        lines.append(f"    if {name!r} in kwargs:")
+        lines.append(f"        {setter}(self, kwargs[{name!r}])")
+        if not field_obj.has_default:
+            continue
+        lines.append("    else:")
+        constant = _constant_default(field_obj)
+        if constant is not _NO_CONSTANT:
+            namespace[f"_default_{index}"] = constant
+            lines.append(f"        values[{name!r}] = _default_{index}")
+            continue
+        field_ref = f"_field_{index}"
+        namespace[field_ref] = field_obj
+        lines.append(f"        value = {field_ref}.get_default()")
+        lines.append("        if value is not None:")
+        lines.append(f"            {setter}(self, value)")
+    lines.append("    self._initial_state = None")
+    return compile_method(cls, "__init__", lines, namespace)
+
+
+def _build_to_dict(cls: type["Model"]) -> Callable[..., Dict[str, Any]]:
+    """
+    Render ``to_dict`` for ``cls`` as a single dict display over ``_field_values``.
+
+    Stored values are read directly; unset fields fall back to the descriptor so defaults
+    are still materialized, and relation fields always go through their descriptor so
+    cached related instances are returned as before.
+    """
+
+    namespace: Dict[str, Any] = {}
+    entries = []
+    for index, field_obj in enumerate(cls._meta.get_fields()):
+        name = field_obj.require_name()
+        getter = f"_get_{index}"
+        namespace[getter] = field_obj.__get__
+        if isinstance(field_obj, RelatedField):
+            entries.append(f"        {name!r}: {getter}(self),")
+        else:
+            entries.append(
+                f"        {name!r}: values[{name!r}] if {name!r} in values else {getter}(self),"
+            )
+    lines = [
+        "def to_dict(self):",
+        "    values = self._field_values",
+        "    return {",
+        *entries,
+        "    }",
+    ]
+    return compile_method(cls, "to_dict", lines, namespace)
+
+
+def _build_repr(cls: type["Model"]) -> Callable[..., str]:
+    """
+    Render ``__repr__`` for ``cls``: one membership test per field, in field order.
+    """
+
+    lines = [
+        "def __repr__(self):",
+        "    values = self._field_values",
+        "    parts = []",
+    ]
+    for name in cls._meta.field_names:
+        lines.append(f"    if {name!r} in values:")
+        lines.append(f"        parts.append({name + '='!r} + repr(values[{name!r}]))")
+    lines.append(f"    return {'<' + cls.__name__ + ' '!r} + ', '.join(parts) + '>'")
+    return compile_method(cls, "__repr__", lines, {})
+
+
+_NO_CONSTANT: Any = object()
+
+
+def _constant_default(field_obj: Field) -> Any:
+    """
+    Return the already-validated value of a non-callable default, or ``_NO_CONSTANT``
+    when it has to be resolved (and validated) per instance.
+    """
+
+    default = field_obj.default
+    if field_obj._default_factory:
+        return _NO_CONSTANT
+    if field_obj.choices and default not in field_obj.choices:
+        return _NO_CONSTANT
+    try:
+        return field_obj.to_python(default)
+    except (TypeError, ValueError):
+        return _NO_CONSTANT
+
+
 class Model(metaclass=ModelMeta):
     """
     Base model providing data container functionality.
     Persistence operations are supplied by the persistence layer.
     """
 
+    # Per-instance bookkeeping lives in slots; ``__dict__`` stays available (and is
+    # only allocated on first use) for ad-hoc attributes such as memoized many-to-many
+    # managers, and ``__weakref__`` keeps instances weak-referenceable. Every
+    # construction path assigns ``_related_cache`` before any field is set, so relation
+    # descriptors read it directly instead of guarding with ``hasattr``.
+    __slots__ = (
+        "_field_values",
+        "_initial_state",
+        "_dirty",
+        "_related_cache",
+        "_uow_ref",
+        "__dict__",
+        "__weakref__",
+    )
+
     _meta: ClassVar[ModelOptions]
     objects: ClassVar[QueryManager]
 
     def __init__(self, **kwargs: Any) -> None:
         self._field_values: Dict[str, Any] = {}
-        self._initial_state: Dict[str, Any] = {}
+        # Field setters skip dirty tracking until construction finishes.
+        self._initial_state: Optional[Dict[str, Any]] = CONSTRUCTING
+        self._dirty: Optional[set[str]] = None
         self._related_cache: Dict[str, Any] = {}
+        # Weak reference to the owning session's unit of work, set once it tracks us.
+        self._uow_ref: Optional[Callable[[], Any]] = None
 
         for field_obj in self._meta.get_fields():
             field_name = field_obj.require_name()
-            if (
-                field_obj.primary_key
-                and field_obj.has_default is False
-                and field_name not in kwargs
-            ):
+            if field_obj.primary_key and not field_obj._has_default and field_name not in kwargs:
                 # Primary key may be assigned by database later.
                 continue
 
             if field_name in kwargs:
                 setattr(self, field_name, kwargs[field_name])
-            elif field_obj.has_default:
+            elif field_obj._has_default:
                 default_value = field_obj.get_default()
                 if default_value is not None:
                     setattr(self, field_name, default_value)
 
-        # Retain snapshot for simple dirty tracking
-        self._initial_state = dict(self._field_values)
+        # ``None`` marks a clean instance; the snapshot is taken on first change.
+        self._initial_state = None
+
+    @classmethod
+    def _from_db(cls: Type[TModel], data: Mapping[str, Any]) -> TModel:
+        """
+        Build an instance from a loaded row without running ``__init__``.
+
+        ``data`` may be keyed by field or column name. Values are treated as trusted:
+        each field's ``from_db_value`` only coerces driver types, skipping the
+        validation, default, choice, and nullability handling applied to user input.
+        """
+
+        instance = cls.__new__(cls)
+        values: Dict[str, Any] = {}
+        for name, column, convert in cls._meta.load_plan:
+            value = data.get(name, _MISSING)
+            if value is _MISSING:
+                value = data.get(column, _MISSING)
+                if value is _MISSING:
+                    continue
+            values[name] = value if value is None else convert(value)
+        instance._field_values = values
+        instance._initial_state = None
+        instance._dirty = None
+        instance._related_cache = {}
+        instance._uow_ref = None
+        return instance
 
     def __repr__(self) -> str:
         parts = []
@@ -176,11 +488,13 @@ class Model(metaclass=ModelMeta):
 
     @property
     def pk(self) -> Any:
-        if not self._meta.primary_key:
+        pk_field = self._meta.primary_key
+        if pk_field is None:
             raise ModelConfigurationError(
                 f"Model '{self.__class__.__name__}' does not define a primary key."
             )
-        return getattr(self, self._meta.primary_key.require_name())
+        # Fields in ``_meta`` are always bound, so ``_name`` is set.
+        return getattr(self, pk_field._name)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -189,10 +503,16 @@ class Model(metaclass=ModelMeta):
         }
 
     def is_dirty(self) -> bool:
-        return any(
-            self._field_values.get(name) != self._initial_state.get(name)
-            for name in self._field_values
-        )
+        # Field setters record assignments that differ from the last snapshot.
+        return bool(self._dirty)
+
+    def _mark_clean(self) -> None:
+        """
+        Treat current values as the persisted state and clear dirty tracking.
+        """
+
+        self._initial_state = None
+        self._dirty = None
 
     # Placeholder persistence hooks --------------------------------------
     def save(self, *args: Any, **kwargs: Any) -> None:
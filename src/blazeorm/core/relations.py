@@ -4,14 +4,30 @@ Relationship field implementations and registry utilities.
 
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
-
-from .fields import Field
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    DefaultDict,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
+
+from .fields import _MISSING, Field
 
 if TYPE_CHECKING:
     from .model import Model
 
+_get_pk = attrgetter("pk")
+
 
 class RelationshipError(RuntimeError):
     pass
@@ -22,6 +38,8 @@ class RelatedField(Field):
     Base class for relationship fields (FK, O2O).
     """
 
+    __slots__ = ("to", "related_name", "on_delete", "remote_model")
+
     relation_type = "many-to-one"
 
     def __init__(
@@ -46,17 +64,25 @@ class RelatedField(Field):
     def __get__(self, instance, owner=None):
         if instance is None:
             return self
-        cache = getattr(instance, "_related_cache", {})
-        name = self.require_name()
-        if name in cache:
-            return cache[name]
+        # ``_related_cache`` is a Model slot assigned before any field is set.
+        related = instance._related_cache.get(self._name, _MISSING)
+        if related is not _MISSING:
+            return related
         return super().__get__(instance, owner)
 
     def resolve_model(self, model: Type["Model"]) -> None:
         self.remote_model = model
 
+    def to_db_value(self, value: Any) -> Any:
+        # The descriptor may hand back the cached related instance; store its key.
+        if value is not None and hasattr(value, "pk"):
+            return value.pk
+        return value
+
 
 class ForeignKey(RelatedField):
+    __slots__ = ()
+
     relation_type = "many-to-one"
 
     def __init__(
@@ -68,21 +94,22 @@ class ForeignKey(RelatedField):
         **kwargs: Any,
     ) -> None:
         kwargs.setdefault("nullable", False)
+        # Joins and reverse lookups filter on the FK column, so index it unless told otherwise.
+        kwargs.setdefault("index", True)
         super().__init__(to, related_name=related_name, on_delete=on_delete, **kwargs)
 
     def __set__(self, instance, value):
-        name = self.require_name()
         if hasattr(value, "pk"):
-            if hasattr(instance, "_related_cache"):
-                instance._related_cache[name] = value
+            instance._related_cache[self._name] = value
             value = value.pk
         else:
-            if hasattr(instance, "_related_cache"):
-                instance._related_cache.pop(name, None)
+            instance._related_cache.pop(self._name, None)
         super().__set__(instance, value)
 
 
 class OneToOneField(ForeignKey):
+    __slots__ = ()
+
     relation_type = "one-to-one"
 
     def __init__(
@@ -92,11 +119,29 @@ class OneToOneField(ForeignKey):
         super().__init__(to, related_name=related_name, **kwargs)
 
 
+class _M2MStatements(NamedTuple):
+    """
+    Quoted junction-table names and fixed SQL for one field, dialect and direction.
+    """
+
+    through: str
+    parent_col: str
+    related_col: str
+    related_pk: str
+    insert_prefix: str
+    insert_row: str
+    insert_suffix: str
+    delete_sql: str
+    remove_prefix: str
+
+
 class ManyToManyManager:
     """
     Manager for many-to-many relations supporting read and mutation helpers.
     """
 
+    __slots__ = ("field", "instance", "source_model", "accessor_name", "is_reverse")
+
     def __init__(
         self,
         field: "ManyToManyField",
@@ -141,54 +186,89 @@ class ManyToManyManager:
             return "id"
         return pk_field.column_name()
 
+    def _statements(self, dialect) -> "_M2MStatements":
+        """
+        Return the quoted names and fixed SQL fragments for ``dialect``, rendered once
+        per field, dialect type and direction.
+        """
+
+        key = (type(dialect), self.is_reverse)
+        statements = self.field._m2m_sql_cache.get(key)
+        if statements is None:
+            if self.is_reverse:
+                parent_col, related_col = self._right_column(), self._left_column()
+                related_model = self.field.model
+            else:
+                parent_col, related_col = self._left_column(), self._right_column()
+                related_model = self.field.remote_model
+            if related_model is None:
+                field_name = self.field.require_name()
+                raise RuntimeError(f"Related model for field '{field_name}' is not resolved.")
+            through = dialect.format_table(self._through_table())
+            parent = dialect.quote_identifier(parent_col)
+            related = dialect.quote_identifier(related_col)
+            param = dialect.PARAM
+            delete_sql = f"DELETE FROM {through} WHERE {parent} = {param}"
+            statements = _M2MStatements(
+                through=through,
+                parent_col=parent,
+                related_col=related,
+                related_pk=dialect.quote_identifier(self._related_pk_column(related_model)),
+                insert_prefix=f"{dialect.insert_verb()} {through} ({parent}, {related}) VALUES ",
+                insert_row=f"({param}, {param})",
+                insert_suffix=dialect.insert_ignore_clause(parent),
+                delete_sql=delete_sql,
+                remove_prefix=f"{delete_sql} AND {related} IN (",
+            )
+            self.field._m2m_sql_cache[key] = statements
+        return statements
+
     def _normalize_targets(self, objs) -> list[Any]:
         related_model = self.field.model if self.is_reverse else self.field.remote_model
         if related_model is None:
             field_name = self.field.require_name()
             raise RuntimeError(f"Related model for field '{field_name}' is not resolved.")
-        pks: list[Any] = []
-        for obj in objs:
-            if hasattr(obj, "pk"):
-                pk_val = obj.pk
-            else:
-                pk_val = obj
-            if pk_val is None:
-                raise ValueError("Related instances must be saved before association.")
-            pks.append(pk_val)
+        try:
+            pks = list(map(_get_pk, objs))
+        except AttributeError:
+            # Mixed instances and raw primary keys.
+            pks = [obj.pk if hasattr(obj, "pk") else obj for obj in objs]
+        if None in pks:
+            raise ValueError("Related instances must be saved before association.")
         return pks
 
     def all(self):
+        # Prefetched or previously loaded rows stay valid until add/remove/clear drop them.
+        cached = self.instance._related_cache.get(self.accessor_name)
+        if cached is not None:
+            return cached
         session = self._session()
         related_model = self.field.model if self.is_reverse else self.field.remote_model
         if related_model is None:
             field_name = self.field.require_name()
             raise RuntimeError(f"Related model for field '{field_name}' is not resolved.")
-        through_table = session.dialect.format_table(self._through_table())
-        parent_col = self._right_column() if self.is_reverse else self._left_column()
-        related_col = self._left_column() if self.is_reverse else self._right_column()
-        parent_quoted = session.dialect.quote_identifier(parent_col)
-        related_quoted = session.dialect.quote_identifier(related_col)
-        junction_sql = f"SELECT {related_quoted} FROM {through_table} WHERE {parent_quoted} = {session.dialect.parameter_placeholder()}"
-        cursor = session.execute(junction_sql, (self.instance.pk,))
-        related_ids = [row[0] for row in cursor.fetchall()]
-        if not related_ids:
-            self.instance._related_cache[self.accessor_name] = []
-            return []
-
-        placeholders = ", ".join(session.dialect.parameter_placeholder() for _ in related_ids)
-        table = session.dialect.format_table(related_model._meta.table_name)
-        select_list = ", ".join(
-            session.dialect.quote_identifier(f.column_name())
-            for f in related_model._meta.get_fields()
+        dialect = session.dialect
+
+        def build() -> str:
+            # One JOIN through the junction table instead of fetching ids first.
+            statements = self._statements(dialect)
+            through = statements.through
+            table = dialect.format_table(related_model._meta.table_name)
+            select_list = ", ".join(
+                f"{table}.{dialect.quote_identifier(column)}"
+                for column in related_model._meta.columns.values()
+            )
+            return (
+                f"SELECT {select_list} FROM {table} INNER JOIN {through} "
+                f"ON {through}.{statements.related_col} = {table}.{statements.related_pk} "
+                f"WHERE {through}.{statements.parent_col} = {dialect.PARAM}"
+            )
+
+        sql = self.source_model._meta.cached_sql(
+            (type(dialect), "m2m_all", self.accessor_name), build
         )
-        pk_column = session.dialect.quote_identifier(self._related_pk_column(related_model))
-        sql = f"SELECT {select_list} FROM {table} WHERE {pk_column} IN ({placeholders})"
-        cursor = session.execute(sql, related_ids)
-        rows = cursor.fetchall()
-        results = []
-        for row in rows:
-            data = session._row_to_dict(cursor, row)
-            results.append(session._materialize(related_model, data))
+        cursor = session.execute(sql, (self.instance.pk,))
+        results = session._materialize_many(related_model, cursor)
         self.instance._related_cache[self.accessor_name] = results
         return results
 
@@ -203,28 +283,18 @@ class ManyToManyManager:
         target_pks = self._normalize_targets(objs)
         if not target_pks:
             return
-        # Avoid duplicate inserts by fetching existing rows.
-        through = session.dialect.format_table(self._through_table())
-        parent_col = self._right_column() if self.is_reverse else self._left_column()
-        related_col = self._left_column() if self.is_reverse else self._right_column()
-        left_col = session.dialect.quote_identifier(parent_col)
-        right_col = session.dialect.quote_identifier(related_col)
-        existing_cursor = session.execute(
-            f"SELECT {right_col} FROM {through} WHERE {left_col} = {session.dialect.parameter_placeholder()}",
-            (self.instance.pk,),
-        )
-        existing = {row[0] for row in existing_cursor.fetchall()}
-        new_values = [pk for pk in target_pks if pk not in existing]
-        if not new_values:
-            return
-        insert_sql = f"INSERT INTO {through} ({left_col}, {right_col}) VALUES " + ", ".join(
-            f"({session.dialect.parameter_placeholder()}, {session.dialect.parameter_placeholder()})"
-            for _ in new_values
+        statements = self._statements(session.dialect)
+        # The junction table's UNIQUE (left, right) constraint makes existing pairs no-ops.
+        insert_sql = (
+            statements.insert_prefix
+            + ", ".join([statements.insert_row] * len(target_pks))
+            + statements.insert_suffix
         )
         params: list[Any] = []
-        for pk in new_values:
-            # Order matches left_col (parent) then right_col (related)
-            params.extend([self.instance.pk, pk] if not self.is_reverse else [self.instance.pk, pk])
+        instance_pk = self.instance.pk
+        for pk in target_pks:
+            # Order matches the parent column, then the related column.
+            params.extend((instance_pk, pk))
         session.execute(insert_sql, params)
         self.instance._related_cache.pop(self.accessor_name, None)
 
@@ -235,35 +305,45 @@ class ManyToManyManager:
         target_pks = self._normalize_targets(objs)
         if not target_pks:
             return
-        through = session.dialect.format_table(self._through_table())
-        parent_col = self._right_column() if self.is_reverse else self._left_column()
-        related_col = self._left_column() if self.is_reverse else self._right_column()
-        left_col = session.dialect.quote_identifier(parent_col)
-        right_col = session.dialect.quote_identifier(related_col)
-        placeholders = ", ".join(session.dialect.parameter_placeholder() for _ in target_pks)
-        sql = (
-            f"DELETE FROM {through} WHERE {left_col} = {session.dialect.parameter_placeholder()} "
-            f"AND {right_col} IN ({placeholders})"
-        )
+        statements = self._statements(session.dialect)
+        placeholders = ", ".join([session.dialect.PARAM] * len(target_pks))
+        sql = f"{statements.remove_prefix}{placeholders})"
         session.execute(sql, [self.instance.pk, *target_pks])
-        self.instance._related_cache.pop(self.accessor_name, None)
+        cache = self.instance._related_cache
+        cached = cache.get(self.accessor_name)
+        if cached is not None:
+            # Every requested pair is gone after the DELETE, so trim the loaded rows in
+            # place of a re-fetch on the next read.
+            removed = set(target_pks)
+            cache[self.accessor_name] = [obj for obj in cached if obj.pk not in removed]
 
     def clear(self) -> None:
         if self.instance.pk is None:
             return
         session = self._session()
-        through = session.dialect.format_table(self._through_table())
-        parent_col = self._right_column() if self.is_reverse else self._left_column()
-        left_col = session.dialect.quote_identifier(parent_col)
-        sql = f"DELETE FROM {through} WHERE {left_col} = {session.dialect.parameter_placeholder()}"
-        session.execute(sql, (self.instance.pk,))
+        session.execute(self._statements(session.dialect).delete_sql, (self.instance.pk,))
         self.instance._related_cache[self.accessor_name] = []
 
     def __iter__(self):
         return iter(self.all())
 
+    def __len__(self) -> int:
+        return len(self.all())
+
+    def __getitem__(self, index):
+        return self.all()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ManyToManyManager):
+            other = other.all()
+        return bool(self.all() == other)
+
+    __hash__ = None  # type: ignore[assignment]
+
 
 class ManyToManyDescriptor:
+    __slots__ = ("field", "source_model", "accessor_name")
+
     def __init__(
         self,
         field: "ManyToManyField",
@@ -283,13 +363,16 @@ class ManyToManyDescriptor:
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        cache = getattr(instance, "_related_cache", {})
-        if self.accessor_name in cache:
-            return cache[self.accessor_name]
-        return ManyToManyManager(self.field, instance, self.source_model, self.accessor_name)
+        manager = ManyToManyManager(self.field, instance, self.source_model, self.accessor_name)
+        # Non-data descriptor: the instance attribute shadows it on later reads, so each
+        # instance builds its manager once and it is collected along with the instance.
+        instance.__dict__[self.accessor_name] = manager
+        return manager
 
 
 class ManyToManyField(RelatedField):
+    __slots__ = ("through", "db_table", "_m2m_sql_cache")
+
     relation_type = "many-to-many"
 
     def __init__(
@@ -307,9 +390,11 @@ class ManyToManyField(RelatedField):
         super().__init__(to, related_name=related_name, db_type=None, **kwargs)
         self.through = through
         self.db_table = db_table
+        # Quoted junction-table fragments keyed by (dialect type, reverse), filled by managers.
+        self._m2m_sql_cache: Dict[Tuple[type, bool], _M2MStatements] = {}
 
     def contribute_to_class(self, model: Type["Model"], name: str) -> None:
-        self.name = name
+        self.name = self._name = sys.intern(name)
         self.model = model
         setattr(model, name, ManyToManyDescriptor(self, accessor_name=name))
         model._meta.many_to_many.append(self)
@@ -342,11 +427,23 @@ class ManyToManyField(RelatedField):
 
 
 class RelatedAccessor:
-    def __init__(self, source_model: Type["Model"], field: RelatedField) -> None:
+    __slots__ = ("source_model", "field", "accessor_name")
+
+    def __init__(
+        self,
+        source_model: Type["Model"],
+        field: RelatedField,
+        accessor_name: Optional[str] = None,
+    ) -> None:
         self.source_model = source_model
         self.field = field
+        self.accessor_name = accessor_name or f"{source_model.__name__.lower()}_set"
 
     def __get__(self, instance, owner):
+        if instance is not None:
+            related = instance._related_cache.get(self.accessor_name, _MISSING)
+            if related is not _MISSING:
+                return related
         return RelatedManager(self.source_model, self.field, instance)
 
 
@@ -355,6 +452,8 @@ class RelatedManager:
     Provides a QuerySet filtered by a parent instance for reverse relations.
     """
 
+    __slots__ = ("model", "field", "instance")
+
     def __init__(self, source_model: Type["Model"], field: RelatedField, instance) -> None:
         self.model = source_model
         self.field = field
@@ -363,59 +462,125 @@ class RelatedManager:
     def all(self):
         qs = self.model.objects.all()
         if self.instance:
-            field_name = self.field.require_name()
-            return qs.filter(**{field_name: self.instance.pk})
+            return qs.filter(**{self.field._name: self.instance.pk})
         return qs
 
     def filter(self, **lookups):
         return self.all().filter(**lookups)
 
+    def __iter__(self):
+        if self.instance is None:
+            return iter(self.all())
+        from ..persistence.session import Session
+
+        session = Session.current()
+        if session is None:
+            # Let the QuerySet raise its usual "requires a bound Session" error.
+            return iter(self.all())
+        dialect = session.dialect
+        model = self.model
+        meta = model._meta
+        field = self.field
+
+        def build() -> str:
+            # Fixed-shape lookup, so skip the QuerySet/compiler round for plain iteration.
+            table = dialect.format_table(meta.table_name)
+            select_list = ", ".join(
+                dialect.quote_identifier(column) for column in meta.columns.values()
+            )
+            fk_column = dialect.quote_identifier(field.column_name())
+            return f"SELECT {select_list} FROM {table} WHERE {fk_column} = {dialect.PARAM}"
+
+        sql = meta.cached_sql((type(dialect), "reverse_fk", field._name), build)
+        cursor = session.execute(sql, (self.instance.pk,))
+        return iter(session._materialize_many(model, cursor))
+
+    @classmethod
+    def prefetch(
+        cls,
+        source_model: Type["Model"],
+        field: RelatedField,
+        parents: Sequence["Model"],
+        *,
+        accessor_name: Optional[str] = None,
+        session=None,
+    ) -> None:
+        """
+        Load the reverse relation for every parent with one ``fk IN (...)`` query per
+        parameter-limit chunk and store each parent's children in ``_related_cache``.
+        """
+
+        if session is None:
+            from ..persistence.session import Session
+
+            session = Session.current()
+            if session is None:
+                raise RuntimeError("Prefetching related objects requires an active Session.")
+        if accessor_name is None:
+            accessor_name = field.related_name or f"{source_model.__name__.lower()}_set"
+        parent_pks = [parent.pk for parent in parents if parent.pk is not None]
+        buckets: defaultdict[Any, list[Any]] = defaultdict(list)
+        if parent_pks:
+            dialect = session.dialect
+            fk_column = field.column_name()
+            table = dialect.format_table(source_model._meta.table_name)
+            select_list = ", ".join(
+                dialect.quote_identifier(column) for column in source_model._meta.columns.values()
+            )
+            prefix = (
+                f"SELECT {select_list} FROM {table} "
+                f"WHERE {dialect.quote_identifier(fk_column)} IN ("
+            )
+            placeholder = dialect.PARAM
+            chunk_size = dialect.capabilities.max_parameters or len(parent_pks)
+            for start in range(0, len(parent_pks), chunk_size):
+                chunk = parent_pks[start : start + chunk_size]
+                cursor = session.execute(f"{prefix}{', '.join(placeholder for _ in chunk)})", chunk)
+                for data in session._rows_to_dicts(cursor, cursor.fetchall()):
+                    buckets[data.get(fk_column)].append(session._materialize(source_model, data))
+        for parent in parents:
+            # ``get`` rather than indexing so parents without children do not grow the dict.
+            parent._related_cache[accessor_name] = buckets.get(parent.pk, [])
+
 
 class RelationRegistry:
     def __init__(self) -> None:
         self.models: Dict[str, Type["Model"]] = {}
-        self.pending_fields: List[Tuple[Type["Model"], RelatedField]] = []
-        # Track many-to-many fields to support reverse lookups without installing descriptors.
-        self.m2m_reverse: Dict[Type["Model"], List[Tuple[Type["Model"], "ManyToManyField"]]] = (
+        # Unresolved string references bucketed by the class name they wait for.
+        self.pending_by_label: DefaultDict[str, List[Tuple[Type["Model"], RelatedField]]] = (
             defaultdict(list)
         )
+        # Track many-to-many fields to support reverse lookups without installing descriptors.
+        self.m2m_reverse: Dict[Type["Model"], List[Tuple[Type["Model"], "ManyToManyField"]]] = {}
 
     def register_model(self, model: Type["Model"]) -> None:
         label = self._label(model)
         self.models[label] = model
-        self._resolve_pending()
+        for pending_model, field in self.pending_by_label.pop(label, ()):
+            self._bind(pending_model, field, model)
 
     def register_field(self, model: Type["Model"], field: RelatedField) -> None:
         target = self._resolve_target(field.to)
         if target is None:
-            self.pending_fields.append((model, field))
+            label = cast(str, field.to).rpartition(".")[2]
+            self.pending_by_label[label].append((model, field))
             return
+        self._bind(model, field, target)
+
+    def _bind(self, model: Type["Model"], field: RelatedField, target: Type["Model"]) -> None:
         field.resolve_model(target)
         if isinstance(field, ManyToManyField):
-            self.m2m_reverse[target].append((model, field))
+            self.m2m_reverse.setdefault(target, []).append((model, field))
         self._attach_reverse_accessor(model, field)
 
-    def _resolve_pending(self) -> None:
-        unresolved = []
-        for model, field in self.pending_fields:
-            target = self._resolve_target(field.to)
-            if target is None:
-                unresolved.append((model, field))
-                continue
-            field.resolve_model(target)
-            if isinstance(field, ManyToManyField):
-                self.m2m_reverse[target].append((model, field))
-            self._attach_reverse_accessor(model, field)
-        self.pending_fields = unresolved
-
     def _resolve_target(self, target: Type["Model"] | str) -> Optional[Type["Model"]]:
-        if isinstance(target, type):
-            return target
-        label = target.split(".")[-1]
-        return self.models.get(label)
+        if isinstance(target, str):
+            # "app.Model" and "Model" both resolve by the trailing class name.
+            return self.models.get(target.rpartition(".")[2])
+        return target
 
     def _label(self, model: Type["Model"]) -> str:
-        return model.__name__
+        return sys.intern(model.__name__)
 
     def _attach_reverse_accessor(self, model: Type["Model"], field: RelatedField) -> None:
         remote = field.remote_model
@@ -429,7 +594,7 @@ class RelationRegistry:
                 field, source_model=remote, accessor_name=related_name
             )
         else:
-            descriptor = RelatedAccessor(model, field)
+            descriptor = RelatedAccessor(model, field, related_name)
         setattr(remote, related_name, descriptor)
 
 
@@ -18,6 +18,7 @@ class DialectCapabilities:
     supports_savepoints: bool = True
     supports_partial_indexes: bool = False
     supports_schema_namespaces: bool = False
+    max_parameters: int | None = None
 
 
 class Dialect(Protocol):
@@ -34,6 +35,10 @@ class Dialect(Protocol):
     @property
     def capabilities(self) -> DialectCapabilities: ...
 
+    # Positional bind marker; ``parameter_placeholder()`` returns the same string.
+    @property
+    def PARAM(self) -> str: ...
+
     def quote_identifier(self, identifier: str) -> str: ...
 
     def format_table(self, table_name: str) -> str: ...
@@ -42,4 +47,11 @@ class Dialect(Protocol):
 
     def parameter_placeholder(self, position: int | None = None) -> str: ...
 
+    # ``insert_verb()`` plus ``insert_ignore_clause(column)`` build an INSERT that skips
+    # rows violating a unique constraint instead of raising; ``column`` is a quoted
+    # column of the inserted row. Other errors (FK, NOT NULL) must still raise.
+    def insert_verb(self) -> str: ...
+
+    def insert_ignore_clause(self, column: str) -> str: ...
+
     def render_column_definition(self, column: str, column_type: str, *, nullable: bool) -> str: ...
@@ -4,28 +4,50 @@ MySQL dialect implementation.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Final
 
 from .base import Dialect, DialectCapabilities
 
 
+@lru_cache(maxsize=1024)
+def _quote_identifier(identifier: str) -> str:
+    escaped = identifier.replace("`", "``")
+    return f"`{escaped}`"
+
+
+@lru_cache(maxsize=256)
+def _limit_clause(limit: int | None, offset: int | None) -> str:
+    parts: list[str] = []
+    if limit is not None:
+        parts.append(f"LIMIT {limit}")
+    if offset is not None:
+        if limit is None:
+            parts.append("LIMIT 18446744073709551615")
+        parts.append(f"OFFSET {offset}")
+    return " ".join(parts)
+
+
 class MySQLDialect:
     """
     MySQL dialect using percent-style placeholders.
     """
 
+    __slots__ = ()
+
     name: Final[str] = "mysql"
     param_style: Final[str] = "pyformat"
+    PARAM: Final[str] = "%s"
     capabilities: Final[DialectCapabilities] = DialectCapabilities(
         supports_returning=False,
         supports_savepoints=True,
         supports_partial_indexes=False,
         supports_schema_namespaces=True,
+        max_parameters=65535,
     )
 
-    def quote_identifier(self, identifier: str) -> str:
-        escaped = identifier.replace("`", "``")
-        return f"`{escaped}`"
+    # Identifiers repeat across every statement; quoting is memoized per process.
+    quote_identifier = staticmethod(_quote_identifier)
 
     def format_table(self, table_name: str) -> str:
         if "." in table_name:
@@ -33,18 +55,19 @@ class MySQLDialect:
             return f"{self.quote_identifier(schema)}.{self.quote_identifier(table)}"
         return self.quote_identifier(table_name)
 
-    def limit_clause(self, limit: int | None, offset: int | None) -> str:
-        parts: list[str] = []
-        if limit is not None:
-            parts.append(f"LIMIT {limit}")
-        if offset is not None:
-            if limit is None:
-                parts.append("LIMIT 18446744073709551615")
-            parts.append(f"OFFSET {offset}")
-        return " ".join(parts)
+    # Pagination uses a handful of (limit, offset) pairs; rendered clauses are memoized.
+    limit_clause = staticmethod(_limit_clause)
 
     def parameter_placeholder(self, position: int | None = None) -> str:
-        return "%s"
+        return self.PARAM
+
+    def insert_verb(self) -> str:
+        return "INSERT INTO"
+
+    def insert_ignore_clause(self, column: str) -> str:
+        # ``INSERT IGNORE`` would also downgrade FK/NOT NULL/truncation errors to
+        # warnings; a no-op update skips only duplicate-key rows.
+        return f" ON DUPLICATE KEY UPDATE {column} = {column}"
 
     def render_column_definition(self, column: str, column_type: str, *, nullable: bool) -> str:
         null_clause = "" if nullable else " NOT NULL"
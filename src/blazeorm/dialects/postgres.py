@@ -4,28 +4,48 @@ PostgreSQL dialect implementation.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Final
 
 from .base import Dialect, DialectCapabilities
 
 
+@lru_cache(maxsize=1024)
+def _quote_identifier(identifier: str) -> str:
+    escaped = identifier.replace('"', '""')
+    return f'"{escaped}"'
+
+
+@lru_cache(maxsize=256)
+def _limit_clause(limit: int | None, offset: int | None) -> str:
+    parts: list[str] = []
+    if limit is not None:
+        parts.append(f"LIMIT {limit}")
+    if offset is not None:
+        parts.append(f"OFFSET {offset}")
+    return " ".join(parts)
+
+
 class PostgresDialect:
     """
     PostgreSQL dialect using percent positional parameters.
     """
 
+    __slots__ = ()
+
     name: Final[str] = "postgresql"
     param_style: Final[str] = "pyformat"
+    PARAM: Final[str] = "%s"
     capabilities: Final[DialectCapabilities] = DialectCapabilities(
         supports_returning=True,
         supports_savepoints=True,
         supports_partial_indexes=True,
         supports_schema_namespaces=True,
+        max_parameters=65535,
     )
 
-    def quote_identifier(self, identifier: str) -> str:
-        escaped = identifier.replace('"', '""')
-        return f'"{escaped}"'
+    # Identifiers repeat across every statement; quoting is memoized per process.
+    quote_identifier = staticmethod(_quote_identifier)
 
     def format_table(self, table_name: str) -> str:
         if "." in table_name:
@@ -33,16 +53,17 @@ class PostgresDialect:
             return f"{self.quote_identifier(schema)}.{self.quote_identifier(table)}"
         return self.quote_identifier(table_name)
 
-    def limit_clause(self, limit: int | None, offset: int | None) -> str:
-        parts: list[str] = []
-        if limit is not None:
-            parts.append(f"LIMIT {limit}")
-        if offset is not None:
-            parts.append(f"OFFSET {offset}")
-        return " ".join(parts)
+    # Pagination uses a handful of (limit, offset) pairs; rendered clauses are memoized.
+    limit_clause = staticmethod(_limit_clause)
 
     def parameter_placeholder(self, position: int | None = None) -> str:
-        return "%s"
+        return self.PARAM
+
+    def insert_verb(self) -> str:
+        return "INSERT INTO"
+
+    def insert_ignore_clause(self, column: str) -> str:
+        return " ON CONFLICT DO NOTHING"
 
     def render_column_definition(self, column: str, column_type: str, *, nullable: bool) -> str:
         null_clause = "" if nullable else " NOT NULL"
@@ -4,44 +4,65 @@ SQLite dialect implementation.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Final
 
 from .base import Dialect, DialectCapabilities
 
 
+@lru_cache(maxsize=1024)
+def _quote_identifier(identifier: str) -> str:
+    escaped = identifier.replace('"', '""')
+    return f'"{escaped}"'
+
+
+@lru_cache(maxsize=256)
+def _limit_clause(limit: int | None, offset: int | None) -> str:
+    parts: list[str] = []
+    if limit is not None:
+        parts.append(f"LIMIT {limit}")
+    if offset is not None:
+        if limit is None:
+            parts.append("LIMIT -1")
+        parts.append(f"OFFSET {offset}")
+    return " ".join(parts)
+
+
 class SQLiteDialect:
     """
     SQLite dialect using qmark param style and minimal capabilities.
     """
 
+    __slots__ = ()
+
     name: Final[str] = "sqlite"
     param_style: Final[str] = "qmark"
+    PARAM: Final[str] = "?"
     capabilities: Final[DialectCapabilities] = DialectCapabilities(
         supports_returning=False,
         supports_savepoints=True,
         supports_partial_indexes=False,
         supports_schema_namespaces=False,
+        max_parameters=999,
     )
 
-    def quote_identifier(self, identifier: str) -> str:
-        escaped = identifier.replace('"', '""')
-        return f'"{escaped}"'
+    # Identifiers repeat across every statement; quoting is memoized per process.
+    quote_identifier = staticmethod(_quote_identifier)
 
     def format_table(self, table_name: str) -> str:
         return self.quote_identifier(table_name)
 
-    def limit_clause(self, limit: int | None, offset: int | None) -> str:
-        parts: list[str] = []
-        if limit is not None:
-            parts.append(f"LIMIT {limit}")
-        if offset is not None:
-            if limit is None:
-                parts.append("LIMIT -1")
-            parts.append(f"OFFSET {offset}")
-        return " ".join(parts)
+    # Pagination uses a handful of (limit, offset) pairs; rendered clauses are memoized.
+    limit_clause = staticmethod(_limit_clause)
 
     def parameter_placeholder(self, position: int | None = None) -> str:
-        return "?"
+        return self.PARAM
+
+    def insert_verb(self) -> str:
+        return "INSERT INTO"
+
+    def insert_ignore_clause(self, column: str) -> str:
+        return " ON CONFLICT DO NOTHING"
 
     def render_column_definition(self, column: str, column_type: str, *, nullable: bool) -> str:
         null_clause = "" if nullable else " NOT NULL"
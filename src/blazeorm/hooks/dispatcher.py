@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from ..core.model import Model
 
@@ -15,12 +15,18 @@ HookHandler = Callable[..., None]
 
 @dataclass(frozen=True)
 class HookEvent:
+    __slots__ = ("name",)
+
     name: str
 
 
 class HookDispatcher:
     """
     Maintains global and per-model hook handlers.
+
+    ``fire`` runs on every lifecycle step of every persisted instance, so the merged
+    global + model handlers are resolved once per ``(model, event)`` into a tuple and
+    reused until ``register`` or ``clear`` changes the handler set.
     """
 
     def __init__(self) -> None:
@@ -28,6 +34,7 @@ class HookDispatcher:
         self._model_handlers: Dict[Type[Model], Dict[str, List[HookHandler]]] = defaultdict(
             lambda: defaultdict(list)
         )
+        self._resolved: Dict[Tuple[Optional[Type[Model]], str], Tuple[HookHandler, ...]] = {}
 
     def register(
         self, event: str, handler: HookHandler, *, model: Optional[Type[Model]] = None
@@ -36,18 +43,43 @@ class HookDispatcher:
             self._model_handlers[model][event].append(handler)
         else:
             self._global_handlers[event].append(handler)
+        self._resolved.clear()
 
     def fire(self, event: str, instance: Optional[Model], **context: Any) -> None:
-        handlers = list(self._global_handlers.get(event, []))
         model = instance.__class__ if instance is not None else None
-        if model:
-            handlers.extend(self._model_handlers.get(model, {}).get(event, []))
+        key = (model, event)
+        handlers = self._resolved.get(key)
+        if handlers is None:
+            handlers = self._resolve(model, event)
+            self._resolved[key] = handlers
+        if not handlers:
+            return
         for handler in handlers:
             handler(instance, **context)
 
+    def has(self, event: str, model: Optional[Type[Model]]) -> bool:
+        """
+        Return whether firing ``event`` for ``model`` would call any handler.
+        """
+
+        key = (model, event)
+        handlers = self._resolved.get(key)
+        if handlers is None:
+            handlers = self._resolved[key] = self._resolve(model, event)
+        return bool(handlers)
+
+    def _resolve(self, model: Optional[Type[Model]], event: str) -> Tuple[HookHandler, ...]:
+        handlers = tuple(self._global_handlers.get(event, ()))
+        if model is not None:
+            model_handlers = self._model_handlers.get(model)
+            if model_handlers:
+                handlers += tuple(model_handlers.get(event, ()))
+        return handlers
+
     def clear(self) -> None:
         self._global_handlers.clear()
         self._model_handlers.clear()
+        self._resolved.clear()
 
 
 hooks = HookDispatcher()
@@ -3,8 +3,14 @@ Persistence layer components: sessions, unit of work, identity map.
 """
 
 from .identity_map import IdentityMap
-from .session import Session
+from .session import Session, enable_thread_local_sessions
 from .transaction import TransactionManager
 from .unit_of_work import UnitOfWork
 
-__all__ = ["IdentityMap", "Session", "TransactionManager", "UnitOfWork"]
+__all__ = [
+    "IdentityMap",
+    "Session",
+    "TransactionManager",
+    "UnitOfWork",
+    "enable_thread_local_sessions",
+]
@@ -4,49 +4,49 @@ Identity map ensuring a single in-memory instance per row.
 
 from __future__ import annotations
 
-from threading import RLock
-from typing import Dict, Tuple, Type
+from threading import Lock
+from typing import Dict, Type
 
 from ..core.model import Model
 
 
 class IdentityMap:
     """
-    Stores model instances keyed by (model, primary key).
+    Stores model instances per model class, keyed by primary key.
+
+    Nesting by model avoids building a ``(model, pk)`` tuple on every lookup. Single-key
+    operations are plain dict calls, which the GIL already makes atomic, so they run
+    without a lock; only ``values()`` and ``clear()`` lock so a snapshot never
+    interleaves with a clear. ``Session`` serializes compound operations itself.
     """
 
-    def __init__(self) -> None:
-        self._store: Dict[Tuple[Type[Model], object], Model] = {}
-        self._lock = RLock()
+    __slots__ = ("_store", "_lock")
 
-    @staticmethod
-    def _make_key(instance_or_model, pk) -> Tuple[Type[Model], object]:
-        if isinstance(instance_or_model, type):
-            model = instance_or_model
-        else:
-            model = instance_or_model.__class__
-        return (model, pk)
+    def __init__(self) -> None:
+        self._store: Dict[Type[Model], Dict[object, Model]] = {}
+        self._lock = Lock()
 
     def add(self, instance: Model) -> None:
         pk = instance.pk
         if pk is None:
             return
-        key = self._make_key(instance, pk)
-        with self._lock:
-            self._store[key] = instance
+        model = instance.__class__
+        instances = self._store.get(model)
+        if instances is None:
+            instances = self._store.setdefault(model, {})
+        instances[pk] = instance
 
     def get(self, model: Type[Model], pk) -> Model | None:
-        key = self._make_key(model, pk)
-        with self._lock:
-            return self._store.get(key)
+        instances = self._store.get(model)
+        return instances.get(pk) if instances else None
 
     def remove(self, instance: Model) -> None:
         pk = instance.pk
         if pk is None:
             return
-        key = self._make_key(instance, pk)
-        with self._lock:
-            self._store.pop(key, None)
+        instances = self._store.get(instance.__class__)
+        if instances:
+            instances.pop(pk, None)
 
     def clear(self) -> None:
         with self._lock:
@@ -54,12 +54,16 @@ class IdentityMap:
 
     def values(self):
         with self._lock:
-            return list(self._store.values())
+            # ``list()`` copies each dict in one C call, so lock-free adds can't resize
+            # a dict mid-iteration.
+            snapshot: list[Model] = []
+            for instances in list(self._store.values()):
+                snapshot.extend(list(instances.values()))
+            return snapshot
 
     def __contains__(self, instance: Model) -> bool:
         pk = instance.pk
         if pk is None:
             return False
-        key = self._make_key(instance, pk)
-        with self._lock:
-            return key in self._store
+        instances = self._store.get(instance.__class__)
+        return instances is not None and pk in instances
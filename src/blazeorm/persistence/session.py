@@ -4,10 +4,13 @@ Session management coordinating adapters, unit of work, and identity map.
 
 from __future__ import annotations
 
+import logging
+import weakref
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
-from threading import RLock
-from typing import Any, Iterable, Optional, Type
+from threading import RLock, local
+from time import perf_counter
+from typing import Any, Iterable, Mapping, Optional, Sequence, Type
 
 from ..adapters.base import ConnectionConfig, Cursor, DatabaseAdapter
 from ..cache import CacheBackend, NoOpCache
@@ -16,7 +19,7 @@ from ..core.relations import ManyToManyField, relation_registry
 from ..dialects.base import Dialect
 from ..dialects.sqlite import SQLiteDialect
 from ..security.redaction import redact_params
-from ..utils import PerformanceTracker, get_logger, time_call
+from ..utils import PerformanceTracker, get_logger
 from ..utils.performance import resolve_slow_query_ms
 from .identity_map import IdentityMap
 from .transaction import TransactionManager
@@ -25,6 +28,22 @@ from .unit_of_work import UnitOfWork
 _current_session: ContextVar["Session | None"] = ContextVar(
     "blazeorm_current_session", default=None
 )
+# Synchronous applications can opt into a thread-local binding, which skips the Token
+# allocation and ContextVar set/reset; it does not isolate asyncio tasks on one thread.
+_current_session_tls = local()
+_THREAD_LOCAL_MODE = False
+_NOT_BOUND: Any = object()
+
+
+def enable_thread_local_sessions(enabled: bool = True) -> None:
+    """
+    Bind ``with session:`` blocks through a thread-local instead of the default
+    ``ContextVar``. Only safe when no two asyncio tasks share a thread; call once at
+    startup in synchronous applications.
+    """
+
+    global _THREAD_LOCAL_MODE
+    _THREAD_LOCAL_MODE = enabled
 
 
 class Session:
@@ -32,6 +51,30 @@ class Session:
     Coordinates persistence operations for a set of model instances.
     """
 
+    # Fixed slots keep the per-request footprint small; ``__dict__`` stays available
+    # (allocated lazily) so instances can still be patched or extended ad hoc.
+    __slots__ = (
+        "adapter",
+        "autocommit",
+        "dialect",
+        "connection_config",
+        "identity_map",
+        "unit_of_work",
+        "_uow_ref",
+        "transaction_manager",
+        "_lock",
+        "cache",
+        "hooks",
+        "logger",
+        "slow_query_ms",
+        "performance",
+        "_tracking_enabled",
+        "_ctx_token",
+        "_prev_session",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         adapter: DatabaseAdapter,
@@ -42,6 +85,7 @@ class Session:
         cache_backend: Optional[CacheBackend] = None,
         performance_threshold: int = 5,
         slow_query_ms: int | None = None,
+        track_queries: bool = True,
     ) -> None:
         self.adapter = adapter
         self.autocommit = autocommit
@@ -55,9 +99,9 @@ class Session:
         )
         self.identity_map = IdentityMap()
         self.unit_of_work = UnitOfWork()
+        self._uow_ref = weakref.ref(self.unit_of_work)
         self.transaction_manager = TransactionManager(adapter, self.dialect)
         self._lock = RLock()
-        self._uow_snapshots: list[tuple[set[Model], set[Model], set[Model]]] = []
         self.cache = cache_backend or NoOpCache()
         from ..hooks import hooks
 
@@ -67,7 +111,10 @@ class Session:
         self.performance = PerformanceTracker(
             self.logger, n_plus_one_threshold=performance_threshold
         )
+        # When off, execute() skips redaction, timing/slow-query logging and stats.
+        self._tracking_enabled = track_queries
         self._ctx_token: Token["Session | None"] | None = None
+        self._prev_session: "Session | None" = _NOT_BOUND
         self.adapter.connect(self.connection_config)
 
     # ------------------------------------------------------------------ #
@@ -75,7 +122,11 @@ class Session:
     # ------------------------------------------------------------------ #
     def __enter__(self) -> "Session":
         self.begin()
-        self._ctx_token = _current_session.set(self)
+        if _THREAD_LOCAL_MODE:
+            self._prev_session = getattr(_current_session_tls, "value", None)
+            _current_session_tls.value = self
+        else:
+            self._ctx_token = _current_session.set(self)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
@@ -88,6 +139,9 @@ class Session:
             if self._ctx_token:
                 _current_session.reset(self._ctx_token)
                 self._ctx_token = None
+            elif self._prev_session is not _NOT_BOUND:
+                _current_session_tls.value = self._prev_session
+                self._prev_session = _NOT_BOUND
             self.close()
 
     # ------------------------------------------------------------------ #
@@ -117,7 +171,7 @@ class Session:
         with self._lock:
             self.adapter.close()
             self.identity_map.clear()
-            self._uow_snapshots.clear()
+            self.unit_of_work.discard_savepoints()
             self.performance.reset()
 
     # ------------------------------------------------------------------ #
@@ -142,71 +196,171 @@ class Session:
     # ------------------------------------------------------------------ #
     def flush(self) -> None:
         with self._lock:
-            self.unit_of_work.collect_dirty(self.identity_map.values())
-            for instance in list(self.unit_of_work.new):
-                self._persist_new(instance)
-                self.unit_of_work.new.discard(instance)
-            for instance in list(self.unit_of_work.dirty):
+            uow = self.unit_of_work
+            # Tracked instances report their clean -> dirty transitions, so only those are
+            # checked instead of every identity-map entry. Deleted or evicted instances
+            # are no longer in the map and are skipped.
+            identity_map = self.identity_map
+            uow.collect_dirty(
+                [instance for instance in uow.take_touched() if instance in identity_map]
+            )
+            # Grouping by model lets rows sharing a column set go out in one executemany.
+            new_by_model: dict[Type[Model], list[Model]] = {}
+            for instance in uow.new:
+                new_by_model.setdefault(type(instance), []).append(instance)
+            for instances in new_by_model.values():
+                self._insert_instances(instances)
+            for instance in list(uow.dirty):
                 self._persist_dirty(instance)
-                self.unit_of_work.dirty.discard(instance)
-            for instance in list(self.unit_of_work.deleted):
-                self._persist_deleted(instance)
-                self.unit_of_work.deleted.discard(instance)
+                uow.discard_dirty(instance)
+            deleted_by_model: dict[Type[Model], list[Model]] = {}
+            for instance in uow.deleted:
+                deleted_by_model.setdefault(type(instance), []).append(instance)
+            for model, instances in deleted_by_model.items():
+                self._delete_instances(model, instances)
 
     # ------------------------------------------------------------------ #
     def get(self, model: Type[Model], **filters: Any) -> Optional[Model]:
+        if len(filters) != 1:
+            raise ValueError("Session.get currently supports exactly one filter.")
+        ((field_name, value),) = filters.items()
+        pk_field = model._meta.primary_key
+        by_pk = pk_field is not None and field_name == pk_field._name
+        if by_pk:
+            # Identity-map reads are single dict probes and need no session lock.
+            cached = self.identity_map.get(model, value)
+            if cached is not None:
+                return cached
         with self._lock:
-            if len(filters) != 1:
-                raise ValueError("Session.get currently supports exactly one filter.")
-            field_name, value = next(iter(filters.items()))
-
-            pk_field = model._meta.primary_key
-            if pk_field and field_name == pk_field.require_name():
-                cached = self.identity_map.get(model, value)
-                if cached is not None:
-                    return cached
+            if by_pk:
                 cached_payload = self.cache.get(model, value)
                 if cached_payload is not None:
-                    instance = model(**cached_payload)
-                    instance._initial_state = dict(instance._field_values)
-                    self.identity_map.add(instance)
-                    return instance
+                    return self._hydrate_from_payload(model, cached_payload)
 
             field = model._meta.get_field(field_name)
-            column = field.column_name()
-            quoted_column = self.dialect.quote_identifier(column)
-            select_list = ", ".join(
-                self.dialect.quote_identifier(f.column_name()) for f in model._meta.get_fields()
-            )
-            placeholder = self.dialect.parameter_placeholder()
-            sql = (
-                f"SELECT {select_list} FROM {self.dialect.format_table(model._meta.table_name)} "
-                f"WHERE {quoted_column} = {placeholder} LIMIT 1"
-            )
+            sql = self._select_sql(model, field.column_name())
             cursor = self.execute(sql, (value,))
             row = cursor.fetchone()
             if not row:
                 return None
-            data = self._row_to_dict(cursor, row)
-            return self._materialize(model, data)
+            # The cached SELECT lists every field in declaration order, so values can be
+            # paired positionally instead of building a column-keyed dict first.
+            return self._materialize(model, dict(zip(model._meta.field_names, row)))
 
-    def execute(self, sql: str, params: Iterable[Any] | None = None) -> Cursor:
+    def get_many(self, model: Type[Model], pks: Iterable[Any]) -> dict[Any, Model]:
+        """
+        Load instances by primary key, returning a mapping of pk to instance.
+
+        Identity-map and cache hits are served without a query; remaining keys are
+        fetched with ``IN`` queries chunked to the dialect's parameter limit. Keys
+        without a matching row are omitted from the result.
+        """
+
+        pk_field = model._meta.primary_key
+        if pk_field is None:
+            raise ValueError(f"Model '{model.__name__}' lacks a primary key.")
         with self._lock:
-            param_list = list(params or [])
-            redacted = self._redact(param_list)
-
-            def _record(elapsed_ms: float) -> None:
-                self.performance.record(sql, redacted, elapsed_ms)
-
-            with time_call(
-                "session.execute",
-                self.logger,
-                sql=sql,
-                params=redacted,
-                threshold_ms=self.slow_query_ms,
-                on_complete=_record,
-            ):
+            ordered = [pk for pk in dict.fromkeys(pks) if pk is not None]
+            found: dict[Any, Model] = {}
+            missing: list[Any] = []
+            for pk in ordered:
+                cached = self.identity_map.get(model, pk)
+                if cached is None:
+                    cached_payload = self.cache.get(model, pk)
+                    if cached_payload is not None:
+                        cached = self._hydrate_from_payload(model, cached_payload)
+                if cached is None:
+                    missing.append(pk)
+                else:
+                    found[pk] = cached
+
+            if missing:
+                pk_name = pk_field.require_name()
+                field_names = model._meta.field_names
+                prefix = self._select_in_prefix(model, pk_field.column_name())
+                placeholder = self.dialect.PARAM
+                chunk_size = self.dialect.capabilities.max_parameters or len(missing)
+                for start in range(0, len(missing), chunk_size):
+                    chunk = missing[start : start + chunk_size]
+                    sql = f"{prefix}{', '.join(placeholder for _ in chunk)})"
+                    cursor = self.execute(sql, chunk)
+                    for row in cursor.fetchall():
+                        instance = self._materialize(model, dict(zip(field_names, row)))
+                        found[getattr(instance, pk_name)] = instance
+            return {pk: found[pk] for pk in ordered if pk in found}
+
+    def execute(self, sql: str, params: Iterable[Any] | None = None) -> Cursor:
+        # Parameter preparation touches no session state, so it runs before the lock;
+        # the lock only serializes use of the shared connection.
+        # Adapters receive a list; one the caller built already is passed through.
+        if params is None:
+            param_list: list[Any] = []
+        elif type(params) is list:
+            param_list = params
+        else:
+            param_list = list(params)
+        if not self._tracking_enabled:
+            with self._lock:
                 return self.adapter.execute(sql, param_list)
+        redacted = self._redact(param_list)
+        with self._lock:
+            # Timed inline rather than through ``time_call``: this runs for every
+            # statement, and the log record and stats are the same.
+            start = perf_counter()
+            try:
+                cursor = self.adapter.execute(sql, param_list)
+            except BaseException:
+                self._log_timing("session.execute", sql, redacted, start)
+                raise
+            elapsed_ms = self._log_timing("session.execute", sql, redacted, start)
+            self.performance.record(sql, redacted, elapsed_ms)
+            return cursor
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> Cursor:
+        with self._lock:
+            # Adapters check a list in place, so every row is validated before any is written.
+            rows = [list(params) for params in seq_of_params]
+            if not self._tracking_enabled:
+                return self.adapter.executemany(sql, rows)
+            start = perf_counter()
+            try:
+                cursor = self.adapter.executemany(sql, rows)
+            except BaseException:
+                self._log_timing("session.executemany", sql, "bulk", start)
+                raise
+            elapsed_ms = self._log_timing("session.executemany", sql, "bulk", start)
+            self.performance.record(sql, [], elapsed_ms)
+            return cursor
+
+    def _log_timing(self, name: str, sql: str, params: Any, start: float) -> float:
+        """
+        Log a statement's duration like ``time_call`` does and return it in ms.
+        """
+
+        elapsed_ms = (perf_counter() - start) * 1000
+        level = logging.WARNING if elapsed_ms >= self.slow_query_ms else logging.DEBUG
+        logger = self.logger
+        if logger.isEnabledFor(level):
+            extra = {"sql": sql, "params": params, "elapsed_ms": elapsed_ms}
+            logger.log(level, "%s took %.2fms", name, elapsed_ms, extra=extra)
+        return elapsed_ms
+
+    def bulk_save(self, instances: Iterable[Model]) -> list[Model]:
+        """
+        Insert new instances inside a single transaction.
+
+        Consecutive rows sharing a model and column set are sent through one
+        ``executemany`` call. Rows relying on a database-generated primary key are
+        inserted individually so the key can be read back; they still share the
+        surrounding transaction, so the commit cost is paid once.
+        """
+
+        pending = list(instances)
+        with self._lock, self.transaction():
+            for instance in pending:
+                self.unit_of_work.discard_new(instance)
+            self._insert_instances(pending)
+        return pending
 
     def query(self, model: Type[Model]):
         """
@@ -236,42 +390,59 @@ class Session:
         manager.clear()
         self._invalidate_m2m_cache(instance, field, [])
 
+    def _hydrate_from_payload(self, model: Type[Model], payload: Mapping[str, Any]) -> Model:
+        instance = model(**payload)
+        instance._mark_clean()
+        self._track(instance)
+        return instance
+
     def _materialize(self, model: Type[Model], data: dict[str, Any]) -> Model:
         pk_field = model._meta.primary_key
-        pk_name = pk_field.require_name() if pk_field else None
-        pk_value = data.get(pk_name) if pk_name else None
-        if pk_name and pk_value is not None:
-            cached = self.identity_map.get(model, pk_value)
-            if cached:
-                return cached
-        instance = model(**data)
-        if pk_name and pk_value is not None and getattr(instance, pk_name, None) is None:
-            setattr(instance, pk_name, pk_value)
-        instance._initial_state = dict(instance._field_values)
-        self.identity_map.add(instance)
+        if pk_field is not None:
+            pk_name = pk_field._name
+            pk_value = data.get(pk_name)
+            if pk_value is None:
+                pk_value = data.get(model._meta.columns[pk_name])
+            if pk_value is not None:
+                cached = self.identity_map.get(model, pk_value)
+                if cached:
+                    return cached
+        instance = model._from_db(data)
+        self._track(instance)
         self._cache_instance(instance)
         return instance
 
     def query_stats(self) -> list[dict[str, object]]:
         """
         Return collected performance statistics for the current session.
+
+        Statistics have their own lock, so this does not wait for an in-flight query.
         """
 
-        with self._lock:
-            return self.performance.summary()
+        return self.performance.summary()
 
     def export_query_stats(
         self, *, reset: bool = False, include_samples: bool = False
     ) -> list[dict[str, object]]:
-        with self._lock:
-            stats = self.performance.export(include_samples=include_samples)
-            if reset:
-                self.performance.reset()
-            return stats
+        return self.performance.export(include_samples=include_samples, reset=reset)
 
     def reset_query_stats(self) -> None:
-        with self._lock:
-            self.performance.reset()
+        self.performance.reset()
+
+    def enable_query_stats(self) -> None:
+        """
+        Resume timing, slow-query logging and statistics for executed statements.
+        """
+
+        self._tracking_enabled = True
+
+    def disable_query_stats(self) -> None:
+        """
+        Send statements straight to the adapter, without redaction, timing, slow-query
+        logging or statistics. Already collected statistics are kept.
+        """
+
+        self._tracking_enabled = False
 
     # ------------------------------------------------------------------ #
     @contextmanager
@@ -291,67 +462,128 @@ class Session:
 
     # ------------------------------------------------------------------ #
     def _snapshot_uow(self) -> None:
-        snapshot = (
-            set(self.unit_of_work.new),
-            set(self.unit_of_work.dirty),
-            set(self.unit_of_work.deleted),
-        )
-        self._uow_snapshots.append(snapshot)
+        self.unit_of_work.savepoint()
 
     def _discard_uow_snapshot(self) -> None:
-        if self._uow_snapshots:
-            self._uow_snapshots.pop()
+        self.unit_of_work.release_savepoint()
 
     def _restore_uow_snapshot(self) -> None:
-        if not self._uow_snapshots:
-            self.unit_of_work.clear()
-            return
-        new_snapshot, dirty_snapshot, deleted_snapshot = self._uow_snapshots.pop()
-        self.unit_of_work.new = set(new_snapshot)
-        self.unit_of_work.dirty = set(dirty_snapshot)
-        self.unit_of_work.deleted = set(deleted_snapshot)
+        self.unit_of_work.rollback_savepoint()
 
     # ------------------------------------------------------------------ #
     # Persistence helpers
     # ------------------------------------------------------------------ #
-    def _persist_new(self, instance: Model) -> None:
-        self.hooks.fire("before_validate", instance, session=self)
-        instance.full_clean()
-        self.hooks.fire("after_validate", instance, session=self)
-        self.hooks.fire("before_save", instance, session=self, created=True)
-        table = self.dialect.format_table(instance._meta.table_name)
+    def _insert_instances(self, instances: Iterable[Model]) -> None:
+        """
+        Insert ``instances``, batching consecutive rows that share a model and column set
+        into one ``executemany``. Rows relying on a database-generated primary key are
+        inserted individually so the key can be read back.
+        """
+
+        discard_new = self.unit_of_work.discard_new
+        batch_key: tuple[Type[Model], tuple[str, ...]] | None = None
+        batch: list[tuple[Model, list[Any]]] = []
+
+        def flush_batch() -> None:
+            if batch_key is None or not batch:
+                return
+            model, columns = batch_key
+            sql = self._insert_sql(model, columns)
+            if len(batch) == 1:
+                self.execute(sql, batch[0][1])
+            else:
+                self.executemany(sql, [params for _, params in batch])
+            for queued, _ in batch:
+                self._finish_insert(queued)
+                discard_new(queued)
+            batch.clear()
+
+        for instance in instances:
+            columns, params = self._prepare_insert(instance)
+            meta = instance._meta
+            pk_field = meta.primary_key
+            if pk_field is not None and meta.columns[pk_field._name] not in columns:
+                flush_batch()
+                cursor = self.execute(
+                    self._insert_sql(type(instance), columns, returning=True), params
+                )
+                self._assign_generated_pk(instance, cursor)
+                self._finish_insert(instance)
+                discard_new(instance)
+                continue
+            key = (type(instance), columns)
+            if key != batch_key:
+                flush_batch()
+                batch_key = key
+            batch.append((instance, params))
+        flush_batch()
+
+    def _prevalidate(self, instance: Model, *, created: bool) -> None:
+        """
+        Run validation and the ``before_save`` hooks, skipping events without handlers
+        and, for models that need no more than a null check, ``full_clean`` itself.
+        """
+
+        hooks = self.hooks
+        model = type(instance)
+        if hooks.has("before_validate", model):
+            hooks.fire("before_validate", instance, session=self)
+        required = instance._meta.required_only
+        if required is None:
+            instance.full_clean()
+        else:
+            values = instance._field_values
+            for name in required:
+                if values.get(name) is None and getattr(instance, name, None) is None:
+                    # Let the pipeline build the usual aggregated ValidationError.
+                    instance.full_clean()
+                    break
+        if hooks.has("after_validate", model):
+            hooks.fire("after_validate", instance, session=self)
+        if hooks.has("before_save", model):
+            hooks.fire("before_save", instance, session=self, created=created)
+
+    def _prepare_insert(self, instance: Model) -> tuple[tuple[str, ...], list[Any]]:
+        self._prevalidate(instance, created=True)
         columns = []
         params = []
-        for field in instance._meta.get_fields():
-            field_name = field.require_name()
-            if field.primary_key and getattr(instance, field_name, None) is None:
+        meta = instance._meta
+        # Column names come from ``_meta`` so per-row work stays free of quoting and
+        # ``column_name()`` calls; the cached template holds the quoted SQL.
+        for field, column, convert, raw_value in zip(
+            meta.field_list, meta.column_names, meta.db_converters, meta.values_getter(instance)
+        ):
+            if field.primary_key and raw_value is None:
                 continue
-            raw_value = getattr(instance, field_name, None)
-            value = self._normalize_db_value(field, raw_value)
-            columns.append(self.dialect.quote_identifier(field.column_name()))
-            params.append(value)
-
-        placeholders = ", ".join(self.dialect.parameter_placeholder() for _ in columns)
-        columns_sql = ", ".join(columns)
-        sql = f"INSERT INTO {table} ({columns_sql}) VALUES ({placeholders})"
-        cursor = self.execute(sql, params)
+            columns.append(column)
+            params.append(raw_value if convert is None else convert(raw_value))
+        return tuple(columns), params
 
+    def _assign_generated_pk(self, instance: Model, cursor: Cursor) -> None:
         pk_field = instance._meta.primary_key
         if pk_field and getattr(instance, pk_field.require_name(), None) is None:
             pk_name = pk_field.require_name()
             pk_value = self.adapter.last_insert_id(cursor, instance._meta.table_name, pk_name)
             setattr(instance, pk_name, pk_value)
 
-        instance._initial_state = dict(instance._field_values)
+    def _track(self, instance: Model) -> None:
+        """
+        Add ``instance`` to the identity map and point its dirty notifications at this
+        session's unit of work.
+        """
+
         self.identity_map.add(instance)
-        self.hooks.fire("after_save", instance, session=self, created=True)
+        instance._uow_ref = self._uow_ref
+
+    def _finish_insert(self, instance: Model) -> None:
+        instance._mark_clean()
+        self._track(instance)
+        if self.hooks.has("after_save", type(instance)):
+            self.hooks.fire("after_save", instance, session=self, created=True)
         self._cache_instance(instance)
 
     def _persist_dirty(self, instance: Model) -> None:
-        self.hooks.fire("before_validate", instance, session=self)
-        instance.full_clean()
-        self.hooks.fire("after_validate", instance, session=self)
-        self.hooks.fire("before_save", instance, session=self, created=False)
+        self._prevalidate(instance, created=False)
         pk_field = instance._meta.primary_key
         if pk_field is None:
             raise ValueError(f"Model '{instance.__class__.__name__}' lacks a primary key.")
@@ -360,49 +592,158 @@ class Session:
         if pk_value is None:
             raise ValueError("Dirty instance missing primary key value.")
 
-        set_clauses = []
+        columns = []
         params = []
-        for field in instance._meta.get_fields():
-            if field.primary_key:
-                continue
-            field_name = field.require_name()
-            raw_value = getattr(instance, field_name)
-            value = self._normalize_db_value(field, raw_value)
-            initial_value = instance._initial_state.get(field_name)
-            if value != initial_value:
-                set_clauses.append(
-                    f"{self.dialect.quote_identifier(field.column_name())} = {self.dialect.parameter_placeholder()}"
-                )
-                params.append(value)
+        # Field.__set__ keeps ``_dirty`` exact (names leave it when reset to their
+        # snapshot value), so only those fields are read; declaration order keeps the
+        # UPDATE template cache key stable.
+        dirty = instance._dirty
+        if dirty:
+            values = instance._field_values
+            meta = instance._meta
+            for field, column, convert in zip(
+                meta.field_list, meta.column_names, meta.db_converters
+            ):
+                field_name = field._name
+                if field_name in dirty and not field.primary_key:
+                    value = values[field_name]
+                    columns.append(column)
+                    params.append(value if convert is None else convert(value))
 
-        if not set_clauses:
+        if not columns:
             return
 
-        table = self.dialect.format_table(instance._meta.table_name)
-        set_sql = ", ".join(set_clauses)
-        pk_clause = f"{self.dialect.quote_identifier(pk_field.column_name())} = {self.dialect.parameter_placeholder()}"
         params.append(pk_value)
-        sql = f"UPDATE {table} SET {set_sql} WHERE {pk_clause}"
-        self.execute(sql, params)
-        instance._initial_state = dict(instance._field_values)
-        self.hooks.fire("after_save", instance, session=self, created=False)
+        self.execute(self._update_sql(type(instance), tuple(columns)), params)
+        instance._mark_clean()
+        if self.hooks.has("after_save", type(instance)):
+            self.hooks.fire("after_save", instance, session=self, created=False)
         self._cache_instance(instance)
 
-    def _persist_deleted(self, instance: Model) -> None:
-        pk_field = instance._meta.primary_key
+    def _delete_instances(self, model: Type[Model], instances: list[Model]) -> None:
+        """
+        Delete ``instances`` of ``model`` with ``IN`` statements chunked to the dialect's
+        parameter limit. Instances without a primary key were never stored and are
+        dropped from the unit of work without a query.
+        """
+
+        pk_field = model._meta.primary_key
         if pk_field is None:
-            raise ValueError(f"Model '{instance.__class__.__name__}' lacks a primary key.")
-        pk_value = getattr(instance, pk_field.require_name())
-        if pk_value is None:
+            raise ValueError(f"Model '{model.__name__}' lacks a primary key.")
+        pk_name = pk_field.require_name()
+        discard_deleted = self.unit_of_work.discard_deleted
+        targets: list[Model] = []
+        for instance in instances:
+            if getattr(instance, pk_name) is None:
+                discard_deleted(instance)
+            else:
+                targets.append(instance)
+        if not targets:
             return
-        self.hooks.fire("before_delete", instance, session=self)
-        table = self.dialect.format_table(instance._meta.table_name)
-        pk_clause = f"{self.dialect.quote_identifier(pk_field.column_name())} = {self.dialect.parameter_placeholder()}"
-        sql = f"DELETE FROM {table} WHERE {pk_clause}"
-        self.execute(sql, (pk_value,))
-        self.identity_map.remove(instance)
-        self.hooks.fire("after_delete", instance, session=self)
-        self._invalidate_cache(instance)
+
+        prefix = self._delete_in_prefix(model)
+        placeholder = self.dialect.PARAM
+        chunk_size = self.dialect.capabilities.max_parameters or len(targets)
+        for start in range(0, len(targets), chunk_size):
+            chunk = targets[start : start + chunk_size]
+            for instance in chunk:
+                self.hooks.fire("before_delete", instance, session=self)
+            sql = f"{prefix}{', '.join(placeholder for _ in chunk)})"
+            self.execute(sql, [getattr(instance, pk_name) for instance in chunk])
+            for instance in chunk:
+                self.identity_map.remove(instance)
+                self.hooks.fire("after_delete", instance, session=self)
+                self._invalidate_cache(instance)
+                discard_deleted(instance)
+
+    # SQL templates ---------------------------------------------------- #
+    def _select_sql(self, model: Type[Model], column: str) -> str:
+        dialect = self.dialect
+
+        def build() -> str:
+            select_list = ", ".join(map(dialect.quote_identifier, model._meta.columns.values()))
+            return (
+                f"SELECT {select_list} FROM {dialect.format_table(model._meta.table_name)} "
+                f"WHERE {dialect.quote_identifier(column)} = {dialect.PARAM} "
+                "LIMIT 1"
+            )
+
+        return model._meta.cached_sql((type(dialect), "select", column), build)
+
+    def _select_in_prefix(self, model: Type[Model], column: str) -> str:
+        dialect = self.dialect
+
+        def build() -> str:
+            select_list = ", ".join(map(dialect.quote_identifier, model._meta.columns.values()))
+            return (
+                f"SELECT {select_list} FROM {dialect.format_table(model._meta.table_name)} "
+                f"WHERE {dialect.quote_identifier(column)} IN ("
+            )
+
+        return model._meta.cached_sql((type(dialect), "select_in", column), build)
+
+    def _insert_sql(
+        self, model: Type[Model], columns: tuple[str, ...], *, returning: bool = False
+    ) -> str:
+        """
+        Render an INSERT for ``columns``.
+
+        With ``returning`` set and a dialect that supports it, the primary key is
+        returned by the statement itself so ``last_insert_id`` can read it from the
+        same cursor.
+        """
+
+        dialect = self.dialect
+        pk_field = model._meta.primary_key
+        returning_column = (
+            pk_field.column_name()
+            if returning and pk_field is not None and dialect.capabilities.supports_returning
+            else None
+        )
+
+        def build() -> str:
+            columns_sql = ", ".join(dialect.quote_identifier(column) for column in columns)
+            placeholders = ", ".join([dialect.PARAM] * len(columns))
+            table = dialect.format_table(model._meta.table_name)
+            sql = f"INSERT INTO {table} ({columns_sql}) VALUES ({placeholders})"
+            if returning_column is not None:
+                sql += f" RETURNING {dialect.quote_identifier(returning_column)}"
+            return sql
+
+        return model._meta.cached_sql((type(dialect), "insert", columns, returning_column), build)
+
+    def _update_sql(self, model: Type[Model], columns: tuple[str, ...]) -> str:
+        dialect = self.dialect
+        pk_field = model._meta.primary_key
+        if pk_field is None:
+            raise ValueError(f"Model '{model.__name__}' lacks a primary key.")
+        pk_column = pk_field.column_name()
+
+        def build() -> str:
+            table = dialect.format_table(model._meta.table_name)
+            set_sql = ", ".join(
+                f"{dialect.quote_identifier(column)} = {dialect.PARAM}" for column in columns
+            )
+            return (
+                f"UPDATE {table} SET {set_sql} WHERE "
+                f"{dialect.quote_identifier(pk_column)} = {dialect.PARAM}"
+            )
+
+        # Keyed by the changed columns: updates usually touch a few recurring combinations.
+        return model._meta.cached_sql((type(dialect), "update", columns), build)
+
+    def _delete_in_prefix(self, model: Type[Model]) -> str:
+        dialect = self.dialect
+        pk_field = model._meta.primary_key
+        if pk_field is None:
+            raise ValueError(f"Model '{model.__name__}' lacks a primary key.")
+        pk_column = pk_field.column_name()
+
+        def build() -> str:
+            table = dialect.format_table(model._meta.table_name)
+            return f"DELETE FROM {table} WHERE {dialect.quote_identifier(pk_column)} IN ("
+
+        return model._meta.cached_sql((type(dialect), "delete_in"), build)
 
     @staticmethod
     def _redact(params: Iterable[Any]) -> list[Any]:
@@ -462,27 +803,30 @@ class Session:
             self.adapter.connect(self.connection_config)
 
     @staticmethod
-    def _row_to_dict(cursor: Cursor, row: Any) -> dict[str, Any]:
-        if hasattr(row, "keys"):
-            return dict(row)
+    def _rows_to_dicts(cursor: Cursor, rows: Sequence[Any]) -> list[dict[str, Any]]:
+        """
+        Map a fetched result set to dicts, reading the column names once per cursor.
+        """
+
+        if not rows:
+            return []
+        if hasattr(rows[0], "keys"):
+            return [dict(row) for row in rows]
         if hasattr(cursor, "description"):
-            columns = [col[0] for col in cursor.description]
-            return {col: row[idx] for idx, col in enumerate(columns)}
+            columns = tuple(col[0] for col in cursor.description)
+            return [dict(zip(columns, row)) for row in rows]
         raise ValueError("Unable to map database row to dictionary.")
 
+    def _materialize_many(self, model: Type[Model], cursor: Cursor) -> list[Model]:
+        materialize = self._materialize
+        return [materialize(model, data) for data in self._rows_to_dicts(cursor, cursor.fetchall())]
+
     @staticmethod
     def current() -> "Session | None":
         """
         Return the current session bound in the execution context, if any.
         """
 
+        if _THREAD_LOCAL_MODE:
+            return getattr(_current_session_tls, "value", None) or _current_session.get()
         return _current_session.get()
-
-    @staticmethod
-    def _normalize_db_value(field, value: Any) -> Any:
-        from ..core.relations import RelatedField
-
-        if isinstance(field, RelatedField) and value is not None:
-            if hasattr(value, "pk"):
-                return value.pk
-        return value
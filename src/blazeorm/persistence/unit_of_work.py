@@ -4,7 +4,7 @@ Unit of Work implementation batching persistence operations.
 
 from __future__ import annotations
 
-from typing import Iterable, Set
+from typing import Iterable, List, Set, Tuple
 
 from ..core.model import Model
 
@@ -12,32 +12,120 @@ from ..core.model import Model
 class UnitOfWork:
     """
     Tracks new, dirty, and deleted objects within a session.
+
+    While a savepoint is open every membership change is appended to an undo journal,
+    so opening one is O(1) and rolling back replays only the changes made since;
+    mutate the sets through the methods below so the journal stays complete.
     """
 
     def __init__(self) -> None:
         self.new: Set[Model] = set()
         self.dirty: Set[Model] = set()
         self.deleted: Set[Model] = set()
+        # (bucket, instance, added) per change made while a savepoint is open.
+        self._undo_log: List[Tuple[Set[Model], Model, bool]] = []
+        self._savepoints: List[int] = []
+        # Instances that became dirty since the last flush, pushed by field setters.
+        self._touched: Set[Model] = set()
 
     # Registration methods ----------------------------------------------
     def register_new(self, instance: Model) -> None:
-        self.new.add(instance)
+        self._add(self.new, instance)
 
     def register_dirty(self, instance: Model) -> None:
         if instance not in self.new:
-            self.dirty.add(instance)
+            self._add(self.dirty, instance)
 
     def register_deleted(self, instance: Model) -> None:
-        self.new.discard(instance)
-        self.dirty.discard(instance)
-        self.deleted.add(instance)
+        self._discard(self.new, instance)
+        self._discard(self.dirty, instance)
+        self._add(self.deleted, instance)
 
     def collect_dirty(self, candidates: Iterable[Model]) -> None:
         for instance in candidates:
             if instance not in self.new and instance.is_dirty():
                 self.register_dirty(instance)
 
+    def touch(self, instance: Model) -> None:
+        self._touched.add(instance)
+
+    def take_touched(self) -> Set[Model]:
+        touched, self._touched = self._touched, set()
+        return touched
+
+    def discard_new(self, instance: Model) -> None:
+        self._discard(self.new, instance)
+
+    def discard_dirty(self, instance: Model) -> None:
+        self._discard(self.dirty, instance)
+
+    def discard_deleted(self, instance: Model) -> None:
+        self._discard(self.deleted, instance)
+
     def clear(self) -> None:
         self.new.clear()
         self.dirty.clear()
         self.deleted.clear()
+        self._touched.clear()
+        self._undo_log.clear()
+        self._savepoints.clear()
+
+    # Savepoints --------------------------------------------------------
+    def savepoint(self) -> None:
+        self._savepoints.append(len(self._undo_log))
+
+    def release_savepoint(self) -> None:
+        """
+        Keep the changes made since the innermost savepoint.
+        """
+
+        if self._savepoints:
+            self._savepoints.pop()
+        if not self._savepoints:
+            self._undo_log.clear()
+
+    def rollback_savepoint(self) -> None:
+        """
+        Undo the changes made since the innermost savepoint; without one, forget
+        everything tracked.
+        """
+
+        if not self._savepoints:
+            # Instances dropped here may still hold unsaved changes; keep them as flush
+            # candidates so the next flush re-checks them.
+            touched = self._touched | self.dirty
+            self.clear()
+            self._touched = touched
+            return
+        mark = self._savepoints.pop()
+        log = self._undo_log
+        dirty = self.dirty
+        for bucket, instance, added in reversed(log[mark:]):
+            if added:
+                bucket.discard(instance)
+                if bucket is dirty:
+                    self._touched.add(instance)
+            else:
+                bucket.add(instance)
+        del log[mark:]
+        if not self._savepoints:
+            log.clear()
+
+    def discard_savepoints(self) -> None:
+        self._savepoints.clear()
+        self._undo_log.clear()
+
+    # Internal ----------------------------------------------------------
+    def _add(self, bucket: Set[Model], instance: Model) -> None:
+        if instance in bucket:
+            return
+        bucket.add(instance)
+        if self._savepoints:
+            self._undo_log.append((bucket, instance, True))
+
+    def _discard(self, bucket: Set[Model], instance: Model) -> None:
+        if instance not in bucket:
+            return
+        bucket.discard(instance)
+        if self._savepoints:
+            self._undo_log.append((bucket, instance, False))
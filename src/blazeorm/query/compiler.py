@@ -39,6 +39,7 @@ class SQLCompiler:
         limit: int | None = None,
         offset: int | None = None,
         select_related: Tuple[str, ...] = (),
+        columns: Tuple[str, ...] = (),
     ) -> None:
         self.model = model
         self.dialect = dialect
@@ -47,11 +48,13 @@ class SQLCompiler:
         self.limit = limit
         self.offset = offset
         self.select_related = select_related
+        self.columns = columns
 
     def compile(self) -> Tuple[str, List[Any]]:
         select_list = self._build_select_list()
         sql_parts: List[str] = [f"SELECT {select_list}", "FROM", self._table_for_model(self.model)]
-        sql_parts.extend(self._build_select_related_joins())
+        if not self.columns:
+            sql_parts.extend(self._build_select_related_joins())
         params: List[Any] = []
 
         if self.where and not self.where.is_empty():
@@ -74,16 +77,40 @@ class SQLCompiler:
 
     # Helpers -----------------------------------------------------------
     def _table_for_model(self, model: type["Model"]) -> str:
-        return self.dialect.format_table(model._meta.table_name)
+        dialect = self.dialect
+        meta = model._meta
+        # Quoted names are fixed per model and dialect, so render them once.
+        return meta.cached_sql(
+            (type(dialect), "table"), lambda: dialect.format_table(meta.table_name)
+        )
 
     def _qualified(self, table: str, column: str) -> str:
         return f"{table}.{self.dialect.quote_identifier(column)}"
 
+    def _column_ref(self, column: str) -> str:
+        # Joined queries must qualify base columns; related tables usually share names like "id".
+        if self.select_related and not self.columns:
+            return self._qualified(self._table_for_model(self.model), column)
+        return self.dialect.quote_identifier(column)
+
     def _build_select_list(self) -> str:
         columns: List[str] = []
         base_table = self._table_for_model(self.model)
-        for field in self.model._meta.get_fields():
-            columns.append(self._qualified(base_table, field.column_name()))
+        if self.columns:
+            # Explicit projections (values_list) skip related columns entirely.
+            return ", ".join(
+                self._qualified(base_table, self.model._meta.get_field(name).column_name())
+                for name in self.columns
+            )
+        meta = self.model._meta
+        columns.append(
+            meta.cached_sql(
+                (type(self.dialect), "select_columns"),
+                lambda: ", ".join(
+                    self._qualified(base_table, column) for column in meta.columns.values()
+                ),
+            )
+        )
 
         for path in self.select_related:
             related_model = self._get_related_model(path)
@@ -145,7 +172,7 @@ class SQLCompiler:
         descending = field_name.startswith("-")
         name = field_name[1:] if descending else field_name
         field = self.model._meta.get_field(name)
-        clause = self.dialect.quote_identifier(field.column_name())
+        clause = self._column_ref(field.column_name())
         if descending:
             clause += " DESC"
         return clause
@@ -185,7 +212,7 @@ class SQLCompiler:
             field_name, lookup = field_lookup, "exact"
 
         field = self.model._meta.get_field(field_name)
-        column = self.dialect.quote_identifier(field.column_name())
+        column = self._column_ref(field.column_name())
 
         if value is None:
             if lookup != "exact":
@@ -196,7 +223,7 @@ class SQLCompiler:
         if operator is None:
             raise ValueError(f"Unsupported lookup '{lookup}'")
 
-        placeholder = self.dialect.parameter_placeholder()
+        placeholder = self.dialect.PARAM
         if lookup == "contains":
             value = f"%{value}%"
         if lookup == "iexact":
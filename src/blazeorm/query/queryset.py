@@ -7,7 +7,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple
 
 from ..adapters.base import Cursor
-from ..core.relations import ManyToManyField, RelatedField, relation_registry
+from ..core.relations import (
+    ManyToManyField,
+    ManyToManyManager,
+    RelatedField,
+    RelatedManager,
+    relation_registry,
+)
 from ..dialects.sqlite import SQLiteDialect
 from .compiler import SQLCompiler
 from .expressions import Q
@@ -78,7 +84,60 @@ class QuerySet:
         return self._clone(prefetch_related=combined)
 
     def to_sql(self) -> tuple[str, list[Any]]:
-        compiler = SQLCompiler(
+        return self._compiler().compile()
+
+    def values_list(self, *fields: str, flat: bool = False) -> list[Any]:
+        """
+        Execute the query and return raw field values instead of model instances.
+
+        Rows come back as tuples ordered like ``fields`` (all fields when omitted), or
+        as bare values with ``flat=True`` and a single field. Values are coerced with
+        each field's ``to_python`` but no instances, identity-map entries, or cache
+        payloads are created, which keeps aggregation over large result sets cheap.
+        """
+
+        names = fields or self.model._meta.field_names
+        if flat and len(names) != 1:
+            raise ValueError("values_list(flat=True) requires exactly one field.")
+        model_fields = [self.model._meta.get_field(name) for name in names]
+        session = self._resolve_session()
+        sql, params = self._compiler(columns=tuple(names)).compile()
+        rows = session.execute(sql, params).fetchall()
+        if flat:
+            return model_fields[0].to_python_many([row[0] for row in rows])
+        if not rows:
+            return []
+        # Convert column by column so each field coerces its values in one call.
+        columns = [field.to_python_many(column) for field, column in zip(model_fields, zip(*rows))]
+        return list(zip(*columns))
+
+    # Iteration placeholder (will integrate with persistence later)
+    def __iter__(self) -> Iterable["Model"]:
+        session = self._resolve_session()
+        sql, params = self.to_sql()
+        cursor = session.execute(sql, params)
+        rows = cursor.fetchall()
+        instances: list["Model"] = []
+        if not rows:
+            return iter(instances)
+        # Resolve column positions once per query instead of re-keying every row.
+        base_slots, related_slots = self._column_layout(cursor)
+        for row in rows:
+            base_data = {name: row[idx] for idx, name in base_slots}
+            related_chunks: dict[str, dict[str, Any]] = {}
+            for idx, path, column in related_slots:
+                related_chunks.setdefault(path, {})[column] = row[idx]
+            instance = session._materialize(self.model, base_data)
+            if self._select_related:
+                self._hydrate_select_related(session, instance, related_chunks)
+            instances.append(instance)
+        if self._prefetch_related:
+            self._prefetch_related_data(session, instances)
+        return iter(instances)
+
+    # Internal helpers --------------------------------------------------
+    def _compiler(self, columns: Tuple[str, ...] = ()) -> SQLCompiler:
+        return SQLCompiler(
             model=self.model,
             dialect=self.dialect,
             where=self._where,
@@ -86,11 +145,10 @@ class QuerySet:
             limit=self._limit,
             offset=self._offset,
             select_related=self._select_related,
+            columns=columns,
         )
-        return compiler.compile()
 
-    # Iteration placeholder (will integrate with persistence later)
-    def __iter__(self) -> Iterable["Model"]:
+    def _resolve_session(self) -> "Session":
         session = self._session
         if session is None:
             from ..persistence.session import Session as SessionCls
@@ -100,22 +158,8 @@ class QuerySet:
             raise RuntimeError(
                 "QuerySet iteration requires a bound Session. Use Session.query(model) or iterate within an active Session context."
             )
-        sql, params = self.to_sql()
-        cursor = session.execute(sql, params)
-        rows = cursor.fetchall()
-        instances = []
-        for row in rows:
-            data = self._row_to_dict(cursor, row)
-            base_data, related_chunks = self._split_related_data(data)
-            instance = session._materialize(self.model, base_data)
-            if self._select_related:
-                self._hydrate_select_related(session, instance, related_chunks)
-            instances.append(instance)
-        if self._prefetch_related:
-            self._prefetch_related_data(session, instances)
-        return iter(instances)
+        return session
 
-    # Internal helpers --------------------------------------------------
     def _add_q(self, q_object: Q) -> Q:
         if self._where.is_empty():
             return q_object
@@ -135,30 +179,20 @@ class QuerySet:
         }
         return QuerySet(**params)
 
-    @staticmethod
-    def _row_to_dict(cursor: Cursor, row: Any) -> dict[str, Any]:
-        if hasattr(row, "keys"):
-            return dict(row)
-        if hasattr(cursor, "description"):
-            columns = [col[0] for col in cursor.description]
-            return {col: row[idx] for idx, col in enumerate(columns)}
-        raise ValueError("Unable to map database row to dictionary.")
-
-    def _split_related_data(
-        self, data: dict[str, Any]
-    ) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
-        base_data: dict[str, Any] = {}
-        related_chunks: dict[str, dict[str, Any]] = {}
-        base_columns = {
-            field.column_name(): field.require_name() for field in self.model._meta.get_fields()
-        }
-        for key, value in data.items():
+    def _column_layout(
+        self, cursor: Cursor
+    ) -> tuple[list[tuple[int, str]], list[tuple[int, str, str]]]:
+        base_columns = self.model._meta.column_to_field
+        base_slots: list[tuple[int, str]] = []
+        related_slots: list[tuple[int, str, str]] = []
+        for idx, description in enumerate(cursor.description):
+            key = description[0]
             if key in base_columns:
-                base_data[base_columns[key]] = value
+                base_slots.append((idx, base_columns[key]))
             elif "__" in key:
                 path, column = key.split("__", 1)
-                related_chunks.setdefault(path, {})[column] = value
-        return base_data, related_chunks
+                related_slots.append((idx, path, column))
+        return base_slots, related_slots
 
     def _hydrate_select_related(
         self,
@@ -168,7 +202,7 @@ class QuerySet:
     ) -> None:
         for path in self._select_related:
             field = self._get_relation_field(self.model, path)
-            field_name = field.require_name()
+            field_name = field._name
             related_model = field.remote_model
             if related_model is None:
                 continue
@@ -177,7 +211,7 @@ class QuerySet:
                 setattr(instance, field_name, None)
                 continue
             pk_field = related_model._meta.primary_key
-            if pk_field and related_data.get(pk_field.require_name()) is None:
+            if pk_field and related_data.get(pk_field._name) is None:
                 setattr(instance, field_name, None)
                 continue
             related_instance = session._materialize(related_model, related_data)
@@ -195,7 +229,7 @@ class QuerySet:
                     value = getattr(obj, head, None)
                     if value is None:
                         continue
-                    if isinstance(value, list):
+                    if isinstance(value, (list, ManyToManyManager)):
                         children.extend(value)
                     else:
                         children.append(value)
@@ -243,34 +277,9 @@ class QuerySet:
                 session, instances, related_model, field, relation, current_model=self.model
             )
             return
-        pk_field = self.model._meta.primary_key
-        if pk_field is None:
-            return
-        pk_name = pk_field.require_name()
-        parent_pks = [
-            getattr(obj, pk_name) for obj in instances if getattr(obj, pk_name) is not None
-        ]
-        if not parent_pks:
-            return
-        placeholders = ", ".join(session.dialect.parameter_placeholder() for _ in parent_pks)
-        table = session.dialect.format_table(related_model._meta.table_name)
-        fk_column = session.dialect.quote_identifier(field.column_name())
-        select_list = ", ".join(
-            session.dialect.quote_identifier(f.column_name())
-            for f in related_model._meta.get_fields()
+        RelatedManager.prefetch(
+            related_model, field, instances, accessor_name=relation, session=session
         )
-        sql = f"SELECT {select_list} FROM {table} WHERE {fk_column} IN ({placeholders})"
-        cursor = session.execute(sql, parent_pks)
-        rows = cursor.fetchall()
-        bucket: dict[Any, list[Any]] = {pk: [] for pk in parent_pks}
-        for row in rows:
-            row_data = self._row_to_dict(cursor, row)
-            child = session._materialize(related_model, row_data)
-            parent_key = row_data.get(field.column_name())
-            bucket.setdefault(parent_key, []).append(child)
-        for obj in instances:
-            parent_pk = getattr(obj, pk_name)
-            setattr(obj, relation, bucket.get(parent_pk, []))
 
     def _prefetch_forward(
         self, session: "Session", instances: list["Model"], relation: str
@@ -291,27 +300,8 @@ class QuerySet:
                 fk_values.append(val)
         if not fk_values:
             return
-        placeholders = ", ".join(session.dialect.parameter_placeholder() for _ in fk_values)
-        table = session.dialect.format_table(remote_model._meta.table_name)
-        pk_field = remote_model._meta.primary_key
-        pk_column = (
-            session.dialect.quote_identifier(pk_field.column_name())
-            if pk_field
-            else session.dialect.quote_identifier("id")
-        )
-        select_list = ", ".join(
-            session.dialect.quote_identifier(f.column_name())
-            for f in remote_model._meta.get_fields()
-        )
-        sql = f"SELECT {select_list} FROM {table} WHERE {pk_column} IN ({placeholders})"
-        cursor = session.execute(sql, fk_values)
-        rows = cursor.fetchall()
-        related_map: dict[Any, Any] = {}
-        for row in rows:
-            row_data = self._row_to_dict(cursor, row)
-            related_instance = session._materialize(remote_model, row_data)
-            if pk_field is not None:
-                related_map[row_data.get(pk_field.require_name())] = related_instance
+        # get_many dedupes keys, serves identity-map hits, and chunks the IN list.
+        related_map = session.get_many(remote_model, fk_values)
         for obj in instances:
             fk_val = getattr(obj, field_name)
             if hasattr(fk_val, "pk"):
@@ -351,7 +341,7 @@ class QuerySet:
         )
         parent_col = session.dialect.quote_identifier(parent_col_raw)
         related_col = session.dialect.quote_identifier(related_col_raw)
-        placeholders = ", ".join(session.dialect.parameter_placeholder() for _ in parent_pks)
+        placeholders = ", ".join([session.dialect.PARAM] * len(parent_pks))
         junction_sql = f"SELECT {parent_col} AS parent_id, {related_col} AS related_id FROM {through} WHERE {parent_col} IN ({placeholders})"
         cursor = session.execute(junction_sql, parent_pks)
         rows = cursor.fetchall()
@@ -361,9 +351,7 @@ class QuerySet:
             return
         related_ids = [row["related_id"] if hasattr(row, "keys") else row[1] for row in rows]
         unique_related_ids = list(dict.fromkeys(related_ids))
-        placeholders_rel = ", ".join(
-            session.dialect.parameter_placeholder() for _ in unique_related_ids
-        )
+        placeholders_rel = ", ".join([session.dialect.PARAM] * len(unique_related_ids))
         table = session.dialect.format_table(related_model._meta.table_name)
         select_list = ", ".join(
             session.dialect.quote_identifier(f.column_name())
@@ -375,10 +363,8 @@ class QuerySet:
             f"SELECT {select_list} FROM {table} WHERE {session.dialect.quote_identifier(related_pk_column)} IN ({placeholders_rel})",
             unique_related_ids,
         )
-        related_rows = related_cursor.fetchall()
         related_map: dict[Any, Any] = {}
-        for row in related_rows:
-            data = self._row_to_dict(related_cursor, row)
+        for data in session._rows_to_dicts(related_cursor, related_cursor.fetchall()):
             instance = session._materialize(related_model, data)
             pk_val = data.get(related_pk_column)
             related_map[pk_val] = instance
@@ -415,8 +401,6 @@ class QuerySet:
     def _find_reverse_relation(self, model: type["Model"], related_name: str):
         # Prefer the related accessor/manager on the model if present
         accessor = getattr(model, related_name, None)
-        from ..core.relations import RelatedField, RelatedManager
-
         if isinstance(accessor, RelatedManager) and isinstance(accessor.field, RelatedField):
             if accessor.field.remote_model is model:
                 return accessor.model, accessor.field
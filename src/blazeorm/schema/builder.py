@@ -22,6 +22,11 @@ class SchemaBuilder:
         self.logger = get_logger("schema.builder")
 
     def create_table_sql(self, model: type[Model]) -> str:
+        return model._meta.cached_sql(
+            (type(self.dialect), "create_table"), lambda: self._render_create_table(model)
+        )
+
+    def _render_create_table(self, model: type[Model]) -> str:
         columns_sql = self._render_columns(model)
         table_name = self.dialect.format_table(model._meta.table_name)
         column_list = ", ".join(columns_sql)
@@ -57,7 +57,7 @@ class MigrationEngine:
     def applied_migrations(self) -> List[tuple[str, str]]:
         table = self.dialect.format_table(self.version_table)
         cursor = self.adapter.execute(f"SELECT app, name FROM {table} ORDER BY applied_at")
-        return [(row["app"], row["name"]) for row in cursor.fetchall()]
+        return [(row[0], row[1]) for row in cursor.fetchall()]
 
     def apply(self, app: str, name: str, operations: Sequence[MigrationOperation]) -> None:
         with self._transaction():
@@ -92,7 +92,7 @@ class MigrationEngine:
     def _record_migration(self, app: str, name: str) -> None:
         table = self.dialect.format_table(self.version_table)
         timestamp = datetime.now(timezone.utc).isoformat()
-        placeholders = ", ".join(self.dialect.parameter_placeholder() for _ in range(3))
+        placeholders = ", ".join([self.dialect.PARAM] * 3)
         self.adapter.execute(
             f"INSERT INTO {table} (app, name, applied_at) VALUES ({placeholders})",
             (app, name, timestamp),
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from datetime import date, datetime, time
+from decimal import Decimal
 from typing import Any, Iterable
 
 REDACTED_VALUE = "***"
@@ -48,19 +51,22 @@ def _compact(value: str) -> str:
     return "".join(ch for ch in value if ch.isalnum())
 
 
+def _token_pattern(tokens: Iterable[str]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(token) for token in dict.fromkeys(tokens)), re.IGNORECASE)
+
+
+# A token found in the key is also found in its compacted form, so keys only need
+# the compact scan ("api-key" and "api_key" both compact to "apikey").
+_SENSITIVE_KEY_RE = _token_pattern(_compact(token) for token in _SENSITIVE_KEY_TOKENS)
+_SENSITIVE_VALUE_RE = _token_pattern(_SENSITIVE_VALUE_TOKENS)
+
+
 def is_sensitive_key(key: str) -> bool:
-    normalized = key.lower()
-    compact = _compact(normalized)
-    for token in _SENSITIVE_KEY_TOKENS:
-        token_compact = _compact(token)
-        if token in normalized or token_compact in compact:
-            return True
-    return False
+    return _SENSITIVE_KEY_RE.search(_compact(key)) is not None
 
 
 def is_sensitive_value(value: str) -> bool:
-    normalized = value.lower()
-    return any(token in normalized for token in _SENSITIVE_VALUE_TOKENS)
+    return _SENSITIVE_VALUE_RE.search(value) is not None
 
 
 def redact_query_params(query: dict[str, str]) -> dict[str, str]:
@@ -70,6 +76,8 @@ def redact_query_params(query: dict[str, str]) -> dict[str, str]:
 def redact_value(value: Any, *, key: str | None = None) -> Any:
     if key is not None and is_sensitive_key(str(key)):
         return REDACTED_VALUE
+    if isinstance(value, str):
+        return REDACTED_VALUE if is_sensitive_value(value) else value
     if isinstance(value, dict):
         return {k: redact_value(v, key=str(k)) for k, v in value.items()}
     if isinstance(value, tuple):
@@ -81,12 +89,27 @@ def redact_value(value: Any, *, key: str | None = None) -> Any:
         if decoded and is_sensitive_value(decoded):
             return REDACTED_VALUE
         return value
-    if isinstance(value, str):
-        if is_sensitive_value(value):
-            return REDACTED_VALUE
-        return value
     return value
 
 
+# Parameter types that can never carry a secret; checked by exact type so subclasses
+# still go through redact_value.
+_PASSTHROUGH_TYPES = frozenset({int, float, bool, type(None), Decimal, date, datetime, time})
+
+
 def redact_params(params: Iterable[Any]) -> list[Any]:
-    return [redact_value(value) for value in params]
+    # Redaction depends on each value, not its position, so it can't be cached per SQL
+    # statement; instead the common scalar and plain-string cases skip the call into
+    # redact_value.
+    search = _SENSITIVE_VALUE_RE.search
+    passthrough = _PASSTHROUGH_TYPES
+    redacted = []
+    for value in params:
+        value_type = type(value)
+        if value_type in passthrough:
+            redacted.append(value)
+        elif value_type is str:
+            redacted.append(REDACTED_VALUE if search(value) is not None else value)
+        else:
+            redacted.append(redact_value(value))
+    return redacted
@@ -49,27 +49,57 @@ def get_correlation_id() -> str:
     return cid
 
 
+class _Timer:
+    __slots__ = ("name", "logger", "sql", "params", "threshold_ms", "on_complete", "start")
+
+    def __init__(
+        self,
+        name: str,
+        logger: logging.Logger,
+        sql: str | None,
+        params: Iterable[Any] | Callable[[], Any] | None,
+        threshold_ms: int,
+        on_complete: Optional[Callable[[float], None]],
+    ) -> None:
+        self.name = name
+        self.logger = logger
+        self.sql = sql
+        self.params = params
+        self.threshold_ms = threshold_ms
+        self.on_complete = on_complete
+        self.start = time.monotonic()
+
+    def __enter__(self) -> "_Timer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed_ms = (time.monotonic() - self.start) * 1000
+        level = logging.WARNING if elapsed_ms >= self.threshold_ms else logging.DEBUG
+        logger = self.logger
+        if logger.isEnabledFor(level):
+            params = self.params
+            if callable(params):
+                params = params()
+            extra = {"sql": self.sql, "params": params, "elapsed_ms": elapsed_ms}
+            logger.log(level, "%s took %.2fms", self.name, elapsed_ms, extra=extra)
+        if self.on_complete and exc_type is None:
+            self.on_complete(elapsed_ms)
+
+
 def time_call(
     name: str,
     logger: logging.Logger,
     *,
     sql: str | None = None,
-    params: Iterable[Any] | None = None,
+    params: Iterable[Any] | Callable[[], Any] | None = None,
     threshold_ms: int = 100,
     on_complete: Optional[Callable[[float], None]] = None,
-):
-    start = time.monotonic()
-
-    class Timer:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            elapsed_ms = (time.monotonic() - start) * 1000
-            level = logging.WARNING if elapsed_ms >= threshold_ms else logging.DEBUG
-            extra = {"sql": sql, "params": params, "elapsed_ms": elapsed_ms}
-            logger.log(level, "%s took %.2fms", name, elapsed_ms, extra=extra)
-            if on_complete and exc_type is None:
-                on_complete(elapsed_ms)
-
-    return Timer()
+) -> _Timer:
+    """
+    Time the enclosed block and log it at DEBUG, or WARNING past ``threshold_ms``.
+
+    ``params`` may be a zero-argument callable; it is only invoked when the record
+    will actually be emitted, so callers can defer redaction work.
+    """
+
+    return _Timer(name, logger, sql, params, threshold_ms, on_complete)
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from dataclasses import dataclass, field
 from typing import List, Sequence
 
@@ -64,6 +65,9 @@ class QueryStat:
 class PerformanceTracker:
     """
     Tracks executed queries and emits warnings for potential N+1 patterns.
+
+    Guarded by its own lock, so statistics can be read while the owning session is
+    busy with a query.
     """
 
     def __init__(
@@ -78,36 +82,65 @@ class PerformanceTracker:
         self.sample_size = sample_size
         self.stats: dict[str, QueryStat] = {}
         self._reported: set[str] = set()
+        self._lock = threading.Lock()
 
     def record(self, sql: str, params: Sequence[object], elapsed_ms: float) -> None:
         normalized_sql = self._normalize_sql(sql)
         fingerprint = self._fingerprint(params)
-        stat = self.stats.setdefault(normalized_sql, QueryStat(sql=normalized_sql))
-        stat.record(fingerprint, elapsed_ms, sample_limit=self.sample_size)
-        if self._should_report(stat):
-            self._report(normalized_sql, stat)
+        with self._lock:
+            stat = self.stats.get(normalized_sql)
+            if stat is None:
+                stat = self.stats[normalized_sql] = QueryStat(sql=normalized_sql)
+            stat.record(fingerprint, elapsed_ms, sample_limit=self.sample_size)
+            report = self._should_report(stat)
+            if report:
+                self._reported.add(normalized_sql)
+                count, distinct = stat.count, len(stat.fingerprints)
+        if report:
+            self._report(normalized_sql, count, distinct)
 
     def summary(self) -> List[dict[str, object]]:
         return self.export()
 
-    def export(self, *, include_samples: bool = False) -> List[dict[str, object]]:
+    def export(
+        self, *, include_samples: bool = False, reset: bool = False
+    ) -> List[dict[str, object]]:
+        """
+        Return per-statement statistics; with ``reset`` they are cleared in the same step.
+        """
+
+        with self._lock:
+            rows = [
+                (
+                    stat.sql,
+                    stat.count,
+                    stat.total_ms,
+                    len(stat.fingerprints),
+                    list(stat.samples) if include_samples else None,
+                )
+                for stat in self.stats.values()
+            ]
+            if reset:
+                self.stats.clear()
+                self._reported.clear()
         payload: List[dict[str, object]] = []
-        for stat in self.stats.values():
+        for sql, count, total_ms, distinct, samples in rows:
             row = {
-                "sql": stat.sql,
-                "count": stat.count,
-                "total_ms": stat.total_ms,
-                "average_ms": stat.average_ms,
-                "distinct_params": len(stat.fingerprints),
+                "sql": sql,
+                "count": count,
+                "total_ms": total_ms,
+                "average_ms": total_ms / count if count else 0.0,
+                "distinct_params": distinct,
             }
             if include_samples:
-                row["samples"] = list(stat.samples)
+                row["samples"] = samples
             payload.append(row)
         return payload
 
     def reset(self) -> None:
-        self.stats.clear()
-        self._reported.clear()
+        with self._lock:
+            self.stats.clear()
+            self._reported.clear()
 
     def _should_report(self, stat: QueryStat) -> bool:
         if stat.count < self.n_plus_one_threshold:
@@ -118,14 +151,13 @@ class PerformanceTracker:
             return False
         return True
 
-    def _report(self, sql: str, stat: QueryStat) -> None:
-        self._reported.add(sql)
+    def _report(self, sql: str, count: int, distinct: int) -> None:
         self.logger.warning(
             "Potential N+1 detected for SQL '%s' (%s executions, %s distinct params)",
             self._abbreviate(sql),
-            stat.count,
-            len(stat.fingerprints),
-            extra={"sql": sql, "count": stat.count, "distinct_params": len(stat.fingerprints)},
+            count,
+            distinct,
+            extra={"sql": sql, "count": count, "distinct_params": distinct},
         )
 
     @staticmethod
@@ -1,7 +1,7 @@
 import pytest
 
 from blazeorm.adapters import AdapterConfigurationError, AdapterExecutionError, ConnectionConfig
-from blazeorm.adapters.mysql import MySQLAdapter
+from blazeorm.adapters.mysql import MySQLAdapter, _load_driver
 
 
 class FakeCursor:
@@ -124,3 +124,10 @@ def test_mysql_begin_respects_autocommit(fake_driver):
     adapter.begin()
     # When autocommit is true, begin should be a no-op
     assert not hasattr(fake_driver.connections[0], "cursor_called")
+
+
+def test_driver_lookup_is_cached():
+    _load_driver.cache_clear()
+    first = _load_driver()
+    assert _load_driver() is first
+    assert _load_driver.cache_info().hits == 1
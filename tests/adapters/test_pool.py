@@ -0,0 +1,121 @@
+import threading
+
+import pytest
+
+from blazeorm.adapters import AdapterConnectionError, AdapterPool, ConnectionConfig, SQLiteAdapter
+from blazeorm.core import Model, StringField
+from blazeorm.persistence import Session
+
+
+class PoolItem(Model):
+    name = StringField(nullable=False)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return ConnectionConfig(url=f"sqlite:///{tmp_path / 'pool.db'}")
+
+
+def test_pool_reuses_released_connections(config):
+    with AdapterPool(SQLiteAdapter, config, max_size=2) as pool:
+        first = pool.acquire()
+        underlying = first.connect(config)
+        first.close()
+        second = pool.acquire()
+        assert second.connect(config) is underlying
+        assert pool.size == 1
+        second.close()
+        assert pool.idle_count == 1
+
+
+def test_pool_times_out_when_exhausted(config):
+    with AdapterPool(SQLiteAdapter, config, max_size=1, timeout=0.05) as pool:
+        held = pool.acquire()
+        with pytest.raises(AdapterConnectionError):
+            pool.acquire()
+        held.close()
+        pool.acquire().close()
+
+
+def test_pool_recycles_after_max_queries(config):
+    with AdapterPool(SQLiteAdapter, config, max_queries=2) as pool:
+        pooled = pool.acquire()
+        original = pooled.connect(config)
+        pooled.execute("SELECT 1")
+        pooled.execute("SELECT 1")
+        pooled.close()
+        assert pool.size == 0
+        fresh = pool.acquire()
+        assert fresh.connect(config) is not original
+        fresh.close()
+
+
+def test_pool_rolls_back_open_transactions_on_release(config):
+    with AdapterPool(SQLiteAdapter, config, max_size=1) as pool:
+        setup = pool.acquire()
+        setup.execute("CREATE TABLE thing (id INTEGER PRIMARY KEY)")
+        setup.commit()
+        setup.begin()
+        setup.execute("INSERT INTO thing DEFAULT VALUES")
+        setup.close()
+        reader = pool.acquire()
+        assert reader.execute("SELECT COUNT(*) FROM thing").fetchone()[0] == 0
+        reader.close()
+
+
+def test_sessions_share_pool_across_threads(config):
+    with AdapterPool(SQLiteAdapter, config, max_size=3) as pool:
+        with Session(pool.acquire()) as session:
+            session.execute('CREATE TABLE "pool_item" (id INTEGER PRIMARY KEY, name TEXT NOT NULL)')
+        errors: list[Exception] = []
+
+        def worker(idx: int) -> None:
+            try:
+                for _ in range(5):
+                    with Session(pool.acquire()) as session:
+                        session.add(PoolItem(name=f"w{idx}"))
+            except Exception as exc:  # pragma: no cover - failure path
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert pool.size <= 3
+        with Session(pool.acquire()) as session:
+            assert session.execute('SELECT COUNT(*) FROM "pool_item"').fetchone()[0] == 30
+
+
+def test_pool_discards_connections_idle_past_lifetime(config, monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("blazeorm.adapters.pool.time.monotonic", lambda: clock[0])
+    with AdapterPool(SQLiteAdapter, config, max_inactive_lifetime=10) as pool:
+        pooled = pool.acquire()
+        stale = pooled.connect(config)
+        pooled.close()
+        clock[0] += 11
+        fresh = pool.acquire()
+        assert fresh.connect(config) is not stale
+        assert pool.size == 1
+        fresh.close()
+
+
+def test_closed_pool_refuses_checkouts(config):
+    pool = AdapterPool(SQLiteAdapter, config, min_size=2)
+    assert pool.idle_count == 2
+    pool.close()
+    assert pool.size == 0
+    with pytest.raises(AdapterConnectionError):
+        pool.acquire()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_size": 0}, {"min_size": 3, "max_size": 2}, {"max_queries": 0}],
+)
+def test_pool_validates_limits(config, kwargs):
+    with pytest.raises(ValueError):
+        AdapterPool(SQLiteAdapter, config, **kwargs)
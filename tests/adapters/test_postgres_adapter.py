@@ -1,7 +1,7 @@
 import pytest
 
 from blazeorm.adapters import AdapterConfigurationError, AdapterExecutionError, ConnectionConfig
-from blazeorm.adapters.postgres import PostgresAdapter
+from blazeorm.adapters.postgres import PostgresAdapter, _load_driver
 
 
 class FakeCursor:
@@ -25,6 +25,7 @@ class FakeCursor:
 class FakeConnection:
     def __init__(self):
         self.autocommit = False
+        self.prepare_threshold = 5
         self.closed = False
         self.cursor_calls = 0
 
@@ -129,3 +130,37 @@ def test_begin_respects_autocommit(fake_driver):
     adapter.begin()
     # autocommit: cursor should not be called
     assert fake_driver.connections[0].cursor_calls == 0
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        ("SELECT 1", 0),
+        ("SELECT * FROM t WHERE a = %s AND b = %s", 2),
+        ("SELECT '100%%' WHERE a = %s", 1),
+        ("SELECT '%%s' WHERE a = %s", 1),
+        ("SELECT %%%s", 1),
+    ],
+)
+def test_count_placeholders_skips_escaped_percent(sql, expected):
+    assert PostgresAdapter._count_placeholders(sql) == expected
+
+
+def test_driver_lookup_is_cached():
+    _load_driver.cache_clear()
+    first = _load_driver()
+    assert _load_driver() is first
+    assert _load_driver.cache_info().hits == 1
+
+
+def test_prepare_threshold_is_applied_to_connection(fake_driver):
+    adapter = PostgresAdapter(prepare_threshold=2)
+    connection = adapter.connect(ConnectionConfig.from_dsn("postgresql://localhost/db"))
+    assert connection.prepare_threshold == 2
+    disabled = PostgresAdapter(prepare_threshold=None)
+    assert (
+        disabled.connect(ConnectionConfig.from_dsn("postgresql://localhost/db")).prepare_threshold
+        is None
+    )
+    with pytest.raises(AdapterConfigurationError):
+        PostgresAdapter(prepare_threshold=-1)
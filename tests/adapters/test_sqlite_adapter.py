@@ -2,7 +2,13 @@ import sqlite3
 
 import pytest
 
-from blazeorm.adapters import AdapterExecutionError, ConnectionConfig, SQLiteAdapter
+from blazeorm.adapters import (
+    AdapterConfigurationError,
+    AdapterConnectionError,
+    AdapterExecutionError,
+    ConnectionConfig,
+    SQLiteAdapter,
+)
 
 
 @pytest.fixture
@@ -96,3 +102,143 @@ def test_adapter_slow_query_ms_override(monkeypatch):
     monkeypatch.setenv("BLAZE_SLOW_QUERY_MS", "175")
     adapter = SQLiteAdapter(slow_query_ms=90)
     assert adapter.slow_query_ms == 90
+
+
+def test_file_database_applies_default_pragmas(adapter):
+    journal_mode = adapter.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = adapter.execute("PRAGMA synchronous").fetchone()[0]
+    assert journal_mode.lower() == "wal"
+    assert synchronous == 1  # NORMAL
+
+
+def test_pragmas_can_be_overridden_or_disabled(tmp_path):
+    adapter = SQLiteAdapter(pragmas={"journal_mode": "DELETE", "mmap_size": None})
+    adapter.connect(ConnectionConfig(url=f"sqlite:///{tmp_path / 'pragmas.db'}"))
+    assert adapter.execute("PRAGMA journal_mode").fetchone()[0].lower() == "delete"
+    assert adapter.execute("PRAGMA mmap_size").fetchone()[0] == 0
+    adapter.close()
+
+
+def test_read_pool_serves_selects_outside_transactions(tmp_path):
+    adapter = SQLiteAdapter(read_pool_size=2)
+    adapter.connect(ConnectionConfig(url=f"sqlite:///{tmp_path / 'pool.db'}"))
+    adapter.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+    adapter.execute("INSERT INTO item (name) VALUES (?)", ("first",))
+    adapter.commit()
+
+    cursor = adapter.execute("SELECT name FROM item WHERE id = ?", (1,))
+    assert not isinstance(cursor, sqlite3.Cursor)
+    assert cursor.fetchone()["name"] == "first"
+
+    adapter.begin()
+    adapter.execute("INSERT INTO item (name) VALUES (?)", ("second",))
+    # Inside a write transaction reads stay on the writer to see pending rows.
+    cursor = adapter.execute("SELECT COUNT(*) FROM item")
+    assert isinstance(cursor, sqlite3.Cursor)
+    assert cursor.fetchone()[0] == 2
+    adapter.rollback()
+    adapter.close()
+
+
+def test_read_pool_is_skipped_for_memory_databases():
+    adapter = SQLiteAdapter(read_pool_size=2)
+    adapter.connect(ConnectionConfig(url="sqlite:///:memory:"))
+    cursor = adapter.execute("SELECT 1")
+    assert isinstance(cursor, sqlite3.Cursor)
+    adapter.close()
+
+
+def test_cached_statements_is_forwarded_to_connect(monkeypatch):
+    seen = {}
+    real_connect = sqlite3.connect
+
+    def spy_connect(*args, **kwargs):
+        seen.update(kwargs)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", spy_connect)
+    adapter = SQLiteAdapter(cached_statements=512)
+    adapter.connect(ConnectionConfig(url="sqlite:///:memory:"))
+    assert seen["cached_statements"] == 512
+    adapter.close()
+
+    with pytest.raises(AdapterConfigurationError):
+        SQLiteAdapter(cached_statements=-1)
+
+
+def test_periodic_checkpoint_and_optimize_on_close(tmp_path):
+    adapter = SQLiteAdapter(checkpoint_interval=2)
+    connection = adapter.connect(ConnectionConfig(url=f"sqlite:///{tmp_path / 'wal.db'}"))
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+    adapter.execute("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+    adapter.commit()
+    assert not any("wal_checkpoint" in sql for sql in statements)
+    adapter.execute("INSERT INTO item DEFAULT VALUES")
+    adapter.commit()
+    assert "PRAGMA wal_checkpoint(PASSIVE)" in statements
+
+    adapter.close()
+    assert "PRAGMA optimize" in statements
+    assert "PRAGMA wal_checkpoint(TRUNCATE)" in statements
+
+    with pytest.raises(AdapterConfigurationError):
+        SQLiteAdapter(checkpoint_interval=0)
+
+
+def test_executemany_batches_autocommit_rows_in_one_transaction():
+    adapter = SQLiteAdapter()
+    connection = adapter.connect(ConnectionConfig(url="sqlite:///:memory:", autocommit=True))
+    adapter.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+    adapter.executemany("INSERT INTO item (name) VALUES (?)", [("a",), ("b",), ("c",)])
+    assert statements[0] == "BEGIN"
+    assert statements[-1] == "COMMIT"
+    assert not connection.in_transaction
+    assert adapter.execute("SELECT COUNT(*) FROM item").fetchone()[0] == 3
+    adapter.close()
+
+
+def test_executemany_leaves_implicit_transactions_to_the_caller(tmp_path):
+    adapter = SQLiteAdapter()
+    adapter.connect(ConnectionConfig(url=f"sqlite:///{tmp_path / 'implicit.db'}"))
+    adapter.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+    adapter.commit()
+    adapter.executemany("INSERT INTO item (name) VALUES (?)", [("a",), ("b",)])
+    adapter.rollback()
+    assert adapter.execute("SELECT COUNT(*) FROM item").fetchone()[0] == 0
+    adapter.close()
+
+
+def test_execute_after_close_raises_connection_error():
+    adapter = SQLiteAdapter()
+    adapter.connect(ConnectionConfig(url="sqlite:///:memory:"))
+    adapter.close()
+    with pytest.raises(AdapterConnectionError):
+        adapter.execute("SELECT 1")
+
+
+def test_executemany_validates_generator_rows():
+    adapter = SQLiteAdapter()
+    adapter.connect(ConnectionConfig(url="sqlite:///:memory:", autocommit=True))
+    adapter.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+    adapter.executemany("INSERT INTO item (name) VALUES (?)", ((f"n{i}",) for i in range(5)))
+    assert adapter.execute("SELECT COUNT(*) FROM item").fetchone()[0] == 5
+
+    bad_rows = iter([("ok",), ("too", "many")])
+    with pytest.raises(AdapterExecutionError):
+        adapter.executemany("INSERT INTO item (name) VALUES (?)", bad_rows)
+    assert adapter.execute("SELECT COUNT(*) FROM item").fetchone()[0] == 5
+    adapter.close()
+
+
+def test_executemany_mismatched_row_writes_nothing_in_open_transaction(tmp_path):
+    adapter = SQLiteAdapter()
+    adapter.connect(ConnectionConfig(url=f"sqlite:///{tmp_path / 'partial.db'}"))
+    adapter.execute("CREATE TABLE t (x INTEGER)")
+    adapter.begin()
+    with pytest.raises(AdapterExecutionError):
+        adapter.executemany("INSERT INTO t (x) VALUES (?)", [(1,), (2,), (3, 4)])
+    assert adapter.execute("SELECT count(*) FROM t").fetchone()[0] == 0
+    adapter.close()
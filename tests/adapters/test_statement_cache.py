@@ -0,0 +1,49 @@
+import pytest
+
+from blazeorm.adapters import AdapterExecutionError, ConnectionConfig, SQLiteAdapter, StatementCache
+
+
+def test_statement_cache_counts_once_per_sql():
+    calls: list[str] = []
+
+    def count(sql: str) -> int:
+        calls.append(sql)
+        return sql.count("?")
+
+    cache = StatementCache(max_size=4)
+    assert cache.placeholder_count("SELECT ?", count) == 1
+    assert cache.placeholder_count("SELECT ?", count) == 1
+    assert calls == ["SELECT ?"]
+    assert "SELECT ?" in cache
+
+
+def test_statement_cache_evicts_least_recently_used():
+    cache = StatementCache(max_size=2)
+    count = len
+    cache.placeholder_count("a", count)
+    cache.placeholder_count("bb", count)
+    cache.placeholder_count("a", count)
+    cache.placeholder_count("ccc", count)
+    assert "a" in cache
+    assert "bb" not in cache
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_statement_cache_size_zero_disables_caching():
+    cache = StatementCache(max_size=0)
+    assert cache.placeholder_count("SELECT ?", lambda sql: 1) == 1
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        StatementCache(max_size=-1)
+
+
+def test_adapter_validation_uses_statement_cache():
+    adapter = SQLiteAdapter(statement_cache_size=8)
+    adapter.connect(ConnectionConfig(url="sqlite:///:memory:"))
+    adapter.execute("SELECT ?", (1,))
+    assert "SELECT ?" in adapter._statements
+    with pytest.raises(AdapterExecutionError):
+        adapter.execute("SELECT ?", (1, 2))
+    adapter.close()
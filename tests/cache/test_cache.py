@@ -1,3 +1,5 @@
+import pytest
+
 from blazeorm.adapters import ConnectionConfig, SQLiteAdapter
 from blazeorm.cache import InMemoryCache
 from blazeorm.core import IntegerField, Model, StringField
@@ -67,3 +69,53 @@ def test_cache_invalidation_on_delete(tmp_path):
     session2 = Session(CountingAdapter(), connection_config=config, cache_backend=cache)
     assert session2.get(User, id=user.id) is None
     session2.close()
+
+
+def test_in_memory_cache_shards_entries_and_clears_all():
+    cache = InMemoryCache(shards=4)
+    for pk in range(32):
+        cache.set(User, pk, {"id": pk})
+    assert sum(1 for shard in cache._shards if shard) > 1
+    assert cache.get(User, 7) == {"id": 7}
+    cache.delete(User, 7)
+    assert cache.get(User, 7) is None
+    cache.clear()
+    assert all(not shard for shard in cache._shards)
+
+
+def test_in_memory_cache_requires_power_of_two_shards():
+    with pytest.raises(ValueError):
+        InMemoryCache(shards=3)
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(shards=1, max_size=2)
+    cache.set(User, 1, {"id": 1})
+    cache.set(User, 2, {"id": 2})
+    assert cache.get(User, 1) == {"id": 1}  # refresh 1 so 2 becomes the eviction candidate
+    cache.set(User, 3, {"id": 3})
+    assert cache.get(User, 2) is None
+    assert cache.get(User, 1) == {"id": 1}
+    assert cache.get(User, 3) == {"id": 3}
+
+
+def test_in_memory_cache_expires_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("blazeorm.cache.backends.time.monotonic", lambda: now[0])
+    cache = InMemoryCache(ttl=5)
+    cache.set(User, 1, {"id": 1})
+    now[0] = 104.0
+    assert cache.get(User, 1) == {"id": 1}
+    now[0] = 105.0
+    assert cache.get(User, 1) is None
+    assert all(not shard for shard in cache._shards)
+
+
+def test_in_memory_cache_stores_payload_without_copying():
+    cache = InMemoryCache()
+    payload = {"id": 1, "name": "Ada"}
+    cache.set(User, 1, payload)
+    cached = cache.get(User, 1)
+    assert cached == payload
+    with pytest.raises(TypeError):
+        cached["name"] = "Grace"  # type: ignore[index]
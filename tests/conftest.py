@@ -0,0 +1,20 @@
+import pytest
+
+from blazeorm.persistence import Session
+
+
+@pytest.fixture
+def executed_sql(monkeypatch):
+    """
+    Record the SQL of every ``Session.execute`` call; clear the list to start measuring.
+    """
+
+    executed: list[str] = []
+    original = Session.execute
+
+    def recording_execute(self, sql, params=None):
+        executed.append(sql)
+        return original(self, sql, params)
+
+    monkeypatch.setattr(Session, "execute", recording_execute)
+    return executed
@@ -1,8 +1,11 @@
+import sys
+
 import pytest
 
 from blazeorm.core import (
     BooleanField,
     DateTimeField,
+    FloatField,
     IntegerField,
     Model,
     ModelConfigurationError,
@@ -89,3 +92,242 @@ def test_manual_id_field_without_primary_key_errors():
 
         class BadIdentifier(Model):
             id = IntegerField()
+
+
+def test_from_db_builds_clean_instance_without_init():
+    class Account(Model):
+        handle = StringField(db_column="user_handle", nullable=False)
+        is_active = BooleanField(default=True)
+
+    account = Account._from_db({"id": 3, "user_handle": "ada", "is_active": 0})
+    assert account.pk == 3
+    assert account.handle == "ada"
+    assert account.is_active is False
+    assert account._related_cache == {}
+    assert not account.is_dirty()
+
+
+def test_model_state_is_stored_in_slots():
+    user = User(name="Alice")
+    assert "_field_values" not in user.__dict__
+    assert user.__dict__ == {}
+    user.nickname = "ally"
+    assert user.__dict__ == {"nickname": "ally"}
+
+
+def test_model_classes_get_generated_init():
+    assert User.__init__ is not Model.__init__
+    user = User(name="Bob", age=41)
+    assert user._field_values == {"name": "Bob", "age": 41, "is_active": True}
+    assert user._initial_state is None
+
+    class Custom(Model):
+        label = StringField()
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.extra = True
+
+    custom = Custom(label="x")
+    assert custom.label == "x"
+    assert custom.extra is True
+
+
+def test_descriptor_distinguishes_stored_none_from_missing():
+    class Note(Model):
+        body = StringField(default="empty")
+
+    note = Note._from_db({"id": 1, "body": None})
+    assert note.body is None
+
+    fresh = Note._from_db({"id": 2})
+    assert fresh.body == "empty"
+    assert "body" not in fresh._field_values
+
+
+def test_fields_use_slots():
+    for field_obj in User._meta.get_fields():
+        assert not hasattr(field_obj, "__dict__")
+
+
+def test_generated_init_handles_constant_and_callable_defaults():
+    counter = iter(range(100))
+
+    class Ticket(Model):
+        priority = IntegerField(default="3")
+        sequence = IntegerField(default=lambda: next(counter))
+        status = StringField(choices=("open",), default="closed")
+
+    first = Ticket(status="open")
+    assert first.priority == 3
+    assert first.sequence == 0
+    assert Ticket(status="open").sequence == 1
+    with pytest.raises(ValueError):
+        Ticket()
+
+
+def test_generated_to_dict_matches_descriptor_values():
+    user = User(name="Alice")
+    del user._field_values["age"]
+    assert User.to_dict is not Model.to_dict
+    assert user.to_dict() == {"id": None, "name": "Alice", "age": 0, "is_active": True}
+
+
+def test_dirty_tracking_follows_assignments():
+    user = User(name="Alice")
+    assert not user.is_dirty()
+    user.age = 5
+    assert user.is_dirty()
+    user.age = 0
+    assert not user.is_dirty()
+
+    loaded = User._from_db({"id": 1, "name": "Bob"})
+    assert loaded.is_dirty() is False
+    assert loaded.age == 0
+    assert not loaded.is_dirty()
+    loaded.name = "Robert"
+    assert loaded.is_dirty()
+    loaded._mark_clean()
+    assert not loaded.is_dirty()
+
+
+def test_meta_exposes_frozen_field_order():
+    assert User._meta.field_names == ("id", "name", "age", "is_active")
+    assert User._meta.get_fields() == tuple(User._meta.fields.values())
+    assert type(User._meta.fields) is dict
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [("true", True), ("T", True), ("1", True), ("False", False), ("fAlSe", False), ("0", False)],
+)
+def test_boolean_field_parses_strings(raw, expected):
+    assert BooleanField().to_python(raw) is expected
+
+
+def test_boolean_field_rejects_unknown_strings():
+    with pytest.raises(ValueError):
+        BooleanField().to_python("maybe")
+
+
+def test_to_python_many_coerces_columns():
+    assert IntegerField().to_python_many([1, "2", 3.0]) == [1, 2, 3]
+    assert IntegerField().to_python_many([1, None, "4"]) == [1, None, 4]
+    assert FloatField().to_python_many(["1.5", None]) == [1.5, None]
+    assert StringField().to_python_many(["a", None, 3]) == ["a", None, "3"]
+    with pytest.raises(ValueError, match="Invalid integer value"):
+        IntegerField().to_python_many([1, "x"])
+
+
+def test_field_clone_and_deconstruct_copy_constructor_arguments():
+    original = StringField(max_length=20, nullable=False, help_text="title", validators=[len])
+    cloned = original.clone()
+    assert type(cloned) is StringField
+    assert (cloned.max_length, cloned.nullable, cloned.help_text) == (20, False, "title")
+    assert cloned.validators == (len,)
+
+    stamp = DateTimeField(auto_now_add=True).clone()
+    assert stamp.auto_now_add is True and stamp.auto_now is False
+
+    deconstructed = User._meta.get_field("age").deconstruct()
+    assert deconstructed["name"] == "age"
+    assert deconstructed["default"] == 0
+    assert deconstructed["db_type"] == "INTEGER"
+
+
+def test_computed_defaults_are_stored_on_first_read():
+    class Stamp(Model):
+        created_at = DateTimeField(auto_now_add=True)
+
+    stamp = Stamp._from_db({"id": 1})
+    first = stamp.created_at
+    assert stamp.created_at is first
+    assert stamp._field_values["created_at"] is first
+
+
+def test_initial_state_snapshot_is_taken_on_first_change():
+    user = User(name="Alice")
+    user.name = "Alice"
+    assert user._initial_state is None
+    user.age = 7
+    assert user._initial_state == {"name": "Alice", "age": 0, "is_active": True}
+    assert user.is_dirty()
+
+
+def test_from_db_trusts_stored_values():
+    class Slug(Model):
+        text = StringField(max_length=3)
+        flag = BooleanField()
+
+    slug = Slug._from_db({"id": "7", "text": "longer", "flag": 1})
+    assert slug.pk == 7
+    assert slug.text == "longer"
+    assert slug.flag is True
+
+
+def test_generated_repr_lists_stored_fields():
+    assert User.__repr__ is not Model.__repr__
+    assert repr(User(name="Ann")) == "<User name='Ann', age=0, is_active=True>"
+    assert repr(User._from_db({"id": 4})) == "<User id=4>"
+
+
+def test_validators_are_immutable_tuples():
+    field_obj = IntegerField()
+    assert field_obj.validators == ()
+    field_obj.add_validator(abs)
+    assert field_obj.validators == (abs,)
+    assert IntegerField().validators == ()
+
+
+def test_meta_column_mappings_are_read_only():
+    class Renamed(Model):
+        title = StringField(db_column="post_title")
+
+    meta = Renamed._meta
+    assert dict(meta.columns) == {"id": "id", "title": "post_title"}
+    assert meta.column_to_field["post_title"] == "title"
+    assert meta.column_names == ("id", "post_title")
+    with pytest.raises(TypeError):
+        meta.columns["title"] = "other"  # type: ignore[index]
+
+
+def test_bound_field_names_and_columns_are_interned():
+    column = "".join(["ticket", "_ref"])
+
+    class Ticket(Model):
+        ref = StringField(db_column=column)
+
+    field = Ticket._meta.get_field("ref")
+    assert field.db_column is sys.intern("ticket_ref")
+    assert field.name is sys.intern("ref")
+
+
+def test_custom_init_still_provides_related_cache():
+    class Profile(Model):
+        nickname = StringField()
+
+        def __init__(self, **kwargs):
+            kwargs.setdefault("nickname", "anon")
+            super().__init__(**kwargs)
+
+    profile = Profile()
+    assert profile.nickname == "anon"
+    assert profile._related_cache == {}
+
+
+def test_required_only_tracks_validators_and_clean_overrides():
+    class PlainRecord(Model):
+        title = StringField(nullable=False)
+        note = StringField(nullable=True)
+
+    class CleanedRecord(Model):
+        title = StringField(nullable=False)
+
+        def clean(self):
+            return None
+
+    assert PlainRecord._meta.required_only == ("title",)
+    assert CleanedRecord._meta.required_only is None
+
+    PlainRecord._meta.get_field("note").add_validator(lambda value: None)
+    assert PlainRecord._meta.required_only is None
@@ -1,3 +1,4 @@
+from blazeorm.core import ManyToManyField, Model, StringField
 from blazeorm.dialects import MySQLDialect
 
 
@@ -17,3 +18,30 @@ def test_mysql_limit_clause():
 def test_mysql_placeholder():
     dialect = MySQLDialect()
     assert dialect.parameter_placeholder() == "%s"
+    assert dialect.PARAM == "%s"
+
+
+def test_mysql_insert_ignore():
+    dialect = MySQLDialect()
+    assert dialect.insert_verb() == "INSERT INTO"
+    assert dialect.insert_ignore_clause("`group_id`") == (
+        " ON DUPLICATE KEY UPDATE `group_id` = `group_id`"
+    )
+
+
+class MySQLMember(Model):
+    name = StringField()
+
+
+class MySQLTeam(Model):
+    name = StringField()
+    members = ManyToManyField(MySQLMember, related_name="teams")
+
+
+def test_mysql_many_to_many_add_ignores_only_duplicate_keys():
+    statements = MySQLTeam(id=1, name="Core").members._statements(MySQLDialect())
+    sql = statements.insert_prefix + statements.insert_row + statements.insert_suffix
+    assert sql == (
+        "INSERT INTO `my_sql_team_my_sql_member` (`my_sql_team_id`, `my_sql_member_id`) "
+        "VALUES (%s, %s) ON DUPLICATE KEY UPDATE `my_sql_team_id` = `my_sql_team_id`"
+    )
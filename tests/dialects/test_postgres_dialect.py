@@ -17,3 +17,10 @@ def test_postgres_dialect_limit_clause():
 def test_postgres_dialect_placeholder():
     dialect = PostgresDialect()
     assert dialect.parameter_placeholder() == "%s"
+    assert dialect.PARAM == "%s"
+
+
+def test_postgres_insert_ignore():
+    dialect = PostgresDialect()
+    assert dialect.insert_verb() == "INSERT INTO"
+    assert dialect.insert_ignore_clause('"group_id"') == " ON CONFLICT DO NOTHING"
@@ -18,3 +18,15 @@ def test_sqlite_column_definition():
     dialect = SQLiteDialect()
     rendered = dialect.render_column_definition("name", "TEXT", nullable=False)
     assert rendered == '"name" TEXT NOT NULL'
+
+
+def test_sqlite_param_constant_and_cached_quoting():
+    dialect = SQLiteDialect()
+    assert dialect.PARAM == "?" == dialect.parameter_placeholder()
+    assert dialect.quote_identifier("email") is SQLiteDialect().quote_identifier("email")
+
+
+def test_sqlite_limit_clause_is_memoized():
+    dialect = SQLiteDialect()
+    assert dialect.limit_clause(20, 40) is SQLiteDialect().limit_clause(20, 40)
+    assert dialect.limit_clause(None, None) == ""
@@ -2,7 +2,7 @@ import pytest
 
 from blazeorm.adapters import ConnectionConfig, SQLiteAdapter
 from blazeorm.core import IntegerField, Model, StringField
-from blazeorm.hooks import hooks
+from blazeorm.hooks import HookDispatcher, hooks
 from blazeorm.persistence import Session
 
 
@@ -85,3 +85,18 @@ def test_model_specific_hook_on_delete(tmp_path):
 
     assert fired == [("before", "Bob"), ("after", "Bob")]
     session.close()
+
+
+def test_handlers_registered_after_fire_are_picked_up():
+    dispatcher = HookDispatcher()
+    calls = []
+    dispatcher.register("before_save", lambda inst, **ctx: calls.append("global"))
+    sample = Sample(name="Cached", age=1)
+
+    dispatcher.fire("before_save", sample)
+    dispatcher.register("before_save", lambda inst, **ctx: calls.append("model"), model=Sample)
+    dispatcher.fire("before_save", sample)
+    dispatcher.clear()
+    dispatcher.fire("before_save", sample)
+
+    assert calls == ["global", "global", "model"]
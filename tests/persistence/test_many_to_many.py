@@ -1,3 +1,5 @@
+import pytest
+
 from blazeorm.adapters import ConnectionConfig, SQLiteAdapter
 from blazeorm.core import ManyToManyField, Model, StringField
 from blazeorm.dialects import SQLiteDialect
@@ -109,3 +111,149 @@ def test_session_m2m_helpers_invalidate_cache(tmp_path):
         group.m2m_add("members", user, session=session)
         group.m2m_clear("members", session=session)
         assert group._related_cache.get("members") == []
+
+
+def test_session_works_with_plain_tuple_rows(tmp_path):
+    adapter = SQLiteAdapter(row_factory=None)
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'tuples.db'}")
+    session = Session(adapter, connection_config=config)
+    create_tables(session)
+
+    user = User(name="Alice")
+    group = Group(name="Admins")
+    with session.transaction():
+        session.add(user)
+        session.add(group)
+    row = session.execute('SELECT name FROM "user"').fetchone()
+    assert type(row) is tuple
+
+    with session:
+        group.members.add(user)
+        assert [member.name for member in group.members] == ["Alice"]
+        users = list(User.objects.prefetch_related("groups"))
+        assert session.get(User, name="Alice") is user
+    assert users[0].groups[0].name == "Admins"
+
+
+def test_many_to_many_all_uses_single_join_query(tmp_path, executed_sql):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'join.db'}")
+    session = Session(adapter, connection_config=config)
+    create_tables(session)
+
+    users = [User(name="Alice"), User(name="Bob")]
+    group = Group(name="Admins")
+    with session.transaction():
+        session.bulk_save([*users, group])
+
+    with session:
+        group.members.add(*users)
+        executed_sql.clear()
+        members = group.members.all()
+        reverse = users[0].groups.all()
+
+    assert sorted(member.name for member in members) == ["Alice", "Bob"]
+    assert [g.name for g in reverse] == ["Admins"]
+    assert len(executed_sql) == 2
+    assert all("INNER JOIN" in sql for sql in executed_sql)
+
+
+def test_many_to_many_add_skips_existing_pairs_in_one_statement(tmp_path, executed_sql):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'add.db'}")
+    session = Session(adapter, connection_config=config)
+    create_tables(session)
+
+    users = [User(name="Alice"), User(name="Bob")]
+    group = Group(name="Admins")
+    with session.transaction():
+        session.bulk_save([*users, group])
+
+    with session:
+        group.members.add(users[0])
+        executed_sql.clear()
+        group.members.add(*users)
+        assert len(executed_sql) == 1
+        assert executed_sql[0].endswith("ON CONFLICT DO NOTHING")
+        assert sorted(member.name for member in group.members.all()) == ["Alice", "Bob"]
+
+
+def test_many_to_many_statements_cached_per_dialect(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'parts.db'}")
+    session = Session(adapter, connection_config=config)
+    create_tables(session)
+
+    user = User(name="Alice")
+    group = Group(name="Admins")
+    with session.transaction():
+        session.bulk_save([user, group])
+
+    field = Group._meta.many_to_many[0]
+    field._m2m_sql_cache.clear()
+    with session:
+        group.members.add(user)
+        statements = field._m2m_sql_cache[(SQLiteDialect, False)]
+        list(group.members)
+        group.members.remove(user)
+        group.members.clear()
+    assert list(field._m2m_sql_cache) == [(SQLiteDialect, False)]
+    assert field._m2m_sql_cache[(SQLiteDialect, False)] is statements
+    assert statements.through == '"group_user"'
+    assert statements.related_pk == '"id"'
+    assert statements.insert_prefix == 'INSERT INTO "group_user" ("group_id", "user_id") VALUES '
+    assert statements.delete_sql == 'DELETE FROM "group_user" WHERE "group_id" = ?'
+    assert statements.remove_prefix.endswith('AND "user_id" IN (')
+
+
+def test_prefetched_many_to_many_still_supports_mutation(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'prefetched_add.db'}")
+    session = Session(adapter, connection_config=config)
+    create_tables(session)
+
+    users = [User(name="Alice"), User(name="Bob")]
+    group = Group(name="Admins")
+    with session.transaction():
+        session.bulk_save([*users, group])
+
+    with session:
+        group.members.add(users[0])
+        loaded = list(Group.objects.prefetch_related("members"))[0]
+        manager = loaded.members
+        assert loaded.members is manager
+        assert [member.name for member in manager] == ["Alice"]
+        assert len(manager) == 1 and manager[0].name == "Alice"
+        manager.add(users[1])
+        assert sorted(member.name for member in loaded.members) == ["Alice", "Bob"]
+
+
+def test_normalize_targets_accepts_instances_and_raw_keys():
+    group = Group(id=1, name="Admins")
+    manager = group.members
+    assert manager._normalize_targets([User(id=2, name="A"), User(id=3, name="B")]) == [2, 3]
+    assert manager._normalize_targets([User(id=2, name="A"), 5]) == [2, 5]
+    with pytest.raises(ValueError):
+        manager._normalize_targets([User(name="Unsaved")])
+
+
+def test_remove_trims_loaded_rows_without_refetch(tmp_path, executed_sql):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'remove_cache.db'}")
+    session = Session(adapter, connection_config=config)
+    create_tables(session)
+
+    users = [User(name="Alice"), User(name="Bob")]
+    group = Group(name="Admins")
+    with session.transaction():
+        session.bulk_save([*users, group])
+
+    with session:
+        group.members.add(*users)
+        assert len(group.members) == 2
+        executed_sql.clear()
+        group.members.remove(users[0])
+        assert [member.name for member in group.members] == ["Bob"]
+        assert len(executed_sql) == 1 and executed_sql[0].startswith("DELETE")
+        group._related_cache.clear()
+        assert [member.name for member in group.members] == ["Bob"]
@@ -1,8 +1,10 @@
+import asyncio
+
 import pytest
 
 from blazeorm.adapters import ConnectionConfig, SQLiteAdapter
 from blazeorm.core import IntegerField, Model, StringField
-from blazeorm.persistence import Session
+from blazeorm.persistence import Session, enable_thread_local_sessions
 from blazeorm.validation import ValidationError
 
 
@@ -46,9 +48,11 @@ def test_session_identity_map_returns_same_instance(tmp_path):
 
     # Fetch twice should return same instance due to identity map
     first = session.get(User, id=1)
+    session.reset_query_stats()
     second = session.get(User, id=1)
     assert first is second
     assert first.name == "Bob"
+    assert session.query_stats() == []
     session.close()
 
 
@@ -97,6 +101,61 @@ def test_session_updates_dirty_instances(tmp_path):
     session.close()
 
 
+def test_session_materialized_rows_snapshot_lazily(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'snapshot.db'}")
+    session = Session(adapter, connection_config=config)
+    create_table(session)
+    session.begin()
+    user = User(name="Dana", age=22)
+    session.add(user)
+    session.commit()
+
+    session.identity_map.clear()
+    loaded = session.get(User, id=user.id)
+    # Loaded rows carry no snapshot until a field actually changes.
+    assert loaded._initial_state is None
+    loaded.age = 23
+    assert loaded._initial_state == {"id": user.id, "name": "Dana", "age": 22}
+    with session.transaction():
+        pass
+
+    updated_age = session.execute('SELECT age FROM "user" WHERE id = ?', (user.id,)).fetchone()[0]
+    assert updated_age == 23
+    assert loaded._initial_state is None
+    session.close()
+
+
+def test_session_update_writes_only_changed_columns(tmp_path, executed_sql):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'partial.db'}")
+    session = Session(adapter, connection_config=config)
+    create_table(session)
+    with session.transaction():
+        session.add(User(name="Finn", age=50))
+
+    loaded = session.get(User, id=1)
+    executed_sql.clear()
+
+    # A value set back to its loaded state leaves nothing to write.
+    loaded.name = "Gwen"
+    loaded.name = "Finn"
+    session.mark_dirty(loaded)
+    with session.transaction():
+        pass
+    assert not any(sql.startswith("UPDATE") for sql in executed_sql)
+
+    loaded.age = 51
+    session.mark_dirty(loaded)
+    with session.transaction():
+        pass
+    updates = [sql for sql in executed_sql if sql.startswith("UPDATE")]
+    assert len(updates) == 1
+    assert '"age"' in updates[0]
+    assert '"name"' not in updates[0]
+    session.close()
+
+
 def test_session_transaction_context(tmp_path):
     adapter = SQLiteAdapter()
     config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'context.db'}")
@@ -171,3 +230,257 @@ def test_session_slow_query_ms_override(tmp_path, monkeypatch):
     session = Session(adapter, connection_config=config, slow_query_ms=125)
     assert session.slow_query_ms == 125
     session.close()
+
+
+def test_session_reuses_cached_sql_templates(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'templates.db'}")
+    session = Session(adapter, connection_config=config)
+    create_table(session)
+    User._meta.sql_cache.clear()
+
+    with session.transaction():
+        session.add(User(name="Alice", age=30))
+        session.add(User(name="Bob", age=31))
+    insert_keys = [key for key in User._meta.sql_cache if key[1] == "insert"]
+    assert len(insert_keys) == 1
+
+    first = session.get(User, name="Alice")
+    select_key = (type(session.dialect), "select", "name")
+    template = User._meta.sql_cache[select_key]
+    session.get(User, name="Bob")
+    assert User._meta.sql_cache[select_key] is template
+    assert first is not None and first.age == 30
+
+    second = session.get(User, name="Bob")
+    for instance, age in ((first, 40), (second, 41)):
+        instance.age = age
+        session.mark_dirty(instance)
+        with session.transaction():
+            pass
+    update_key = (type(session.dialect), "update", ("age",))
+    assert User._meta.sql_cache[update_key] == 'UPDATE "user" SET "age" = ? WHERE "id" = ?'
+
+    with session.transaction():
+        session.delete(first)
+    assert (type(session.dialect), "delete_in") in User._meta.sql_cache
+    session.close()
+
+
+def test_session_bulk_save_batches_rows_with_assigned_keys(tmp_path, monkeypatch):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'bulk.db'}")
+    session = Session(adapter, connection_config=config)
+    create_table(session)
+
+    batches: list[tuple[str, int]] = []
+    original_executemany = adapter.executemany
+
+    def spying_executemany(sql, seq_of_params):
+        rows = list(seq_of_params)
+        batches.append((sql, len(rows)))
+        return original_executemany(sql, rows)
+
+    monkeypatch.setattr(adapter, "executemany", spying_executemany)
+
+    explicit = [User(id=10 + idx, name=f"user-{idx}", age=idx) for idx in range(3)]
+    generated = User(name="generated", age=99)
+    session.bulk_save([*explicit, generated])
+
+    assert len(batches) == 1
+    sql, row_count = batches[0]
+    assert sql.startswith('INSERT INTO "user"') and '"id"' in sql
+    assert row_count == 3
+    assert generated.id is not None
+    assert session.identity_map.get(User, 11) is explicit[1]
+    assert not explicit[0].is_dirty()
+    count = session.execute('SELECT COUNT(*) FROM "user"').fetchone()[0]
+    assert count == 4
+    session.close()
+
+
+def test_session_flush_batches_inserts_and_deletes(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'flush.db'}")
+    session = Session(adapter, connection_config=config)
+    create_table(session)
+
+    users = [User(id=20 + idx, name=f"flush-{idx}", age=idx) for idx in range(4)]
+    with session.transaction():
+        for user in users:
+            session.add(user)
+    inserts = [stat for stat in session.query_stats() if stat["sql"].startswith("INSERT")]
+    assert [stat["count"] for stat in inserts] == [1]
+    assert session.identity_map.get(User, 22) is users[2]
+
+    session.reset_query_stats()
+    with session.transaction():
+        for user in users[:3]:
+            session.delete(user)
+    deletes = [stat["sql"] for stat in session.query_stats() if stat["sql"].startswith("DELETE")]
+    assert deletes == ['DELETE FROM "user" WHERE "id" IN (?, ?, ?)']
+    assert session.identity_map.get(User, 20) is None
+    remaining = session.execute('SELECT id FROM "user"').fetchall()
+    assert [row["id"] for row in remaining] == [23]
+    session.close()
+
+
+def test_session_get_many_uses_identity_map_and_chunks(tmp_path):
+    from dataclasses import replace
+
+    from blazeorm.dialects import SQLiteDialect
+
+    class TinyDialect(SQLiteDialect):
+        capabilities = replace(SQLiteDialect.capabilities, max_parameters=2)
+
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'many.db'}")
+    session = Session(adapter, connection_config=config)
+    session.dialect = TinyDialect()
+    create_table(session)
+    with session.transaction():
+        for idx in range(5):
+            session.execute('INSERT INTO "user" (name, age) VALUES (?, ?)', (f"u{idx}", idx))
+
+    first = session.get(User, id=1)
+    session.reset_query_stats()
+    loaded = session.get_many(User, [1, 2, 3, 4, 99, 2])
+    assert list(loaded) == [1, 2, 3, 4]
+    assert loaded[1] is first
+    stats = session.query_stats()
+    assert len(stats) == 1 and stats[0]["count"] == 2
+    session.close()
+
+
+def test_session_context_binds_current_session(tmp_path):
+    def make(name):
+        config = ConnectionConfig(url=f"sqlite:///{tmp_path / name}")
+        return Session(SQLiteAdapter(), connection_config=config)
+
+    outer, inner = make("outer.db"), make("inner.db")
+    assert Session.current() is None
+    with outer:
+        with inner:
+            assert Session.current() is inner
+        assert Session.current() is outer
+    assert Session.current() is None
+
+    enable_thread_local_sessions()
+    try:
+        session = make("threaded.db")
+        with session:
+            assert Session.current() is session
+        assert Session.current() is None
+    finally:
+        enable_thread_local_sessions(False)
+
+
+def test_session_binding_isolates_asyncio_tasks(tmp_path):
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'tasks.db'}")
+    session = Session(SQLiteAdapter(), connection_config=config)
+
+    async def bound(entered, release):
+        with session:
+            entered.set()
+            await release.wait()
+            return Session.current()
+
+    async def unbound(entered, release):
+        await entered.wait()
+        try:
+            return Session.current()
+        finally:
+            release.set()
+
+    async def main():
+        entered, release = asyncio.Event(), asyncio.Event()
+        return await asyncio.gather(bound(entered, release), unbound(entered, release))
+
+    inside, outside = asyncio.run(main())
+    assert inside is session
+    assert outside is None
+
+
+def test_session_query_stats_can_be_disabled(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'untracked.db'}")
+    session = Session(adapter, connection_config=config, track_queries=False)
+    create_table(session)
+    with session.transaction():
+        session.add(User(name="Quiet", age=5))
+    assert session.query_stats() == []
+
+    session.enable_query_stats()
+    session.execute('SELECT name FROM "user" WHERE age = ?', (5,))
+    assert [stat["sql"] for stat in session.query_stats()] == [
+        'SELECT name FROM "user" WHERE age = ?'
+    ]
+    session.disable_query_stats()
+    session.execute('SELECT COUNT(*) FROM "user"')
+    assert len(session.query_stats()) == 1
+    session.close()
+
+
+def test_session_state_lives_in_slots(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'slots.db'}")
+    session = Session(adapter, connection_config=config)
+    assert session.__dict__ == {}
+    assert not hasattr(session.identity_map, "__dict__")
+    session.close()
+
+
+def test_session_rows_to_dicts_reads_description_once():
+    class TupleCursor:
+        description = (("id", None), ("name", None))
+
+    rows = [(1, "a"), (2, "b")]
+    assert Session._rows_to_dicts(TupleCursor(), rows) == [
+        {"id": 1, "name": "a"},
+        {"id": 2, "name": "b"},
+    ]
+    assert Session._rows_to_dicts(TupleCursor(), []) == []
+
+
+def test_session_logs_slow_statements_with_redacted_params(tmp_path, caplog):
+    import logging
+
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'slow.db'}")
+    session = Session(adapter, connection_config=config, slow_query_ms=0)
+    caplog.set_level(logging.WARNING, logger=session.logger.name)
+    session.execute("SELECT ?", ["password=hunter2"])
+
+    record = next(r for r in caplog.records if "session.execute took" in r.message)
+    assert record.levelno == logging.WARNING
+    assert record.sql == "SELECT ?"
+    assert record.params == ["***"]
+    session.close()
+
+
+def test_session_flush_only_checks_instances_changed_since_last_flush(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'touched.db'}")
+    session = Session(adapter, connection_config=config)
+    create_table(session)
+    with session.transaction():
+        for idx in range(3):
+            session.execute('INSERT INTO "user" (name, age) VALUES (?, ?)', (f"t{idx}", idx))
+    loaded = session.get_many(User, [1, 2, 3])
+
+    loaded[2].age = 20
+    assert session.unit_of_work._touched == {loaded[2]}
+    with session.transaction():
+        pass
+    assert session.unit_of_work._touched == set()
+    ages = session.execute('SELECT age FROM "user" ORDER BY id').fetchall()
+    assert [row["age"] for row in ages] == [0, 20, 2]
+
+    session.delete(loaded[3])
+    with session.transaction():
+        pass
+    loaded[3].age = 30
+    with session.transaction():
+        pass
+    assert session.execute('SELECT COUNT(*) FROM "user"').fetchone()[0] == 2
+    session.close()
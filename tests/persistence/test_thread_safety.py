@@ -34,6 +34,23 @@ def test_identity_map_thread_safety():
     assert errors == []
 
 
+def test_identity_map_keys_instances_per_model():
+    class OtherThreadUser(Model):
+        id = IntegerField(primary_key=True)
+
+    identity_map = IdentityMap()
+    first, other = ThreadUser(id=1), OtherThreadUser(id=1)
+    identity_map.add(first)
+    identity_map.add(other)
+
+    assert identity_map.get(ThreadUser, 1) is first
+    assert identity_map.get(OtherThreadUser, 1) is other
+    assert identity_map.get(ThreadUser, 2) is None
+    identity_map.remove(first)
+    assert first not in identity_map and other in identity_map
+    assert identity_map.values() == [other]
+
+
 def test_session_query_stats_thread_safety(tmp_path):
     adapter = SQLiteAdapter()
     config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'threadsafe.db'}")
@@ -58,3 +75,21 @@ def test_session_query_stats_thread_safety(tmp_path):
 
     session.close()
     assert errors == []
+
+
+def test_query_stats_do_not_wait_for_the_session_lock(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'stats_lock.db'}")
+    session = Session(adapter, connection_config=config)
+    session.execute("SELECT 1")
+    results: list[list[dict[str, object]]] = []
+
+    # Holding the session lock stands in for a slow in-flight query.
+    with session._lock:
+        reader = threading.Thread(target=lambda: results.append(session.query_stats()))
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+    assert [stat["sql"] for stat in results[0]] == ["SELECT 1"]
+    session.close()
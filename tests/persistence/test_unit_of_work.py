@@ -0,0 +1,41 @@
+from blazeorm.core import IntegerField, Model
+from blazeorm.persistence import UnitOfWork
+
+
+class JournalItem(Model):
+    id = IntegerField(primary_key=True)
+
+
+def test_unit_of_work_rolls_back_to_nested_savepoints():
+    uow = UnitOfWork()
+    kept, outer, inner = JournalItem(id=1), JournalItem(id=2), JournalItem(id=3)
+    uow.register_new(kept)
+
+    uow.savepoint()
+    uow.register_new(outer)
+    uow.savepoint()
+    uow.register_new(inner)
+    uow.register_deleted(kept)
+    uow.discard_new(outer)
+    uow.rollback_savepoint()
+
+    assert uow.new == {kept, outer}
+    assert uow.deleted == set()
+
+    uow.release_savepoint()
+    assert uow._undo_log == []
+    assert uow.new == {kept, outer}
+
+    uow.rollback_savepoint()
+    assert uow.new == set()
+
+
+def test_unit_of_work_rollback_keeps_dropped_dirty_instances_as_candidates():
+    uow = UnitOfWork()
+    changed = JournalItem(id=4)
+    uow.savepoint()
+    uow.register_dirty(changed)
+    uow.rollback_savepoint()
+
+    assert uow.dirty == set()
+    assert uow.take_touched() == {changed}
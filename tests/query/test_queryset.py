@@ -21,6 +21,15 @@ def test_queryset_to_sql_simple_filter():
     assert params == ["Alice"]
 
 
+def test_compiled_table_and_columns_are_cached_per_dialect():
+    from blazeorm.dialects import SQLiteDialect
+
+    User.objects.filter(name="Alice").to_sql()
+    cache = User._meta.sql_cache
+    assert cache[(SQLiteDialect, "table")] == '"user"'
+    assert cache[(SQLiteDialect, "select_columns")] == '"user"."id", "user"."name", "user"."age"'
+
+
 def test_queryset_ordering_and_limit():
     qs = User.objects.filter(age__gte=18).order_by("-age").limit(5)
     sql, params = qs.to_sql()
@@ -74,3 +83,11 @@ def test_select_related_generates_join():
 def test_prefetch_related_records_fields():
     qs = User.objects.prefetch_related("posts", "articles")
     assert qs._prefetch_related == ("posts", "articles")
+
+
+def test_select_related_qualifies_base_columns():
+    qs = Post.objects.select_related("author").filter(title="Hello").order_by("-id")
+    sql, params = qs.to_sql()
+    assert 'WHERE "post"."title" = ?' in sql
+    assert 'ORDER BY "post"."id" DESC' in sql
+    assert params == ["Hello"]
@@ -1,5 +1,6 @@
 from blazeorm.adapters import ConnectionConfig, SQLiteAdapter
 from blazeorm.core import ForeignKey, IntegerField, ManyToManyField, Model, StringField
+from blazeorm.core.relations import RelatedManager
 from blazeorm.dialects import SQLiteDialect
 from blazeorm.persistence import Session
 from blazeorm.schema import MigrationEngine, MigrationOperation, SchemaBuilder
@@ -107,6 +108,21 @@ def test_select_related_attaches_related_instance(tmp_path):
     assert posts[0].author.name == "Alice"
 
 
+def test_select_related_decodes_plain_tuple_rows(tmp_path):
+    adapter = SQLiteAdapter(row_factory=None)
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'tuple_rows.db'}")
+    session = Session(adapter, connection_config=config)
+    create_author_post_tables(session)
+    session.execute('INSERT INTO "author" (name) VALUES (?)', ("Gus",))
+    session.execute('INSERT INTO "post" (title, author) VALUES (?, ?)', ("Hi", 1))
+    session.execute('INSERT INTO "post" (title, author) VALUES (?, ?)', ("Again", 1))
+    with session:
+        posts = list(session.query(Post).select_related("author").order_by("id"))
+    assert [post.title for post in posts] == ["Hi", "Again"]
+    assert posts[0].author is posts[1].author
+    assert posts[0].author.name == "Gus"
+
+
 def test_prefetch_related_loads_reverse_relation(tmp_path):
     adapter = SQLiteAdapter()
     config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'prefetch.db'}")
@@ -122,6 +138,66 @@ def test_prefetch_related_loads_reverse_relation(tmp_path):
     assert authors[1].posts == []
 
 
+def test_related_manager_prefetch_uses_one_query(tmp_path, executed_sql):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'prefetch_reverse.db'}")
+    session = Session(adapter, connection_config=config)
+    create_author_post_tables(session)
+    for name in ("Ada", "Ben", "Cy"):
+        session.execute('INSERT INTO "author" (name) VALUES (?)', (name,))
+    for title, author_id in (("A", 1), ("B", 1), ("C", 2)):
+        session.execute('INSERT INTO "post" (title, author) VALUES (?, ?)', (title, author_id))
+    with session:
+        authors = list(session.query(Author).order_by("id"))
+        executed_sql.clear()
+        RelatedManager.prefetch(Post, Post._meta.get_field("author"), authors)
+        assert len(executed_sql) == 1
+        assert " IN (" in executed_sql[0]
+        assert [post.title for post in authors[0].posts] == ["A", "B"]
+        assert [post.title for post in authors[1].posts] == ["C"]
+        assert authors[2].posts == []
+        assert len(executed_sql) == 1
+
+
+def test_reverse_manager_iteration_runs_cached_direct_query(tmp_path, executed_sql):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'reverse_iter.db'}")
+    session = Session(adapter, connection_config=config)
+    create_author_post_tables(session)
+    session.execute('INSERT INTO "author" (name) VALUES (?)', ("Ida",))
+    for title in ("X", "Y"):
+        session.execute('INSERT INTO "post" (title, author) VALUES (?, ?)', (title, 1))
+    with session:
+        author = session.get(Author, id=1)
+        executed_sql.clear()
+        assert sorted(post.title for post in author.posts) == ["X", "Y"]
+        list(author.posts)
+    assert executed_sql[0] == executed_sql[1]
+    assert executed_sql[0].endswith('WHERE "author" = ?')
+    assert Post._meta.sql_cache[(SQLiteDialect, "reverse_fk", "author")] == executed_sql[0]
+
+
+def test_prefetch_forward_dedupes_and_uses_identity_map(tmp_path, executed_sql):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'prefetch_fk.db'}")
+    session = Session(adapter, connection_config=config)
+    create_author_post_tables(session)
+    session.execute('INSERT INTO "author" (name) VALUES (?)', ("Eve",))
+    session.execute('INSERT INTO "author" (name) VALUES (?)', ("Finn",))
+    for title, author_id in (("A", 1), ("B", 1), ("C", 2)):
+        session.execute('INSERT INTO "post" (title, author) VALUES (?, ?)', (title, author_id))
+    with session:
+        eve = session.get(Author, id=1)
+        executed_sql.clear()
+        posts = list(session.query(Post).prefetch_related("author").order_by("id"))
+    assert [post.author.name for post in posts] == ["Eve", "Eve", "Finn"]
+    assert posts[0].author is eve
+    # Eve is already in the identity map, so only Finn's key is fetched.
+    author_queries = [sql for sql in executed_sql if 'FROM "author"' in sql]
+    assert len(author_queries) == 1
+    assert author_queries[0].endswith("IN (?)")
+
+
 def test_nested_select_and_prefetch_with_m2m_and_fk(tmp_path):
     adapter = SQLiteAdapter()
     config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'nested.db'}")
@@ -159,3 +235,20 @@ def test_prefetch_with_empty_m2m_results(tmp_path):
         articles = list(session.query(Article).prefetch_related("categories"))
     assert articles
     assert articles[0].categories == []
+
+
+def test_values_list_returns_raw_tuples(tmp_path):
+    adapter = SQLiteAdapter()
+    config = ConnectionConfig(url=f"sqlite:///{tmp_path / 'values.db'}")
+    session = Session(adapter, connection_config=config)
+    create_user_table(session)
+    with session.transaction():
+        session.execute('INSERT INTO "user" (name, age) VALUES (?, ?)', ("Alice", 30))
+        session.execute('INSERT INTO "user" (name, age) VALUES (?, ?)', ("Bob", 25))
+
+    rows = session.query(User).order_by("id").values_list("name", "age")
+    assert rows == [("Alice", 30), ("Bob", 25)]
+    ages = session.query(User).filter(age__gt=20).values_list("age", flat=True)
+    assert sum(ages) == 55
+    assert list(session.identity_map.values()) == []
+    session.close()
@@ -1,4 +1,5 @@
 from blazeorm.core import ForeignKey, ManyToManyField, Model, StringField
+from blazeorm.core.relations import relation_registry
 
 
 class Author(Model):
@@ -59,3 +60,63 @@ def test_deferred_model_resolution():
     field = Comment._meta.get_field("post")
     assert field.remote_model is BlogPost
     assert hasattr(BlogPost, "comments")
+
+
+def test_foreign_key_returns_cached_instance_until_reassigned():
+    author = Author(id=3, name="Ada")
+    article = Article(title="Notes", author=author)
+    assert article.author is author
+    assert article._field_values["author"] == 3
+    article.author = 4
+    assert article.author == 4
+    assert "author" not in article._related_cache
+
+
+def test_dotted_string_reference_resolves_by_class_name():
+    class Reviewer(Model):
+        name = StringField()
+
+    class Review(Model):
+        reviewer = ForeignKey("library.Reviewer", related_name="reviews")
+
+    assert Review._meta.get_field("reviewer").remote_model is Reviewer
+
+
+def test_pending_references_are_bucketed_by_target_label():
+    class Ticket(Model):
+        queue = ForeignKey("TicketQueue", related_name="tickets")
+
+    field = Ticket._meta.get_field("queue")
+    assert relation_registry.pending_by_label["TicketQueue"] == [(Ticket, field)]
+
+    class TicketQueue(Model):
+        name = StringField()
+
+    assert "TicketQueue" not in relation_registry.pending_by_label
+    assert field.remote_model is TicketQueue
+    assert hasattr(TicketQueue, "tickets")
+
+
+def test_relation_helpers_use_slots():
+    author = Author(id=1, name="Ada")
+    tagged = TaggedArticle(id=2, title="Slots")
+    assert not hasattr(author.articles, "__dict__")
+    assert not hasattr(Author.articles, "__dict__")
+    assert not hasattr(tagged.tags, "__dict__")
+    assert not hasattr(TaggedArticle.tags, "__dict__")
+
+
+def test_reverse_accessor_returns_cached_children_without_manager():
+    author = Author(id=9, name="Cached")
+    assert author.articles.__class__.__name__ == "RelatedManager"
+    author._related_cache["articles"] = []
+    assert author.articles == []
+
+
+def test_db_converters_only_cover_related_fields():
+    converters = dict(zip(Article._meta.field_names, Article._meta.db_converters))
+    assert converters["title"] is None
+    author = Author(id=7, name="Conv")
+    assert converters["author"](author) == 7
+    assert converters["author"](7) == 7
+    assert converters["author"](None) is None
@@ -1,7 +1,7 @@
 import logging
 
 from blazeorm.core import ForeignKey, IntegerField, ManyToManyField, Model, StringField
-from blazeorm.dialects import SQLiteDialect
+from blazeorm.dialects import PostgresDialect, SQLiteDialect
 from blazeorm.schema import SchemaBuilder
 
 dialect = SQLiteDialect()
@@ -37,6 +37,16 @@ def test_create_table_sql():
     assert sql == expected
 
 
+def test_create_table_sql_is_cached_per_dialect():
+    first = builder.create_table_sql(User)
+    assert builder.create_table_sql(User) is first
+    assert SchemaBuilder(SQLiteDialect()).create_table_sql(User) is first
+
+    SchemaBuilder(PostgresDialect()).create_table_sql(User)
+    assert (SQLiteDialect, "create_table") in User._meta.sql_cache
+    assert (PostgresDialect, "create_table") in User._meta.sql_cache
+
+
 def test_drop_table_sql():
     sql = builder.drop_table_sql(User)
     assert sql == 'DROP TABLE IF EXISTS "user"'
@@ -71,6 +81,12 @@ def test_create_index_sql():
     assert sql == ['CREATE INDEX IF NOT EXISTS "idx_indexed_slug" ON "indexed" ("slug")']
 
 
+def test_foreign_keys_are_indexed_by_default():
+    assert Post._meta.get_field("author").index is True
+    sql = builder.create_index_sql(Post)
+    assert sql == ['CREATE INDEX IF NOT EXISTS "idx_post_author" ON "post" ("author")']
+
+
 def test_drop_index_sql_logs_warning(caplog):
     caplog.set_level(logging.WARNING, logger="blazeorm.schema.builder")
     sql = builder.drop_index_sql(Indexed)
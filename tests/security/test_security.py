@@ -9,7 +9,7 @@ from blazeorm.persistence import Session
 from blazeorm.schema import MigrationEngine, MigrationOperation
 from blazeorm.security.dsns import parse_dsn
 from blazeorm.security.migrations import confirm_destructive_operation
-from blazeorm.security.redaction import redact_params
+from blazeorm.security.redaction import is_sensitive_key, is_sensitive_value, redact_params
 
 
 def test_parse_dsn_and_redact():
@@ -107,3 +107,17 @@ def test_redact_params_masks_sensitive_values():
     assert redacted[2]["count"] == 1
     assert redacted[3][0] == "***"
     assert redacted[4] == "***"
+
+
+def test_redact_params_checks_every_value_not_positions():
+    assert redact_params([1, None, 2.5, True, "plain"]) == [1, None, 2.5, True, "plain"]
+    assert redact_params([1, None, 2.5, True, "my token"]) == [1, None, 2.5, True, "***"]
+
+
+def test_sensitive_matching_ignores_case_and_separators():
+    assert is_sensitive_key("X-API-Key")
+    assert is_sensitive_key("SSLRootCert")
+    assert not is_sensitive_key("username")
+    assert is_sensitive_value("Authorization: Basic abc")
+    assert is_sensitive_value("my PassWord")
+    assert not is_sensitive_value("hello world")
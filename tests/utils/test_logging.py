@@ -17,3 +17,24 @@ def test_time_call_logs_duration(caplog):
         pass
     messages = [record.message for record in caplog.records if record.name == logger.name]
     assert any("unit-test took" in message for message in messages)
+
+
+def test_time_call_defers_params_until_record_is_emitted(caplog):
+    logger = get_logger("tests.logging.lazy")
+    calls: list[int] = []
+
+    def params():
+        calls.append(1)
+        return ["***"]
+
+    caplog.set_level(logging.INFO, logger=logger.name)
+    with time_call("quiet", logger, params=params, threshold_ms=10_000):
+        pass
+    assert calls == []
+
+    caplog.set_level(logging.DEBUG, logger=logger.name)
+    with time_call("loud", logger, params=params, threshold_ms=10_000):
+        pass
+    assert calls == [1]
+    record = next(record for record in caplog.records if "loud took" in record.message)
+    assert record.params == ["***"]